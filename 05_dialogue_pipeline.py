@@ -4,6 +4,8 @@ This runner avoids polling/sleeps by wiring each stage to the EventBus.
 """
 from __future__ import annotations
 
+import asyncio
+import sys
 import threading
 import time
 from dataclasses import dataclass
@@ -16,9 +18,10 @@ except Exception:  # pragma: no cover
 
 from rich.live import Live
 
+from src.async_event_bus import AsyncEventBus
 from src.audio_ring_buffer import AudioRingBuffer
 from src.dialogue_brain.brain import DialogueBrain
-from src.event_bus import EventBus
+from src.event_bus import BLOCK, EventBus
 from src.worker.whisper_worker import WhisperWorker
 from ui.minimal_hud import HUDState, MinimalHUD
 
@@ -170,8 +173,18 @@ class HUDSubscriber:
             self._push()
 
 
-def run_pipeline():
-    event_bus = EventBus(max_queue_size=64)
+def run_pipeline(use_async_bus: bool = False):
+    loop = None
+    if use_async_bus:
+        # Stages run as tasks on one loop; WhisperWorker and this thread publish via the thread-safe path.
+        loop = asyncio.new_event_loop()
+        threading.Thread(target=loop.run_forever, daemon=True, name="event-loop").start()
+        event_bus = AsyncEventBus(max_queue_size=64, loop=loop)
+    else:
+        event_bus = EventBus(max_queue_size=64)
+        # State transitions must never drop. Transcriptions stay lossless too: the demo
+        # finishes once every transcript has produced a brain event.
+        event_bus.set_topic_policy("state_transition_event", BLOCK)
     ring_buffer = AudioRingBuffer(max_frames=BUFFER_FRAMES)
     inference_service = ScriptedInferenceService(SAMPLE_TEXT)
     hud = MinimalHUD()
@@ -196,7 +209,7 @@ def run_pipeline():
     stop_event = threading.Event()
 
     def on_completion(_event):
-        if len(event_bus.get_queue_snapshot("brain_event")) >= len(SAMPLE_TEXT):
+        if event_bus.latest_seq("brain_event") >= len(SAMPLE_TEXT):
             stop_event.set()
 
     event_bus.subscribe("brain_event", on_completion)
@@ -207,7 +220,10 @@ def run_pipeline():
 
     whisper_worker.stop()
     whisper_worker.join(timeout=1)
+    event_bus.shutdown()
+    if loop is not None:
+        loop.call_soon_threadsafe(loop.stop)
 
 
 if __name__ == "__main__":
-    run_pipeline()
+    run_pipeline(use_async_bus="--async-bus" in sys.argv[1:])
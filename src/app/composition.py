@@ -2,23 +2,27 @@ from src.interfaces import TelemetryClient
 from src.logging.structured_logger import log_event
 from src.sentinel.services import (
     AudioInputService,
+    build_audio_transport,
     build_ring_buffer,
+    PROVISIONAL_MS,
     ReplayRecorder,
     SilencePolicy,
     SoundDeviceAudioSource,
     SentinelTelemetry,
+    TriggerCoalescer,
 )
 from src.sentinel.dead_mic import DeadMicDetector
 from src.telemetry.error_state import ErrorStateManager
-from src.cache.silence_jitter import SilenceJitter
+from src.cache.silence_jitter import AdaptiveEndpointer
 from src.cache.vad_smoother import VADSmoother
 from src.worker.services import (
-    BackpressureController,
+    AdmissionController,
     GovernorService,
     InferenceService,
     IntentService,
     LatencyMonitor,
     RepeatFilterAdapter,
+    TriggerScheduler,
 )
 from src.telemetry.prompt_quality import PromptQualityMonitor
 from src.presenter.services import PresenterTelemetry, ResultValidator, SimpleResultFormatter
@@ -32,20 +36,24 @@ class StructuredLoggerClient(TelemetryClient):
 def build_sentinel_dependencies(use_mock: bool = False):
     ring_buffer = build_ring_buffer()
     smoother = VADSmoother()
-    jitter = SilenceJitter()
-    silence_policy = SilencePolicy(ring_buffer, smoother, jitter)
+    jitter = AdaptiveEndpointer()
     telemetry = SentinelTelemetry()
     if use_mock:
         audio_source = None
+        audio_transport = None
     else:
         audio_source = SoundDeviceAudioSource()
+        audio_transport = build_audio_transport()
+    silence_policy = SilencePolicy(ring_buffer, smoother, jitter, audio_transport, provisional_ms=PROVISIONAL_MS)
     replay_recorder = ReplayRecorder()
     error_state = ErrorStateManager()
     dead_mic = DeadMicDetector()
     audio_service = AudioInputService(audio_source, replay_recorder, dead_mic, error_state) if audio_source else None
     return {
         "ring_buffer": ring_buffer,
+        "audio_transport": audio_transport,
         "silence_policy": silence_policy,
+        "trigger_coalescer": TriggerCoalescer(silence_policy),
         "telemetry": telemetry,
         "audio_service": audio_service,
         "replay_recorder": replay_recorder,
@@ -61,14 +69,15 @@ def build_worker_dependencies(use_mock: bool = False):
     prompt_quality = PromptQualityMonitor()
     governor = GovernorService(repeat_filter=RepeatFilterAdapter(), error_state=error_state, prompt_quality=prompt_quality)
     latency_monitor = LatencyMonitor()
-    backpressure = BackpressureController()
+    admission = AdmissionController(latency_monitor)
     return {
         "error_state": error_state,
         "inference_service": inference_service,
         "intent_service": intent_service,
         "governor": governor,
         "latency_monitor": latency_monitor,
-        "backpressure": backpressure,
+        "scheduler": TriggerScheduler(service_time=admission.service_time),
+        "admission": admission,
         "prompt_quality": prompt_quality,
     }
 
@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+import threading
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Union
+
+from src.event_bus import BLOCK, DROP_OLDEST, KEEP_LATEST, POLICIES, REJECT, entries_since
+
+
+EventPayload = dict
+Handler = Callable[[EventPayload], Any]
+
+logger = logging.getLogger(__name__)
+
+
+class _AsyncLane:
+    """Per-subscriber FIFO drained by one consumer task; awaiting publishers wait in order when it is full."""
+
+    def __init__(self, event_type: str, handler: Handler, max_pending: int):
+        self.event_type = event_type
+        self.handler = handler
+        self.max_pending = max_pending
+        self.pending: Deque[EventPayload] = deque()
+        # Bounded like ``pending``: once it is full, awaiting publishers fall back to the topic policy.
+        self.waiters: Deque[Tuple[EventPayload, asyncio.Future]] = deque()
+        self.ready = asyncio.Event()
+        self.task: Optional[asyncio.Task] = None
+
+    def offer(
+        self,
+        payload: EventPayload,
+        policy: str,
+        counters: Dict[str, int],
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+    ) -> Union[bool, asyncio.Future]:
+        """Enqueue ``payload`` under ``policy``; False if refused.
+
+        With ``loop`` the caller awaits, so a full lane returns a future that
+        resolves to True once the payload is admitted (False if the lane closes).
+        """
+        if policy == KEEP_LATEST and self.pending and not self.waiters:
+            counters["coalesced"] += len(self.pending)
+            self.pending.clear()
+        if not self.waiters and len(self.pending) < self.max_pending:
+            self._enqueue(payload)
+            return True
+        if loop is not None and len(self.waiters) < self.max_pending:
+            waiter = loop.create_future()
+            self.waiters.append((payload, waiter))
+            return waiter
+        if policy in (BLOCK, REJECT):
+            counters["rejected"] += 1
+            return False
+        if policy == KEEP_LATEST:
+            counters["coalesced"] += len(self.pending)
+            self.pending.clear()
+        else:
+            self.pending.popleft()
+            counters["dropped"] += 1
+        self._enqueue(payload)
+        return True
+
+    def _enqueue(self, payload: EventPayload) -> None:
+        self.pending.append(payload)
+        self.ready.set()
+
+    def _admit_waiter(self) -> None:
+        while self.waiters and len(self.pending) < self.max_pending:
+            payload, waiter = self.waiters.popleft()
+            if waiter.done():
+                continue
+            self._enqueue(payload)
+            waiter.set_result(True)
+
+    def close(self) -> None:
+        """Stop the consumer task and release every waiting publisher with False."""
+        if self.task is not None:
+            self.task.cancel()
+        while self.waiters:
+            _payload, waiter = self.waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(False)
+
+    async def run(self) -> None:
+        while True:
+            if not self.pending:
+                self.ready.clear()
+                await self.ready.wait()
+                continue
+            payload = self.pending.popleft()
+            self._admit_waiter()
+            try:
+                result = self.handler(payload)
+                if inspect.isawaitable(result):
+                    await result
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("AsyncEventBus handler failed for '%s'", self.event_type)
+
+
+class AsyncEventBus:
+    """asyncio-native event bus with the same topic API as ``EventBus``.
+
+    Each subscriber gets its own consumer task, so handlers (sync or async) see
+    events in publish order without a thread pool. ``publish`` never waits: a
+    full lane applies the topic policy from ``set_topic_policy`` (drop oldest by
+    default; ``BLOCK`` topics reject, since a sync caller cannot wait on the
+    loop). Async producers that want backpressure await ``publish_async``
+    instead, which queues behind a full lane for up to the topic timeout; the
+    queue of waiting publishers is bounded by ``max_queue_size`` too, past
+    which the policy applies again. Calls from other threads, e.g. the
+    PortAudio callback, go through ``publish_threadsafe``; ``publish`` and
+    ``subscribe`` forward there automatically when called off the loop.
+    """
+
+    def __init__(self, max_queue_size: int = 128, loop: Optional[asyncio.AbstractEventLoop] = None):
+        self.max_queue_size = max_queue_size
+        self._loop = loop
+        self._subscribers: Dict[str, List[_AsyncLane]] = {}
+        self._history: Dict[str, Deque[Tuple[int, EventPayload]]] = {}
+        self._sequences: Dict[str, int] = {}
+        self._policies: Dict[str, Tuple[str, Optional[float]]] = {}
+        self._counters: Dict[str, Dict[str, int]] = {}
+        self._history_lock = threading.Lock()
+
+    def _bind(self) -> asyncio.AbstractEventLoop:
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
+        return self._loop
+
+    def _on_loop(self) -> bool:
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        return self._loop is None or running is self._loop
+
+    def set_topic_policy(self, event_type: str, policy: str, timeout: Optional[float] = None) -> None:
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown backpressure policy '{policy}'. Expected one of {POLICIES}")
+        self._policies[event_type] = (policy, timeout)
+
+    def get_topic_counters(self, event_type: str) -> Dict[str, int]:
+        return dict(self._counters.get(event_type, {"dropped": 0, "coalesced": 0, "rejected": 0}))
+
+    def subscribe(self, event_type: str, handler: Handler) -> None:
+        if not self._on_loop():
+            if self._loop is None:
+                raise RuntimeError("AsyncEventBus needs a loop: subscribe from a coroutine or pass loop=")
+            self._loop.call_soon_threadsafe(self.subscribe, event_type, handler)
+            return
+        loop = self._bind()
+        lane = _AsyncLane(event_type, handler, self.max_queue_size)
+        lane.task = loop.create_task(lane.run(), name=f"event-bus:{event_type}")
+        self._subscribers.setdefault(event_type, []).append(lane)
+
+    def unsubscribe(self, event_type: str, handler: Handler) -> None:
+        if not self._on_loop():
+            if self._loop is not None:
+                self._loop.call_soon_threadsafe(self.unsubscribe, event_type, handler)
+            return
+        lanes = self._subscribers.get(event_type)
+        if not lanes:
+            return
+        for lane in lanes:
+            if lane.handler == handler:
+                lanes.remove(lane)
+                lane.close()
+                break
+        if not lanes:
+            self._subscribers.pop(event_type, None)
+
+    def publish(self, event_type: str, payload: EventPayload) -> bool:
+        """Dispatch ``payload`` without waiting; returns False if any subscriber lane refused it.
+
+        Off the loop the call is forwarded to ``publish_threadsafe`` and the
+        policy is applied there, so it returns True.
+        """
+        if not self._on_loop():
+            self.publish_threadsafe(event_type, payload)
+            return True
+        self._bind()
+        policy, counters = self._record(event_type, payload)
+        accepted = True
+        for lane in self._subscribers.get(event_type, []):
+            accepted = lane.offer(payload, policy, counters) and accepted
+        return accepted
+
+    async def publish_async(self, event_type: str, payload: EventPayload) -> bool:
+        """Dispatch ``payload``, waiting for room in full lanes up to the topic timeout."""
+        loop = self._bind()
+        policy, counters = self._record(event_type, payload)
+        timeout = self._policies.get(event_type, (DROP_OLDEST, None))[1]
+        accepted = True
+        waiters = []
+        for lane in self._subscribers.get(event_type, []):
+            result = lane.offer(payload, policy, counters, loop)
+            if isinstance(result, asyncio.Future):
+                waiters.append(result)
+            else:
+                accepted = result and accepted
+        if not waiters:
+            return accepted
+        try:
+            done, expired = await asyncio.wait(waiters, timeout=timeout)
+        except asyncio.CancelledError:
+            for waiter in waiters:
+                waiter.cancel()
+            raise
+        for waiter in expired:
+            waiter.cancel()
+            counters["dropped"] += 1
+        return accepted and not expired and all(waiter.result() for waiter in done)
+
+    def _record(self, event_type: str, payload: EventPayload) -> Tuple[str, Dict[str, int]]:
+        with self._history_lock:
+            seq = self._sequences.get(event_type, 0) + 1
+            self._sequences[event_type] = seq
+            self._history.setdefault(event_type, deque(maxlen=self.max_queue_size)).append((seq, payload))
+        counters = self._counters.setdefault(event_type, {"dropped": 0, "coalesced": 0, "rejected": 0})
+        return self._policies.get(event_type, (DROP_OLDEST, None))[0], counters
+
+    def publish_threadsafe(self, event_type: str, payload: EventPayload) -> None:
+        if self._loop is None:
+            raise RuntimeError("AsyncEventBus is not bound to a loop yet")
+        self._loop.call_soon_threadsafe(self.publish, event_type, payload)
+
+    def latest_seq(self, event_type: str) -> int:
+        with self._history_lock:
+            return self._sequences.get(event_type, 0)
+
+    def read_since(self, event_type: str, seq: int) -> Tuple[List[Tuple[int, EventPayload]], bool]:
+        with self._history_lock:
+            return entries_since(self._history.get(event_type, deque()), seq)
+
+    def get_queue_snapshot(self, event_type: str) -> List[EventPayload]:
+        with self._history_lock:
+            return [payload for _, payload in self._history.get(event_type, ())]
+
+    def shutdown(self) -> None:
+        if not self._on_loop():
+            if self._loop is not None and not self._loop.is_closed():
+                self._loop.call_soon_threadsafe(self.shutdown)
+            return
+        for lanes in self._subscribers.values():
+            for lane in lanes:
+                lane.close()
+        self._subscribers.clear()
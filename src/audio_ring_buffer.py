@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import math
 import threading
+import time
 from collections import deque
-from typing import Deque, Optional
+from typing import Deque, Dict, List, Optional, Tuple
 
 try:
     import numpy as np
@@ -10,47 +12,127 @@ except Exception:  # pragma: no cover - fallback when numpy missing
     from src.mocks import mock_numpy as np
 
 
+DEFAULT_FRAME_SIZE = 512
+DEFAULT_SAMPLE_RATE = 16000
+
+
 class AudioRingBuffer:
-    """Bounded, thread-safe ring buffer for audio frames with drop-oldest semantics."""
+    """Bounded, thread-safe audio ring with drop-oldest frame semantics.
+
+    Samples live in a single preallocated float32 slab indexed by an absolute,
+    sample-granular write position. Frame boundaries are tracked separately so
+    ``read_latest`` keeps returning whole frames. Reads return views into the
+    slab, or one concatenated copy when the window wraps. The slab keeps one
+    frame of slack past the retained window, so a view survives the next
+    ``push`` and a caller can copy it after releasing the lock; anything that
+    outlives the current block must still be copied.
+
+    Every frame also records the capture time of its first sample on the
+    ``time.monotonic`` clock; per-sample times follow from the sample rate, which
+    is what ``read_range`` and ``capture_time_of`` use.
+    """
 
-    def __init__(self, max_frames: int):
-        self._buffer: Deque[np.ndarray] = deque(maxlen=max_frames)
+    def __init__(self, max_frames: int, frame_size: int = DEFAULT_FRAME_SIZE, sample_rate: int = DEFAULT_SAMPLE_RATE):
+        self.max_frames = max_frames
+        self.frame_size = frame_size
+        self.sample_rate = sample_rate
+        self._capacity = (max_frames + 1) * frame_size
+        self._data = np.zeros(self._capacity, dtype=np.float32)
+        self._frames: Deque[Tuple[int, int, float]] = deque(maxlen=max_frames)
+        self._write_pos = 0
         self._lock = threading.Lock()
         self._not_empty = threading.Condition(self._lock)
         self._sequence = 0
+        self._readers: List[RingReader] = []
 
-    def push(self, frame) -> None:
-        try:
-            frame_array = np.asarray(frame, dtype=np.float32).copy()
-        except Exception:
-            frame_array = np.array(frame).copy()
+    def push(self, frame, capture_time: Optional[float] = None) -> None:
+        """Append a frame; ``capture_time`` is the monotonic ADC time of its first sample."""
+        length = len(frame)
+        if capture_time is None:
+            capture_time = time.monotonic() - length / self.sample_rate
         with self._not_empty:
-            if len(self._buffer) == self._buffer.maxlen:
-                self._buffer.popleft()
-            self._buffer.append(frame_array)
+            if length > self.frame_size:
+                self._grow(length)
+            start = self._write_pos
+            self._write(start, frame, length)
+            self._frames.append((start, start + length, capture_time))
+            self._write_pos = start + length
             self._sequence += 1
             self._not_empty.notify_all()
+            for reader in self._readers:
+                reader._wakeup.notify()
+
+    def register_reader(self, name: str, from_oldest: bool = False) -> "RingReader":
+        """Attach a consumer cursor at the write head (or at the oldest retained frame)."""
+        with self._lock:
+            sequence = self._sequence - len(self._frames) if from_oldest else self._sequence
+            position = self._frames[0][0] if from_oldest and self._frames else self._write_pos
+            reader = RingReader(self, name, sequence, position)
+            self._readers.append(reader)
+            return reader
+
+    def unregister_reader(self, reader: "RingReader") -> None:
+        with self._lock:
+            if reader in self._readers:
+                self._readers.remove(reader)
+
+    def reader_stats(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return {
+                reader.name: {
+                    "pending_frames": self._sequence - reader._sequence,
+                    "frames_read": reader.frames_read,
+                    "frames_lost": reader.frames_lost,
+                    "frames_skipped": reader.frames_skipped,
+                }
+                for reader in self._readers
+            }
 
     def read_latest(self, max_frames: Optional[int] = None) -> Optional[np.ndarray]:
         with self._lock:
-            if not self._buffer:
+            if not self._frames:
                 return None
-            frames = list(self._buffer)
-        if max_frames is not None:
-            frames = frames[-max_frames:]
-        if not frames:
-            return None
-        try:
-            return np.concatenate(frames)
-        except Exception:
-            combined = []
-            for frame in frames:
-                combined.extend(list(frame))
-            return combined
+            count = len(self._frames) if max_frames is None else min(max_frames, len(self._frames))
+            if count <= 0:
+                return None
+            return self._slice(self._frames[-count][0], self._write_pos)
+
+    def read_samples(self, num_samples: int) -> Optional[np.ndarray]:
+        """Return the newest ``num_samples`` samples (fewer if not yet buffered)."""
+        with self._lock:
+            if not self._frames:
+                return None
+            available = self._write_pos - self._frames[0][0]
+            count = min(num_samples, available)
+            if count <= 0:
+                return None
+            return self._slice(self._write_pos - count, self._write_pos)
+
+    def read_range(self, start_time: float, end_time: float) -> Optional[np.ndarray]:
+        """Return the retained samples captured in ``[start_time, end_time)``."""
+        with self._lock:
+            if not self._frames:
+                return None
+            start = self._position_at(start_time)
+            end = self._position_at(end_time)
+            if end <= start:
+                return None
+            return self._slice(start, end)
+
+    def capture_time_of(self, position: int) -> Optional[float]:
+        """Capture time of the retained sample at absolute ``position`` (or of the write head)."""
+        with self._lock:
+            return self._time_at(position)
+
+    @property
+    def latest_capture_time(self) -> Optional[float]:
+        """Capture time just past the newest sample, i.e. when the next one will be taken."""
+        with self._lock:
+            return self._time_at(self._write_pos)
 
     def wait_for_data(self, timeout: Optional[float] = None) -> bool:
         with self._not_empty:
-            return self._not_empty.wait_for(lambda: len(self._buffer) > 0, timeout=timeout)
+            return self._not_empty.wait_for(lambda: len(self._frames) > 0, timeout=timeout)
 
     def wait_for_new_data(self, last_sequence: int, timeout: Optional[float] = None) -> int:
         with self._not_empty:
@@ -62,6 +144,129 @@ class AudioRingBuffer:
         with self._lock:
             return self._sequence
 
+    @property
+    def write_position(self) -> int:
+        with self._lock:
+            return self._write_pos
+
+    def _time_at(self, position: int) -> Optional[float]:
+        for start, end, capture_time in reversed(self._frames):
+            if start <= position <= end:
+                return capture_time + (position - start) / self.sample_rate
+        return None
+
+    def _position_at(self, when: float) -> int:
+        for start, end, capture_time in self._frames:
+            end_time = capture_time + (end - start) / self.sample_rate
+            if when < end_time:
+                offset = math.ceil((when - capture_time) * self.sample_rate)
+                return start + min(max(offset, 0), end - start)
+        return self._write_pos
+
+    def _advance(self, reader: "RingReader", max_frames: Optional[int]) -> Optional[int]:
+        """Move ``reader`` to the write head and return where its unread span starts."""
+        oldest = self._sequence - len(self._frames)
+        if reader._sequence < oldest:
+            reader.frames_lost += oldest - reader._sequence
+            reader._sequence = oldest
+        unread = self._sequence - reader._sequence
+        if unread <= 0:
+            return None
+        if max_frames is not None and unread > max_frames:
+            reader.frames_skipped += unread - max_frames
+            unread = max_frames
+        start = self._frames[len(self._frames) - unread][0]
+        reader.frames_read += unread
+        reader._sequence = self._sequence
+        reader._position = self._write_pos
+        reader.last_start_time = self._time_at(start)
+        reader.last_end_time = self._time_at(self._write_pos)
+        return start
+
+    def _read_new(self, reader: "RingReader", max_frames: Optional[int]):
+        start = self._advance(reader, max_frames)
+        if start is None:
+            return None
+        return self._slice(start, self._write_pos)
+
+    def _write(self, start: int, frame, length: int) -> None:
+        offset = start % self._capacity
+        first = min(length, self._capacity - offset)
+        self._data[offset : offset + first] = frame[:first]
+        if first < length:
+            self._data[0 : length - first] = frame[first:]
+
+    def _slice(self, start: int, end: int):
+        length = end - start
+        offset = start % self._capacity
+        if offset + length <= self._capacity:
+            return self._data[offset : offset + length]
+        return np.concatenate((self._data[offset:], self._data[: length - (self._capacity - offset)]))
+
+    def _grow(self, frame_size: int) -> None:
+        # Oversized frames are rare (tests, file replay); reallocate once so every
+        # retained frame still fits instead of silently overwriting older ones.
+        retained = self._slice(self._frames[0][0], self._write_pos) if self._frames else None
+        self.frame_size = frame_size
+        self._capacity = (self.max_frames + 1) * frame_size
+        self._data = np.zeros(self._capacity, dtype=np.float32)
+        if retained is not None:
+            start = self._frames[0][0]
+            self._write(start, retained, self._write_pos - start)
+
     def __len__(self) -> int:  # pragma: no cover - trivial
         with self._lock:
-            return len(self._buffer)
+            return len(self._frames)
+
+
+class RingReader:
+    """Independent consumer cursor over an ``AudioRingBuffer``.
+
+    Each reader sees every frame exactly once via ``read_new`` and is woken only
+    through its own condition. Frames that drop-oldest evicted before the reader
+    got to them are counted in ``frames_lost``; frames the reader chose not to
+    take (``max_frames``) are counted in ``frames_skipped``. After each read,
+    ``last_start_time``/``last_end_time`` hold the capture times bounding it.
+    """
+
+    def __init__(self, ring: AudioRingBuffer, name: str, sequence: int, position: int):
+        self.name = name
+        self.frames_read = 0
+        self.frames_lost = 0
+        self.frames_skipped = 0
+        self.last_start_time: Optional[float] = None
+        self.last_end_time: Optional[float] = None
+        self._ring = ring
+        self._sequence = sequence
+        self._position = position
+        self._wakeup = threading.Condition(ring._lock)
+
+    @property
+    def position(self) -> int:
+        """Absolute sample index of the next unread sample."""
+        with self._ring._lock:
+            return self._position
+
+    @property
+    def pending(self) -> int:
+        with self._ring._lock:
+            return self._ring._sequence - self._sequence
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        with self._wakeup:
+            return self._wakeup.wait_for(lambda: self._ring._sequence != self._sequence, timeout=timeout)
+
+    def read_new(self, max_frames: Optional[int] = None) -> Optional[np.ndarray]:
+        """Return all unread frames (at most the newest ``max_frames``) and advance."""
+        with self._ring._lock:
+            return self._ring._read_new(self, max_frames)
+
+    def advance(self) -> int:
+        """Mark every unread frame as read without copying it; return how many there were."""
+        with self._ring._lock:
+            before = self.frames_read
+            self._ring._advance(self, None)
+            return self.frames_read - before
+
+    def close(self) -> None:
+        self._ring.unregister_reader(self)
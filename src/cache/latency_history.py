@@ -1,5 +1,6 @@
+import time
 from collections import deque
-from typing import Deque, Dict, List
+from typing import Deque, Dict, List, Optional, Tuple
 
 try:
     import numpy as np
@@ -15,6 +16,8 @@ class LatencyHistory:
         self.records: Deque[Dict] = deque(maxlen=max_events)
 
     def add(self, record: Dict) -> None:
+        """Append ``record``, stamping ``recorded_at`` (monotonic seconds) unless it has one."""
+        record.setdefault("recorded_at", time.monotonic())
         self.records.append(record)
 
     def _percentile(self, values: List[float], percentile: float) -> float:
@@ -57,6 +60,39 @@ class LatencyHistory:
             "suppression_rate": suppression_rate,
         }
 
+    def fit_whisper_latency(
+        self, min_records: int = 8, max_age_sec: Optional[float] = None, now: Optional[float] = None
+    ) -> Optional[Tuple[float, float, float]]:
+        """Least-squares ``whisper_latency ≈ intercept + slope * audio_sec`` over records with ``audio_sec``.
+
+        Returns ``(intercept, slope, residual_p90)`` in seconds, or None with fewer
+        than ``min_records`` usable records. With ``max_age_sec`` records older
+        than that are left out, so a slow stretch stops counting once it is over.
+        With too little spread in clip length the slope is 0 and the intercept is
+        the mean latency.
+        """
+        oldest = None
+        if max_age_sec is not None:
+            oldest = (time.monotonic() if now is None else now) - max_age_sec
+        points = [
+            (float(rec["audio_sec"]), float(rec["whisper_latency"]))
+            for rec in self.records
+            if rec.get("audio_sec") is not None
+            and rec.get("whisper_latency", 0) > 0
+            and (oldest is None or rec.get("recorded_at", oldest) >= oldest)
+        ]
+        if len(points) < min_records:
+            return None
+        count = len(points)
+        mean_x = sum(x for x, _ in points) / count
+        mean_y = sum(y for _, y in points) / count
+        var_x = sum((x - mean_x) ** 2 for x, _ in points)
+        slope = sum((x - mean_x) * (y - mean_y) for x, y in points) / var_x if var_x > 1e-6 else 0.0
+        slope = max(slope, 0.0)
+        intercept = mean_y - slope * mean_x
+        residuals = [y - (intercept + slope * x) for x, y in points]
+        return intercept, slope, max(self._percentile(residuals, 90), 0.0)
+
     def log_warnings(self):
         metrics = self.metrics()
         if metrics["p95"]["whisper_ms"] > 1300:
@@ -1,6 +1,6 @@
 from collections import deque
 from pathlib import Path
-from typing import Deque, List, Tuple
+from typing import Deque, List, Optional, Sequence, Tuple, Union
 
 try:
     import numpy as np
@@ -10,25 +10,86 @@ except Exception:  # pragma: no cover
 from src.logging.structured_logger import log_event
 
 
+HEALTH_FIELDS = ("sample", "rms", "peak", "clipping_ratio", "dc_offset", "noise_floor")
+
+
+def _per_sample(values: Sequence, count: int) -> List:
+    """Spread per-block ``values`` evenly over ``count`` samples."""
+    blocks = len(values)
+    return [values[idx * blocks // count] for idx in range(count)]
+
+
 class ReplayBuffer:
+    """Last ``duration_sec`` of sentinel audio with per-sample VAD scores and signal health.
+
+    ``vad`` is the probability the silence policy saw, ``vad_raw`` the model's
+    own score (NaN where the energy gate answered without it) and ``gated``
+    whether the gate fired, so calibration can learn from ungated labels.
+    """
+
     def __init__(self, sample_rate: int = 16000, duration_sec: int = 20):
         self.sample_rate = sample_rate
         self.max_len = sample_rate * duration_sec
         self.audio: Deque[float] = deque(maxlen=self.max_len)
         self.vad: Deque[float] = deque(maxlen=self.max_len)
+        self.vad_raw: Deque[float] = deque(maxlen=self.max_len)
+        self.gated: Deque[bool] = deque(maxlen=self.max_len)
+        # One row per added chunk (sentinel reads are whole 512-sample blocks), keyed by the
+        # absolute index of its first sample.
+        self.health: Deque[Tuple[float, ...]] = deque(maxlen=max(self.max_len // 256, 1))
+        self.samples_added = 0
 
-    def add(self, audio_chunk, vad_prob: float) -> None:
+    def add(
+        self,
+        audio_chunk,
+        vad_prob: Union[float, Sequence[float]],
+        health=None,
+        raw_probs: Optional[Sequence[float]] = None,
+        gated: Optional[Sequence[bool]] = None,
+    ) -> None:
+        """Append a chunk; ``vad_prob``, ``raw_probs`` and ``gated`` may be one value per VAD block."""
         if audio_chunk is None:
             return
-        for sample in audio_chunk:
-            self.audio.append(float(sample))
-            self.vad.append(float(vad_prob))
+        samples = audio_chunk.tolist() if hasattr(audio_chunk, "tolist") else [float(x) for x in audio_chunk]
+        if not samples:
+            return
+        probs = [float(vad_prob)] if isinstance(vad_prob, (int, float)) else [float(p) for p in vad_prob]
+        raw_probs = probs if raw_probs is None else [float(p) for p in raw_probs]
+        gated = [False] * len(probs) if gated is None else [bool(flag) for flag in gated]
+        if health is not None:
+            self.health.append(
+                (
+                    self.samples_added,
+                    health.rms,
+                    health.peak,
+                    health.clipping_ratio,
+                    health.dc_offset,
+                    health.noise_floor,
+                )
+            )
+        self.audio.extend(samples)
+        self.vad.extend(_per_sample(probs, len(samples)))
+        self.vad_raw.extend(_per_sample(raw_probs, len(samples)))
+        self.gated.extend(_per_sample(gated, len(samples)))
+        self.samples_added += len(samples)
 
     def dump_to_disk(self, path: str | Path, event_id: str) -> Path:
         target = Path(path)
         target.parent.mkdir(parents=True, exist_ok=True)
         audio_array = np.array(list(self.audio))
         vad_array = np.array(list(self.vad))
-        np.savez(target, audio=audio_array, vad=vad_array, event_id=event_id)
+        first_sample = self.samples_added - len(self.audio)
+        # Dumped sample indices are relative to the first retained audio sample.
+        health_rows = [[row[0] - first_sample, *row[1:]] for row in self.health if row[0] >= first_sample]
+        np.savez(
+            target,
+            audio=audio_array,
+            vad=vad_array,
+            vad_raw=np.array(list(self.vad_raw)),
+            gated=np.array(list(self.gated)),
+            health=np.array(health_rows),
+            health_fields=",".join(HEALTH_FIELDS),
+            event_id=event_id,
+        )
         log_event({"type": "REPLAY_DUMP", "path": str(target), "event_id": event_id})
         return target
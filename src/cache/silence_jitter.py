@@ -1,3 +1,9 @@
+from collections import deque
+from typing import Deque, Optional, Tuple
+
+from src.telemetry.telemetry_writer import write_event
+
+
 class SilenceJitter:
     def __init__(self, min_continuous_ms: int = 600, window_ms: int = 800):
         self.min_continuous_ms = min_continuous_ms
@@ -9,9 +15,141 @@ class SilenceJitter:
         self.silence_ms = 0.0
         self.window_silence_ms = 0.0
 
+    def update_speech(self, delta_ms: float) -> None:
+        self.reset_on_speech()
+
+    def reset_on_trigger(self) -> None:
+        self.reset_on_speech()
+
     def update_silence(self, delta_ms: float) -> None:
         self.silence_ms += delta_ms
         self.window_silence_ms = min(self.window_ms, self.window_silence_ms + delta_ms)
 
     def is_trigger_ready(self) -> bool:
         return self.silence_ms >= self.min_continuous_ms and self.window_silence_ms >= self.window_ms
+
+
+def _quantile(sorted_values, q: float) -> float:
+    idx = min(int(q * len(sorted_values)), len(sorted_values) - 1)
+    return sorted_values[idx]
+
+
+class AdaptiveEndpointer(SilenceJitter):
+    """Silence threshold learned from the speaker's own pauses, clamped to ``[floor_ms, ceiling_ms]``.
+
+    Pauses that end with the speaker resuming are within-turn pauses; the
+    threshold sits just above a high quantile of them. While the current turn is
+    shorter than the speaker's typical turn the conservative ``mid_turn_quantile``
+    applies; once it has run as long as turns usually do, the lower
+    ``turn_end_quantile`` is used. Until ``min_pauses`` pauses are seen the fixed
+    ``initial_ms`` applies. Each trigger writes ``ENDPOINT_THRESHOLD`` telemetry.
+
+    A pause that reaches the threshold fires a trigger before its length is
+    known. When the speaker resumes within ``resume_window_ms`` of that
+    trigger, the whole pause, trigger to resume included, is recorded as a
+    within-turn pause. Otherwise the threshold would only learn from pauses
+    shorter than itself and could only fall. The turn the trigger closed
+    carries on too, so typical turn length is not learned from premature ends
+    either. Re-arming within the same pause keeps the first trigger's sample.
+    """
+
+    def __init__(
+        self,
+        floor_ms: float = 250.0,
+        ceiling_ms: float = 800.0,
+        initial_ms: float = 600.0,
+        mid_turn_quantile: float = 0.95,
+        turn_end_quantile: float = 0.75,
+        margin_ms: float = 50.0,
+        min_pauses: int = 8,
+        min_pause_ms: float = 60.0,
+        resume_window_ms: float = 1000.0,
+        history: int = 200,
+    ):
+        super().__init__(min_continuous_ms=initial_ms, window_ms=initial_ms)
+        self.floor_ms = floor_ms
+        self.ceiling_ms = ceiling_ms
+        self.initial_ms = initial_ms
+        self.mid_turn_quantile = mid_turn_quantile
+        self.turn_end_quantile = turn_end_quantile
+        self.margin_ms = margin_ms
+        self.min_pauses = min_pauses
+        self.min_pause_ms = min_pause_ms
+        self.resume_window_ms = resume_window_ms
+        self.pauses_ms: Deque[float] = deque(maxlen=history)
+        self.turns_ms: Deque[float] = deque(maxlen=history)
+        self.turn_speech_ms = 0.0
+        self._mid_turn_ms = initial_ms
+        self._turn_end_ms = initial_ms
+        self._typical_turn_ms: Optional[float] = None
+        # (silence at the first trigger of this pause, turn speech before it, whether that
+        # turn was recorded, silence carried across re-arms since then)
+        self._triggered: Optional[Tuple[float, float, bool, float]] = None
+
+    def update_speech(self, delta_ms: float) -> None:
+        if self._triggered is not None:
+            pause_ms, turn_speech_ms, turn_recorded, carried_ms = self._triggered
+            self._triggered = None
+            since_trigger_ms = carried_ms + self.silence_ms
+            if pause_ms >= self.min_pause_ms and since_trigger_ms <= self.resume_window_ms:
+                self.pauses_ms.append(pause_ms + since_trigger_ms)
+                if turn_recorded:
+                    self.turns_ms.pop()
+                self.turn_speech_ms = turn_speech_ms
+                self._refit()
+        elif self.silence_ms >= self.min_pause_ms and self.turn_speech_ms > 0:
+            self.pauses_ms.append(self.silence_ms)
+            self._refit()
+        self.turn_speech_ms += delta_ms
+        self.reset_on_speech()
+
+    def reset_on_trigger(self) -> None:
+        threshold, mode = self._threshold()
+        write_event(
+            {
+                "type": "ENDPOINT_THRESHOLD",
+                "threshold_ms": threshold,
+                "mode": mode,
+                "silence_ms": self.silence_ms,
+                "turn_speech_ms": self.turn_speech_ms,
+                "pauses_observed": len(self.pauses_ms),
+            }
+        )
+        if self._triggered is not None:
+            # Re-armed without speech in between: still the same pause.
+            pause_ms, turn_speech_ms, turn_recorded, carried_ms = self._triggered
+            self._triggered = (pause_ms, turn_speech_ms, turn_recorded, carried_ms + self.silence_ms)
+            self.reset_on_speech()
+            return
+        turn_recorded = self.turn_speech_ms > 0
+        if turn_recorded:
+            self.turns_ms.append(self.turn_speech_ms)
+            self._refit()
+        self._triggered = (self.silence_ms, self.turn_speech_ms, turn_recorded, 0.0)
+        self.turn_speech_ms = 0.0
+        self.reset_on_speech()
+
+    def update_silence(self, delta_ms: float) -> None:
+        self.silence_ms += delta_ms
+
+    def is_trigger_ready(self) -> bool:
+        return self.silence_ms >= self._threshold()[0]
+
+    def threshold_ms(self) -> float:
+        return self._threshold()[0]
+
+    def _threshold(self):
+        if self._typical_turn_ms is not None and self.turn_speech_ms >= self._typical_turn_ms:
+            return self._turn_end_ms, "turn_end"
+        return self._mid_turn_ms, "mid_turn"
+
+    def _clamp(self, value_ms: float) -> float:
+        return min(max(value_ms, self.floor_ms), self.ceiling_ms)
+
+    def _refit(self) -> None:
+        if len(self.pauses_ms) >= self.min_pauses:
+            pauses = sorted(self.pauses_ms)
+            self._mid_turn_ms = self._clamp(_quantile(pauses, self.mid_turn_quantile) + self.margin_ms)
+            self._turn_end_ms = self._clamp(_quantile(pauses, self.turn_end_quantile) + self.margin_ms)
+        if len(self.turns_ms) >= 3:
+            self._typical_turn_ms = _quantile(sorted(self.turns_ms), 0.5)
@@ -1,4 +1,4 @@
-from typing import Dict, Iterable
+from typing import Dict, Iterable, List, Optional
 
 try:
     import numpy as np
@@ -15,6 +15,33 @@ SILENCE_TRIGGER_FIELDS = (
     "sentinel_timestamp",
 )
 
+# Speculative endpointing: a PROVISIONAL trigger starts inference early, then either a
+# COMMIT (same fields plus ``provisional_id``) confirms it or an ABORT cancels it.
+SILENCE_PROVISIONAL = "SILENCE_PROVISIONAL"
+SILENCE_COMMIT = "SILENCE_COMMIT"
+SILENCE_ABORT = "SILENCE_ABORT"
+
+SILENCE_PROVISIONAL_FIELDS = SILENCE_TRIGGER_FIELDS
+SILENCE_COMMIT_FIELDS = SILENCE_TRIGGER_FIELDS + ("provisional_id",)
+SILENCE_ABORT_FIELDS = ("type", "id", "event_id", "provisional_id", "timestamp")
+
+# Optional on trigger, provisional and commit events: the sentinel's per-block VAD
+# probabilities over the event audio (one byte each, see ``encode_vad_probs``), the
+# block length, where the first block starts relative to the audio (may be negative),
+# and the speech spans in seconds from the start of the audio.
+VAD_TRACK_FIELDS = ("vad_probs", "vad_block_ms", "vad_offset_ms", "speech_segments")
+SPEECH_PROB_THRESHOLD = 0.5
+
+# Also optional: a trigger the sentinel widened to cover an earlier one that fired
+# moments before names it in ``supersedes`` and counts the folded events in ``merged_count``.
+
+SILENCE_EVENT_FIELDS = {
+    "SILENCE_TRIGGER": SILENCE_TRIGGER_FIELDS,
+    SILENCE_PROVISIONAL: SILENCE_PROVISIONAL_FIELDS,
+    SILENCE_COMMIT: SILENCE_COMMIT_FIELDS,
+    SILENCE_ABORT: SILENCE_ABORT_FIELDS,
+}
+
 WORKER_RESULT_FIELDS = (
     "id",
     "event_id",
@@ -39,16 +66,90 @@ def ensure_schema_keys(event: Dict, required_keys: Iterable[str], name: str) ->
         raise ValueError(f"{name} schema mismatch. Missing: {sorted(missing)}")
 
 
-def create_silence_trigger(event_id: str, audio: np.ndarray, timestamp: float) -> Dict:
+def encode_vad_probs(probs: Iterable[float]) -> bytes:
+    """Quantize probabilities to one byte each; 1/255 resolution is plenty for a speech track."""
+    return bytes(min(max(int(round(float(prob) * 255)), 0), 255) for prob in probs)
+
+
+def decode_vad_probs(data: bytes) -> List[float]:
+    return [value / 255 for value in data]
+
+
+def read_vad_track(event: Dict, threshold: float = SPEECH_PROB_THRESHOLD) -> Optional[Dict]:
+    """Speech ratio and segments of an event's VAD track, or None if the event has none."""
+    if event.get("vad_probs") is None:
+        return None
+    probs = decode_vad_probs(event["vad_probs"])
+    speech_blocks = sum(1 for prob in probs if prob >= threshold)
+    return {
+        "speech_ratio": speech_blocks / len(probs) if probs else 0.0,
+        "speech_segments": [tuple(segment) for segment in event.get("speech_segments") or ()],
+    }
+
+
+def create_silence_trigger(
+    event_id: str,
+    audio: Optional[np.ndarray],
+    timestamp: float,
+    audio_ref: Optional[Dict] = None,
+    speech_end_ts: Optional[float] = None,
+    event_type: str = "SILENCE_TRIGGER",
+    vad_track: Optional[Dict] = None,
+) -> Dict:
+    """Build a SILENCE_TRIGGER. With ``audio_ref`` the audio stays in shared memory.
+
+    ``timestamp`` and ``speech_end_ts`` are capture times on the monotonic clock:
+    the end of the block that completed the silence gap, and the end of the last
+    block the VAD judged to be speech. ``event_type`` builds a SILENCE_PROVISIONAL
+    with the same payload. ``vad_track`` adds the ``VAD_TRACK_FIELDS``.
+    """
     event = {
-        "type": "SILENCE_TRIGGER",
+        "type": event_type,
         "id": event_id,
         "event_id": event_id,
-        "audio": audio.astype(np.float32),
+        "audio": audio.astype(np.float32) if audio is not None else None,
         "timestamp": float(timestamp),
         "sentinel_timestamp": float(timestamp),
     }
-    ensure_schema_keys(event, SILENCE_TRIGGER_FIELDS, "SILENCE_TRIGGER")
+    if audio_ref is not None:
+        event["audio_ref"] = dict(audio_ref)
+    if speech_end_ts is not None:
+        event["speech_end_timestamp"] = float(speech_end_ts)
+    if vad_track is not None:
+        ensure_schema_keys(vad_track, VAD_TRACK_FIELDS, "VAD_TRACK")
+        event.update(vad_track)
+    ensure_schema_keys(event, SILENCE_TRIGGER_FIELDS, event_type)
+    return event
+
+
+def create_silence_commit(
+    event_id: str,
+    provisional_id: str,
+    audio: Optional[np.ndarray],
+    timestamp: float,
+    audio_ref: Optional[Dict] = None,
+    speech_end_ts: Optional[float] = None,
+    vad_track: Optional[Dict] = None,
+) -> Dict:
+    """Confirm a provisional trigger; carries its own audio in case the provisional work was lost."""
+    event = create_silence_trigger(
+        event_id, audio, timestamp, audio_ref, speech_end_ts, event_type=SILENCE_COMMIT, vad_track=vad_track
+    )
+    event["provisional_id"] = provisional_id
+    ensure_schema_keys(event, SILENCE_COMMIT_FIELDS, SILENCE_COMMIT)
+    return event
+
+
+def create_silence_abort(event_id: str, provisional_id: str, timestamp: float) -> Dict:
+    """Speech resumed after a provisional trigger; ``timestamp`` is the capture time of that speech."""
+    event = {
+        "type": SILENCE_ABORT,
+        "id": event_id,
+        "event_id": event_id,
+        "provisional_id": provisional_id,
+        "timestamp": float(timestamp),
+    }
+    ensure_schema_keys(event, SILENCE_ABORT_FIELDS, SILENCE_ABORT)
     return event
 
 
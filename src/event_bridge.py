@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import pickle
+import struct
+import threading
+from multiprocessing.connection import Client, Connection, Listener
+from typing import Dict, Iterable, List, Tuple
+
+from src.event_bus import EventBus, EventPayload
+from src.telemetry.telemetry_writer import write_event
+
+
+# Frame header: body length, per-topic sequence number, topic length.
+FRAME_HEADER = struct.Struct("!IQH")
+BRIDGE_BATCH_SIZE = 64
+
+
+def encode_frames(frames: Iterable[Tuple[str, int, EventPayload]]) -> bytes:
+    """Pack ``(topic, seq, payload)`` frames into one buffer for a single write."""
+    parts: List[bytes] = []
+    for topic, seq, payload in frames:
+        topic_bytes = topic.encode("utf-8")
+        body = pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL)
+        parts.append(FRAME_HEADER.pack(len(body), seq, len(topic_bytes)))
+        parts.append(topic_bytes)
+        parts.append(body)
+    return b"".join(parts)
+
+
+def decode_frames(buffer: bytes) -> List[Tuple[str, int, EventPayload]]:
+    frames = []
+    view = memoryview(buffer)
+    offset = 0
+    while offset < len(view):
+        body_len, seq, topic_len = FRAME_HEADER.unpack_from(view, offset)
+        offset += FRAME_HEADER.size
+        topic = bytes(view[offset : offset + topic_len]).decode("utf-8")
+        offset += topic_len
+        payload = pickle.loads(view[offset : offset + body_len])
+        offset += body_len
+        frames.append((topic, seq, payload))
+    return frames
+
+
+def listen_unix(path: str, authkey: bytes) -> Listener:
+    """Listen on ``path``; clients must present ``authkey`` before any frame is unpickled."""
+    return Listener(path, family="AF_UNIX", authkey=authkey)
+
+
+def connect_unix(path: str, authkey: bytes) -> Connection:
+    return Client(path, family="AF_UNIX", authkey=authkey)
+
+
+class EventBridgeSender:
+    """Forwards selected topics from a local ``EventBus`` over a connection.
+
+    Each topic is subscribed with a batching lane, so everything queued since
+    the last write leaves in one ``send_bytes`` call. Frames carry the bus's
+    own per-topic sequence number, so events the local lane dropped show up
+    as gaps on the far side. Do not bridge the same
+    topic in both directions or events will loop.
+    """
+
+    def __init__(self, bus: EventBus, conn: Connection, topics: Iterable[str], batch_size: int = BRIDGE_BATCH_SIZE):
+        self.bus = bus
+        self.conn = conn
+        self.topics = list(topics)
+        self.sent = 0
+        self.batches = 0
+        self.send_errors = 0
+        self._send_lock = threading.Lock()
+        self._handlers = {}
+        for topic in self.topics:
+            handler = self._make_handler(topic)
+            self._handlers[topic] = handler
+            bus.subscribe(topic, handler, batch_size=batch_size, with_seq=True)
+
+    def _make_handler(self, topic: str):
+        def forward(entries: List[Tuple[int, EventPayload]]) -> None:
+            frames = [(topic, seq, payload) for seq, payload in entries]
+            try:
+                with self._send_lock:
+                    self.conn.send_bytes(encode_frames(frames))
+            except (OSError, EOFError):
+                self.send_errors += 1
+                return
+            self.sent += len(frames)
+            self.batches += 1
+
+        return forward
+
+    def close(self) -> None:
+        for topic, handler in self._handlers.items():
+            self.bus.unsubscribe(topic, handler)
+        self.conn.close()
+
+
+class EventBridgeReceiver(threading.Thread):
+    """Reads bridge frames from a connection and republishes them on a local ``EventBus``.
+
+    Local subscribers cannot tell a bridged event from a local one. Sequence
+    numbers that jump ahead of the previous one seen on a topic are counted
+    per topic in ``gaps`` and reported as ``BRIDGE_GAP`` telemetry.
+    """
+
+    def __init__(self, bus: EventBus, conn: Connection):
+        super().__init__(daemon=True, name="event-bridge-rx")
+        self.bus = bus
+        self.conn = conn
+        self.received = 0
+        self.gaps: Dict[str, int] = {}
+        self._last_seq: Dict[str, int] = {}
+
+    def handle_buffer(self, buffer: bytes) -> None:
+        for topic, seq, payload in decode_frames(buffer):
+            # A receiver that joins mid-stream starts counting from the first seq it sees.
+            last = self._last_seq.get(topic, seq - 1)
+            if seq > last + 1:
+                missed = seq - last - 1
+                self.gaps[topic] = self.gaps.get(topic, 0) + missed
+                write_event({"type": "BRIDGE_GAP", "topic": topic, "missed": missed, "seq": seq})
+            self._last_seq[topic] = max(last, seq)
+            self.received += 1
+            self.bus.publish(topic, payload)
+
+    def run(self) -> None:  # pragma: no cover - threading
+        while True:
+            try:
+                buffer = self.conn.recv_bytes()
+            except (EOFError, OSError):
+                break
+            self.handle_buffer(buffer)
+
+    def close(self) -> None:
+        self.conn.close()
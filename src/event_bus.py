@@ -1,54 +1,359 @@
 from __future__ import annotations
 
+import logging
+import math
 import threading
+import time
 from collections import deque
 from concurrent.futures import ThreadPoolExecutor
-from typing import Callable, Deque, Dict, List
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from src.telemetry.histogram import LatencyHistogram
+from src.telemetry.telemetry_writer import write_event
 
 
 EventPayload = dict
 
+logger = logging.getLogger(__name__)
+
+# Upper bound on items one lane drains before yielding its pool thread, so a
+# hot topic cannot starve the other subscribers.
+LANE_DRAIN_LIMIT = 64
+
+# Time constant of the exponentially decaying publish rate, in seconds.
+PUBLISH_RATE_WINDOW_SEC = 1.0
+
+# Backpressure policies applied when a subscriber lane is full.
+DROP_OLDEST = "drop_oldest"
+KEEP_LATEST = "keep_latest"
+BLOCK = "block"
+REJECT = "reject"
+POLICIES = (DROP_OLDEST, KEEP_LATEST, BLOCK, REJECT)
+
+
+def entries_since(history: Deque[Tuple[int, EventPayload]], seq: int) -> Tuple[List[Tuple[int, EventPayload]], bool]:
+    """Entries of a consecutively numbered ``(seq, payload)`` history newer than ``seq``.
+
+    Indexes from the right end of the deque, so a caller that is nearly caught
+    up pays for the new entries only. The flag is True when entries after
+    ``seq`` were already dropped from the history.
+    """
+    if not history:
+        return [], False
+    oldest = history[0][0]
+    start = seq + 1 - oldest
+    missed = start < 0
+    start = max(start, 0)
+    return [history[idx] for idx in range(start, len(history))], missed
+
+
+class _TopicState:
+    """Backpressure policy, counters and latency histograms shared by all lanes of one topic."""
+
+    def __init__(self, history_size: int, policy: str = DROP_OLDEST, timeout: Optional[float] = None):
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown backpressure policy '{policy}'. Expected one of {POLICIES}")
+        self.policy = policy
+        self.timeout = timeout
+        self.history: Deque[Tuple[int, EventPayload]] = deque(maxlen=history_size)
+        self.published = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.rejected = 0
+        self.exceptions = 0
+        self.dispatch_lag = LatencyHistogram()
+        self.handler_time = LatencyHistogram()
+        # Decaying count of publishes: each adds 1 and decays by e per window, so
+        # count / window is the recent rate whether publishes come in bursts or stop.
+        self._rate_weight = 0.0
+        self._rate_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def count(self, field: str, amount: int = 1) -> None:
+        with self.lock:
+            setattr(self, field, getattr(self, field) + amount)
+
+    def record_publish(self, payload: EventPayload, now: float) -> int:
+        """Append ``payload`` to the history under the next sequence number and return it."""
+        with self.lock:
+            self.published += 1
+            seq = self.published
+            self.history.append((seq, payload))
+            self._rate_weight = self._decayed_weight(now) + 1.0
+            self._rate_at = now
+            return seq
+
+    def _decayed_weight(self, now: float) -> float:
+        return self._rate_weight * math.exp(-max(now - self._rate_at, 0.0) / PUBLISH_RATE_WINDOW_SEC)
+
+    def record_handler(self, lag_ms: float, duration_ms: float, failed: bool) -> None:
+        with self.lock:
+            self.dispatch_lag.record(lag_ms)
+            self.handler_time.record(duration_ms)
+            if failed:
+                self.exceptions += 1
+
+    def counters(self) -> Dict[str, int]:
+        with self.lock:
+            return {"dropped": self.dropped, "coalesced": self.coalesced, "rejected": self.rejected}
+
+    def snapshot(self, now: Optional[float] = None) -> Dict[str, Any]:
+        now = time.monotonic() if now is None else now
+        with self.lock:
+            return {
+                "policy": self.policy,
+                "published": self.published,
+                "publish_rate": self._decayed_weight(now) / PUBLISH_RATE_WINDOW_SEC,
+                "dropped": self.dropped,
+                "coalesced": self.coalesced,
+                "rejected": self.rejected,
+                "handler_exceptions": self.exceptions,
+                "dispatch_lag_ms": self.dispatch_lag.summary(),
+                "handler_ms": self.handler_time.summary(),
+            }
+
+
+class _SubscriberLane:
+    """Serial delivery lane for one subscription: a bounded deque drained by one task at a time."""
+
+    def __init__(
+        self, event_type: str, handler: Callable, max_pending: int, batch_size: Optional[int], with_seq: bool = False
+    ):
+        self.event_type = event_type
+        self.handler = handler
+        self.batch_size = batch_size
+        self.with_seq = with_seq
+        self.max_pending = max_pending
+        # (publish perf_counter, seq, payload) so dispatch lag can be measured at handler start.
+        self.pending: Deque[Tuple[float, int, EventPayload]] = deque()
+        self.lock = threading.Lock()
+        self.not_full = threading.Condition(self.lock)
+        self.scheduled = False
+        self.closed = False
+
+    def offer(self, payload: EventPayload, seq: int, topic: _TopicState, published_at: float) -> bool:
+        """Enqueue under the topic policy; caller holds ``lock``. False if not accepted."""
+        if len(self.pending) >= self.max_pending:
+            if topic.policy == REJECT:
+                topic.count("rejected")
+                return False
+            if topic.policy == BLOCK:
+                if not self.not_full.wait_for(
+                    lambda: self.closed or len(self.pending) < self.max_pending, timeout=topic.timeout
+                ):
+                    topic.count("dropped")
+                    return False
+                if self.closed:
+                    return False
+            elif topic.policy == DROP_OLDEST:
+                self.pending.popleft()
+                topic.count("dropped")
+        if topic.policy == KEEP_LATEST and self.pending:
+            topic.count("coalesced", len(self.pending))
+            self.pending.clear()
+        self.pending.append((published_at, seq, payload))
+        return True
+
 
 class EventBus:
-    """Thread-safe, bounded pub/sub event bus that drops oldest events when full."""
+    """Thread-safe, bounded pub/sub event bus that drops oldest events when full.
+
+    Every subscription owns a lane, so one handler sees its events in publish
+    order while different handlers run concurrently on the shared pool. A lane
+    is scheduled on the pool only when it goes from idle to busy, not once per
+    event. Subscribing with ``batch_size`` delivers lists of up to that many
+    queued payloads instead of single payloads; ``with_seq`` delivers
+    ``(seq, payload)`` pairs carrying the topic sequence number below.
+
+    ``set_topic_policy`` chooses what a full lane does with a new event:
+    drop the oldest (default), keep only the latest, block the publisher for up
+    to ``timeout`` seconds, or reject. ``BLOCK`` topics must not be published
+    from a handler of the same topic.
+
+    Every published payload gets a per-topic sequence number starting at 1.
+    ``read_since(topic, seq)`` returns the retained ``(seq, payload)`` entries
+    after ``seq`` and whether some were already dropped, so pollers can follow
+    a topic without copying its whole history each time. History is guarded by
+    per-topic locks rather than the bus-wide lock.
+
+    ``stats()`` reports, per topic, publish count and rate, lane depth, drop
+    counters, handler exceptions and histograms of publish-to-handler-start lag
+    and handler duration; ``start_stats_reporter`` writes them to telemetry.
+    """
 
     def __init__(self, max_queue_size: int = 128, max_workers: int = 8):
         self.max_queue_size = max_queue_size
-        self._subscribers: Dict[str, List[Callable[[EventPayload], None]]] = {}
-        self._queues: Dict[str, Deque[EventPayload]] = {}
+        self._subscribers: Dict[str, List[_SubscriberLane]] = {}
+        self._topics: Dict[str, _TopicState] = {}
         self._lock = threading.Lock()
         self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="event-bus")
+        self._stats_stop = threading.Event()
 
-    def subscribe(self, event_type: str, handler: Callable[[EventPayload], None]) -> None:
+    def subscribe(
+        self,
+        event_type: str,
+        handler: Callable[[EventPayload], None],
+        batch_size: Optional[int] = None,
+        with_seq: bool = False,
+    ) -> None:
+        lane = _SubscriberLane(event_type, handler, self.max_queue_size, batch_size, with_seq)
         with self._lock:
-            handlers = self._subscribers.setdefault(event_type, [])
-            handlers.append(handler)
+            lanes = self._subscribers.setdefault(event_type, [])
+            lanes.append(lane)
+
+    def set_topic_policy(self, event_type: str, policy: str, timeout: Optional[float] = None) -> None:
+        with self._lock:
+            topic = self._topics.get(event_type)
+            if topic is None:
+                self._topics[event_type] = _TopicState(self.max_queue_size, policy, timeout)
+                return
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown backpressure policy '{policy}'. Expected one of {POLICIES}")
+        with topic.lock:
+            topic.policy = policy
+            topic.timeout = timeout
+
+    def get_topic_counters(self, event_type: str) -> Dict[str, int]:
+        with self._lock:
+            topic = self._topics.get(event_type)
+        return topic.counters() if topic else {"dropped": 0, "coalesced": 0, "rejected": 0}
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            topics = dict(self._topics)
+            lanes = {event_type: list(lanes) for event_type, lanes in self._subscribers.items()}
+        report = {}
+        for event_type, topic in topics.items():
+            entry = topic.snapshot()
+            entry["subscribers"] = len(lanes.get(event_type, []))
+            entry["queue_depth"] = sum(len(lane.pending) for lane in lanes.get(event_type, []))
+            report[event_type] = entry
+        return report
+
+    def start_stats_reporter(self, interval_sec: float = 5.0) -> threading.Thread:
+        """Write an ``EVENT_BUS_STATS`` telemetry record every ``interval_sec`` until shutdown."""
+
+        def report() -> None:
+            while not self._stats_stop.wait(interval_sec):
+                write_event({"type": "EVENT_BUS_STATS", "topics": self.stats()})
+
+        thread = threading.Thread(target=report, daemon=True, name="event-bus-stats")
+        thread.start()
+        return thread
 
     def unsubscribe(self, event_type: str, handler: Callable[[EventPayload], None]) -> None:
         with self._lock:
-            handlers = self._subscribers.get(event_type)
-            if not handlers:
+            lanes = self._subscribers.get(event_type)
+            if not lanes:
                 return
-            if handler in handlers:
-                handlers.remove(handler)
-            if not handlers:
+            for lane in lanes:
+                if lane.handler == handler:
+                    lanes.remove(lane)
+                    with lane.lock:
+                        lane.closed = True
+                        lane.pending.clear()
+                        lane.not_full.notify_all()
+                    break
+            if not lanes:
                 self._subscribers.pop(event_type, None)
 
-    def publish(self, event_type: str, payload: EventPayload) -> None:
-        callbacks: List[Callable[[EventPayload], None]]
+    def publish(self, event_type: str, payload: EventPayload) -> bool:
+        """Dispatch ``payload``; returns False if any subscriber lane refused it."""
+        lanes: List[_SubscriberLane]
         with self._lock:
-            queue = self._queues.setdefault(event_type, deque(maxlen=self.max_queue_size))
-            if len(queue) == queue.maxlen:
-                queue.popleft()
-            queue.append(payload)
-            callbacks = list(self._subscribers.get(event_type, []))
-        for callback in callbacks:
-            self._executor.submit(callback, payload)
+            lanes = list(self._subscribers.get(event_type, []))
+            topic = self._topics.get(event_type)
+            if topic is None:
+                topic = self._topics[event_type] = _TopicState(self.max_queue_size)
+        published_at = time.perf_counter()
+        seq = topic.record_publish(payload, time.monotonic())
+        accepted = True
+        for lane in lanes:
+            with lane.lock:
+                if lane.closed:
+                    continue
+                if not lane.offer(payload, seq, topic, published_at):
+                    accepted = False
+                    continue
+                if lane.scheduled:
+                    continue
+                lane.scheduled = True
+            self._executor.submit(self._drain, lane)
+        return accepted
 
-    def get_queue_snapshot(self, event_type: str) -> List[EventPayload]:
+    def _drain(self, lane: _SubscriberLane) -> None:
+        topic = self._topics.get(lane.event_type)
+        for _ in range(LANE_DRAIN_LIMIT):
+            with lane.lock:
+                # Unsubscribe clears the lane; shutdown only closes it, so queued events still go out.
+                if not lane.pending:
+                    lane.scheduled = False
+                    return
+                if lane.batch_size:
+                    count = min(lane.batch_size, len(lane.pending))
+                    entries = [lane.pending.popleft() for _ in range(count)]
+                    published_at = entries[0][0]
+                    if lane.with_seq:
+                        item = [(seq, payload) for _, seq, payload in entries]
+                    else:
+                        item = [payload for _, _, payload in entries]
+                else:
+                    published_at, seq, payload = lane.pending.popleft()
+                    item = (seq, payload) if lane.with_seq else payload
+                lane.not_full.notify()
+            started = time.perf_counter()
+            failed = False
+            try:
+                lane.handler(item)
+            except Exception:
+                failed = True
+                logger.exception("EventBus handler failed for '%s'", lane.event_type)
+            if topic is not None:
+                finished = time.perf_counter()
+                topic.record_handler((started - published_at) * 1000, (finished - started) * 1000, failed)
+        try:
+            self._executor.submit(self._drain, lane)
+        except RuntimeError:
+            # Executor already shut down; leave the remaining events undelivered.
+            with lane.lock:
+                lane.scheduled = False
+
+    def _topic(self, event_type: str) -> Optional[_TopicState]:
         with self._lock:
-            queue = self._queues.get(event_type, deque())
-            return list(queue)
+            return self._topics.get(event_type)
+
+    def latest_seq(self, event_type: str) -> int:
+        topic = self._topic(event_type)
+        if topic is None:
+            return 0
+        with topic.lock:
+            return topic.published
+
+    def read_since(self, event_type: str, seq: int) -> Tuple[List[Tuple[int, EventPayload]], bool]:
+        """Return ``([(seq, payload), ...], missed)`` for entries published after ``seq``."""
+        topic = self._topic(event_type)
+        if topic is None:
+            return [], False
+        with topic.lock:
+            return entries_since(topic.history, seq)
+
+    def get_queue_snapshot(self, event_type: str) -> List[EventPayload]:
+        topic = self._topic(event_type)
+        if topic is None:
+            return []
+        with topic.lock:
+            return [payload for _, payload in topic.history]
 
     def shutdown(self) -> None:
+        """Stop accepting events and wake publishers blocked on a full ``BLOCK`` lane; they get False.
+
+        Events already queued are still delivered by lanes that are running.
+        """
+        self._stats_stop.set()
+        with self._lock:
+            lanes = [lane for topic_lanes in self._subscribers.values() for lane in topic_lanes]
+        for lane in lanes:
+            with lane.lock:
+                lane.closed = True
+                lane.not_full.notify_all()
         self._executor.shutdown(wait=False)
@@ -18,6 +18,16 @@ class SilencePolicy(Protocol):
         ...
 
 
+@runtime_checkable
+class VADEngine(Protocol):
+    def score(self, block) -> float:
+        """Speech probability for one fixed-size block; engines keep their own recurrent state."""
+        ...
+
+    def reset(self) -> None:
+        ...
+
+
 @runtime_checkable
 class SilenceDetector(Protocol):
     def update(self, prob: float, timestamp: float, frames: int) -> Optional[Dict[str, Any]]:
@@ -26,7 +36,7 @@ class SilenceDetector(Protocol):
 
 @runtime_checkable
 class STTEngine(Protocol):
-    def transcribe(self, audio) -> Dict[str, Any]:
+    def transcribe(self, audio, vad_track: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         ...
 
 
@@ -65,7 +75,7 @@ class WarmStarter(Protocol):
 
 @runtime_checkable
 class ReplayStore(Protocol):
-    def add(self, audio_chunk, vad_prob: float) -> None:
+    def add(self, audio_chunk, vad_prob, health=None, raw_probs=None, gated=None) -> None:
         ...
 
     def dump_to_disk(self, path: str, event_id: str) -> None:
@@ -74,7 +84,9 @@ class ReplayStore(Protocol):
 
 @runtime_checkable
 class LatencyTracker(Protocol):
-    def record(self, whisper_latency: float, intent_latency: float, total_age: float, decision: str) -> None:
+    def record(
+        self, whisper_latency: float, intent_latency: float, total_age: float, decision: str, audio_sec: Optional[float] = None
+    ) -> None:
         ...
 
 
@@ -8,6 +8,27 @@ class MockArray(list):
     def copy(self):
         return MockArray(self)
 
+    def __getitem__(self, item):
+        value = super().__getitem__(item)
+        if isinstance(item, slice):
+            return MockArray(value)
+        return value
+
+    def __ge__(self, other):
+        return MockArray(x >= other for x in self)
+
+    def __le__(self, other):
+        return MockArray(x <= other for x in self)
+
+    def max(self):
+        return max(self)
+
+    def min(self):
+        return min(self)
+
+    def sum(self):
+        return sum(self)
+
 
 def zeros(length, dtype=None):
     return MockArray([0.0 for _ in range(length)])
@@ -24,6 +45,22 @@ def array(values):
     return MockArray(list(values))
 
 
+def asarray(values, dtype=None):
+    return values if isinstance(values, MockArray) else MockArray(float(x) for x in values)
+
+
+def abs(values):
+    return MockArray(x if x >= 0 else -x for x in values)
+
+
+def dot(a, b):
+    return sum(x * y for x, y in zip(a, b))
+
+
+def count_nonzero(values):
+    return sum(1 for x in values if x)
+
+
 def percentile(values, percentile_value):
     if not values:
         return 0.0
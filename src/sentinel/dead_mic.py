@@ -2,6 +2,7 @@ import time
 from typing import Optional
 
 from src.logging.structured_logger import log_event
+from src.sentinel.signal_health import SignalHealth, SignalHealthAnalyzer
 
 
 class DeadMicDetector:
@@ -9,11 +10,15 @@ class DeadMicDetector:
         self.max_silence_sec = max_silence_sec
         self.rms_floor = rms_floor
         self.last_signal_ts: Optional[float] = None
+        self._analyzer = SignalHealthAnalyzer()
 
-    def update(self, audio_chunk, vad_prob: float, now: float) -> bool:
+    def update(self, audio_chunk, vad_prob: float, now: float, health: Optional[SignalHealth] = None) -> bool:
+        """``health`` is the block's precomputed ``SignalHealth``; it is derived from ``audio_chunk`` if omitted."""
         amplitude = 0.0
-        if audio_chunk is not None:
-            amplitude = sum(abs(float(x)) for x in audio_chunk) / max(len(audio_chunk), 1)
+        if health is None and audio_chunk is not None:
+            health = self._analyzer.analyze(audio_chunk)
+        if health is not None:
+            amplitude = health.mean_abs
         if amplitude > self.rms_floor or vad_prob > 0.05:
             self.last_signal_ts = now
             return False
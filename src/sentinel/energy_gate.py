@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Optional, Sequence
+
+try:
+    import numpy as np
+except Exception:  # pragma: no cover - fallback for environments without numpy
+    from src.mocks import mock_numpy as np
+
+_EPS = 1e-10
+
+
+def _flatness(blocks, window) -> "np.ndarray":
+    spectrum = np.fft.rfft(blocks * window, axis=-1)
+    power = spectrum.real ** 2 + spectrum.imag ** 2 + _EPS
+    return np.exp(np.mean(np.log(power), axis=-1)) / np.mean(power, axis=-1)
+
+
+def block_features(blocks) -> Dict[str, "np.ndarray"]:
+    """RMS, zero-crossing rate and spectral flatness for a ``(n_blocks, block_size)`` array."""
+    blocks = np.atleast_2d(np.asarray(blocks, dtype=np.float32))
+    rms = np.sqrt(np.mean(blocks * blocks, axis=1))
+    signs = np.signbit(blocks)
+    zcr = np.mean(signs[:, 1:] != signs[:, :-1], axis=1)
+    flatness = _flatness(blocks, np.hanning(blocks.shape[1]).astype(np.float32))
+    return {"rms": rms, "zcr": zcr, "flatness": flatness}
+
+
+@dataclass
+class EnergyGateThresholds:
+    """Below ``silence_rms`` a block is silence; above ``noise_flatness`` and ``noise_zcr`` it is broadband noise."""
+
+    silence_rms: float = 0.002
+    noise_flatness: float = 0.45
+    noise_zcr: float = 0.35
+
+
+class EnergyGate:
+    """Cheap front stage that answers for blocks that are obviously not speech.
+
+    ``classify`` returns ``0.0`` for near-digital silence or flat, noisy spectra
+    and ``None`` for everything else, which the caller hands to the neural VAD.
+    The gate never claims speech, so a miss only costs a model call. Counters
+    feed ``skip_fraction``; thresholds come from ``calibrate`` over replay dumps.
+    """
+
+    def __init__(self, thresholds: Optional[EnergyGateThresholds] = None):
+        self.thresholds = thresholds or EnergyGateThresholds()
+        self.blocks_seen = 0
+        self.blocks_skipped = 0
+        self._window = None
+
+    @property
+    def skip_fraction(self) -> float:
+        return self.blocks_skipped / self.blocks_seen if self.blocks_seen else 0.0
+
+    def classify(self, block) -> Optional[float]:
+        """Cheapest test first: the FFT only runs for loud blocks with a high crossing rate."""
+        self.blocks_seen += 1
+        block = np.asarray(block, dtype=np.float32)
+        limits = self.thresholds
+        if float(np.sqrt(np.dot(block, block) / len(block))) < limits.silence_rms:
+            self.blocks_skipped += 1
+            return 0.0
+        signs = np.signbit(block)
+        if float(np.count_nonzero(signs[1:] != signs[:-1])) / (len(block) - 1) <= limits.noise_zcr:
+            return None
+        if self._window is None or len(self._window) != len(block):
+            self._window = np.hanning(len(block)).astype(np.float32)
+        if float(_flatness(block, self._window)) > limits.noise_flatness:
+            self.blocks_skipped += 1
+            return 0.0
+        return None
+
+
+def calibrate(
+    features: Dict[str, "np.ndarray"],
+    speech: Sequence[bool],
+    max_speech_skip: float = 0.005,
+    weights: Optional[Sequence[float]] = None,
+) -> Dict[str, float]:
+    """Pick the most aggressive thresholds that gate at most ``max_speech_skip`` of speech blocks.
+
+    ``features`` come from ``block_features`` over replay audio and ``speech``
+    marks the blocks the neural VAD scored as speech without the gate in front
+    of it. Gated blocks only carry such a label when ``StreamingVAD`` audited
+    them, so ``weights`` lets each audited block stand for the gated blocks it
+    was sampled from. Each rule is tuned on its own against half the miss
+    budget, then the combination is measured.
+    """
+    speech = np.asarray(speech, dtype=bool)
+    rms, zcr, flatness = features["rms"], features["zcr"], features["flatness"]
+    weights = np.ones(len(speech), dtype=np.float64) if weights is None else np.asarray(weights, dtype=np.float64)
+    speech_weight = max(float(weights[speech].sum()), 1e-9)
+    budget = max_speech_skip / 2
+
+    def speech_skip(mask) -> float:
+        return float(weights[mask & speech].sum()) / speech_weight
+
+    thresholds = EnergyGateThresholds()
+    for candidate in np.quantile(rms, np.linspace(0.0, 0.95, 96)):
+        if speech_skip(rms < candidate) > budget:
+            break
+        thresholds.silence_rms = float(candidate)
+    for candidate in np.linspace(0.95, 0.1, 86):
+        noisy = (flatness > candidate) & (zcr > thresholds.noise_zcr)
+        if speech_skip(noisy) > budget:
+            break
+        thresholds.noise_flatness = float(candidate)
+
+    gated = (rms < thresholds.silence_rms) | ((flatness > thresholds.noise_flatness) & (zcr > thresholds.noise_zcr))
+    return {
+        "silence_rms": thresholds.silence_rms,
+        "noise_flatness": thresholds.noise_flatness,
+        "noise_zcr": thresholds.noise_zcr,
+        "skip_fraction": float(weights[gated].sum() / weights.sum()) if len(gated) else 0.0,
+        "speech_skip_fraction": speech_skip(gated),
+    }
@@ -2,47 +2,40 @@ from __future__ import annotations
 
 import sys
 import threading
-import time
 from typing import Optional
 
 from src.audio_ring_buffer import AudioRingBuffer
-from src.cache.silence_jitter import SilenceJitter
+from src.cache.silence_jitter import AdaptiveEndpointer
 from src.cache.vad_smoother import VADSmoother
+from src.interfaces import VADEngine
 
 try:
     import numpy as np
 except Exception:  # pragma: no cover - fallback for environments without numpy
     from src.mocks import mock_numpy as np
 
-from src.contracts import SILENCE_TRIGGER_FIELDS, create_silence_trigger, ensure_schema_keys
 from src.logging.structured_logger import log_event
 from src.sentinel.services import (
     BLOCK_SIZE,
-    BUFFER_FRAMES,
+    PROVISIONAL_MS,
     SAMPLE_RATE,
     AudioInputService,
     SentinelTelemetry,
+    SilenceLoop,
     SilencePolicy,
     SoundDeviceAudioSource,
+    TriggerCoalescer,
+    build_audio_transport,
     build_ring_buffer,
+    capture_time_from,
 )
+from src.sentinel.energy_gate import EnergyGate
+from src.sentinel.vad import StreamingVAD, load_vad_engine
+from src.shared_audio import SharedAudioRing
 from src.telemetry.device_monitor import enumerate_microphones
 from src.telemetry.error_state import ErrorStateManager
 
 
-def _load_vad_model():
-    import torch
-
-    model, utils = torch.hub.load(
-        repo_or_dir="snakers4/silero-vad",
-        model="silero_vad",
-        force_reload=False,
-        onnx=False,
-    )
-    (get_speech_timestamps, save_audio, read_audio, VADIterator, collect_chunks) = utils
-    return model
-
-
 def sentinel_process(queue_sw, use_mock: bool = False, mock_event_count: int = 3, services: Optional[dict] = None):
     sys.stdout.reconfigure(encoding="utf-8")
 
@@ -54,8 +47,9 @@ def sentinel_process(queue_sw, use_mock: bool = False, mock_event_count: int = 3
 
     svc = services or {}
     ring_buffer: AudioRingBuffer = svc.get("ring_buffer") or build_ring_buffer()
+    audio_transport: SharedAudioRing = svc.get("audio_transport") or build_audio_transport()
     silence_policy: SilencePolicy = svc.get("silence_policy") or SilencePolicy(
-        ring_buffer, VADSmoother(), SilenceJitter()
+        ring_buffer, VADSmoother(), AdaptiveEndpointer(), audio_transport, provisional_ms=PROVISIONAL_MS
     )
     telemetry: SentinelTelemetry = svc.get("telemetry") or SentinelTelemetry()
     audio_service: AudioInputService = svc.get("audio_service") or AudioInputService(
@@ -65,7 +59,7 @@ def sentinel_process(queue_sw, use_mock: bool = False, mock_event_count: int = 3
 
     import sounddevice as sd
 
-    model = _load_vad_model()
+    vad_engine: VADEngine = svc.get("vad_engine") or load_vad_engine()
     enumerate_microphones()
     stop_event = threading.Event()
 
@@ -73,45 +67,26 @@ def sentinel_process(queue_sw, use_mock: bool = False, mock_event_count: int = 3
         if status:
             log_event({"type": "SENTINEL_STATUS", "status": str(status)})
         audio_chunk = indata[:, 0]
-        ring_buffer.push(audio_chunk)
-
-    def silence_worker():
-        last_seq = ring_buffer.sequence
-        while not stop_event.is_set():
-            last_seq = ring_buffer.wait_for_new_data(last_sequence=last_seq, timeout=0.5)
-            audio = ring_buffer.read_latest(max_frames=BUFFER_FRAMES)
-            if audio is None:
-                continue
-
-            try:
-                import torch
-
-                chunk = audio[-BLOCK_SIZE:]
-                speech_prob = float(model(torch.from_numpy(chunk), SAMPLE_RATE).item())
-            except Exception:
-                chunk = audio[-BLOCK_SIZE:]
-                speech_prob = 0.0
-
-            now = time.monotonic()
-            if getattr(audio_service, "replay_recorder", None):
-                audio_service.replay_recorder.add(chunk, speech_prob)
-            if getattr(audio_service, "dead_mic", None) and audio_service.dead_mic.update(chunk, speech_prob, now):
-                dead_event = {"type": "MIC_DEAD", "timestamp": now}
-                queue_sw.put(dead_event)
-                log_event(dead_event)
-
-            trigger = silence_policy.handle_prob(speech_prob, now, len(chunk), SAMPLE_RATE)
-            if trigger:
-                event = trigger["event"]
-                event_id = trigger["event_id"]
-                ensure_schema_keys(event, SILENCE_TRIGGER_FIELDS, "SILENCE_TRIGGER")
-                queue_sw.put(event)
-                telemetry.emit_trigger(event_id, now, trigger["silence_ms"])
-
-            error_state.record_vad_inactivity()
+        ring_buffer.push(audio_chunk, capture_time=capture_time_from(time_info, frames, SAMPLE_RATE))
+
+    silence_loop = SilenceLoop(
+        ring_buffer.register_reader("vad"),
+        StreamingVAD(
+            vad_engine,
+            block_size=BLOCK_SIZE,
+            sample_rate=SAMPLE_RATE,
+            gate=svc.get("energy_gate") or EnergyGate(),
+        ),
+        silence_policy,
+        telemetry,
+        audio_service,
+        error_state,
+        queue_sw,
+        coalescer=svc.get("trigger_coalescer") or TriggerCoalescer(silence_policy),
+    )
 
     telemetry.emit_start(SAMPLE_RATE)
-    silence_thread = threading.Thread(target=silence_worker, daemon=True, name="silence-worker")
+    silence_thread = threading.Thread(target=silence_loop.run, args=(stop_event,), daemon=True, name="silence-worker")
     silence_thread.start()
 
     try:
@@ -128,3 +103,4 @@ def sentinel_process(queue_sw, use_mock: bool = False, mock_event_count: int = 3
     finally:
         stop_event.set()
         silence_thread.join(timeout=1)
+        audio_transport.close()
@@ -1,15 +1,30 @@
 import threading
 import time
 import uuid
+from collections import deque
+from typing import Deque, Dict, List, Tuple
 
 from src.audio_ring_buffer import AudioRingBuffer
 from src.cache.replay_buffer import ReplayBuffer
 from src.cache.silence_jitter import SilenceJitter
 from src.cache.vad_smoother import VADSmoother
-from src.contracts import SILENCE_TRIGGER_FIELDS, create_silence_trigger, ensure_schema_keys
+from src.contracts import (
+    SILENCE_ABORT,
+    SILENCE_COMMIT,
+    SILENCE_EVENT_FIELDS,
+    SILENCE_PROVISIONAL,
+    SPEECH_PROB_THRESHOLD,
+    create_silence_abort,
+    create_silence_commit,
+    create_silence_trigger,
+    encode_vad_probs,
+    ensure_schema_keys,
+)
 from src.interfaces import AudioSource, ReplayStore, SilencePolicy as SilencePolicyInterface
 from src.logging.structured_logger import log_event
 from src.sentinel.dead_mic import DeadMicDetector
+from src.sentinel.signal_health import SignalHealth, SignalHealthAnalyzer
+from src.shared_audio import SharedAudioRing
 from src.telemetry.device_monitor import enumerate_microphones
 from src.telemetry.error_state import ErrorStateManager
 from src.telemetry.telemetry_writer import write_event
@@ -23,10 +38,84 @@ SAMPLE_RATE = 16000
 BLOCK_SIZE = 512
 BUFFER_DURATION = 1.2
 BUFFER_FRAMES = int((SAMPLE_RATE * BUFFER_DURATION) / BLOCK_SIZE) + 1
+# Triggers carry the utterance (onset - pre pad .. offset + post pad), capped at MAX_CAPTURE_SEC;
+# the ring keeps enough history for the cap plus the pads and the endpointing wait.
+PRE_SPEECH_PAD_MS = 300.0
+POST_SPEECH_PAD_MS = 200.0
+MAX_CAPTURE_SEC = 10.0
+MAX_CAPTURE_SAMPLES = int(SAMPLE_RATE * MAX_CAPTURE_SEC)
+RING_DURATION = MAX_CAPTURE_SEC + 2.0
+RING_FRAMES = int((SAMPLE_RATE * RING_DURATION) / BLOCK_SIZE) + 1
+TRANSPORT_SLOTS = 8
+# Speech segments sent with a trigger are widened by SEGMENT_PAD_MS and joined across shorter gaps.
+SEGMENT_PAD_MS = 100.0
+SEGMENT_MERGE_MS = 300.0
+# Silence after which a provisional trigger lets the worker start transcribing early.
+PROVISIONAL_MS = 300.0
+# Triggers this close together, or mostly carrying audio already sent, are coalesced.
+REFRACTORY_MS = 300.0
+MIN_TRIGGER_OVERLAP = 0.8
+# Roughly every 30 s of audio, report signal health and how many blocks the energy gate kept from the VAD model.
+REPORT_BLOCKS = 1000
 
 
 def build_ring_buffer() -> AudioRingBuffer:
-    return AudioRingBuffer(max_frames=BUFFER_FRAMES)
+    return AudioRingBuffer(max_frames=RING_FRAMES, frame_size=BLOCK_SIZE)
+
+
+def build_audio_transport() -> SharedAudioRing:
+    return SharedAudioRing(slot_samples=MAX_CAPTURE_SAMPLES, slots=TRANSPORT_SLOTS)
+
+
+def speech_segments(
+    probs: List[float],
+    block_sec: float,
+    offset_sec: float,
+    duration_sec: float,
+    threshold: float = SPEECH_PROB_THRESHOLD,
+    pad_ms: float = SEGMENT_PAD_MS,
+    merge_ms: float = SEGMENT_MERGE_MS,
+) -> List[Tuple[float, float]]:
+    """Runs of blocks at or above ``threshold`` as ``(start, end)`` seconds into the audio.
+
+    Block ``i`` starts ``offset_sec + i * block_sec`` into the audio. Runs are
+    padded, clamped to ``[0, duration_sec]`` and merged when the gap between
+    them is at most ``merge_ms``.
+    """
+    pad, merge = pad_ms / 1000, merge_ms / 1000
+    segments: List[Tuple[float, float]] = []
+    run_start = None
+    for idx, prob in enumerate(list(probs) + [0.0]):
+        if prob >= threshold and run_start is None:
+            run_start = idx
+        elif prob < threshold and run_start is not None:
+            start = max(offset_sec + run_start * block_sec - pad, 0.0)
+            end = min(offset_sec + idx * block_sec + pad, duration_sec)
+            run_start = None
+            if end <= start:
+                continue
+            if segments and start - segments[-1][1] <= merge:
+                segments[-1] = (segments[-1][0], end)
+            else:
+                segments.append((start, end))
+    return [(round(start, 3), round(end, 3)) for start, end in segments]
+
+
+def capture_time_from(time_info, frames: int, sample_rate: int = SAMPLE_RATE) -> float:
+    """Map PortAudio's ADC time of a block's first sample onto ``time.monotonic()``.
+
+    PortAudio stamps callbacks on its own stream clock, so only the distance
+    between ``currentTime`` and ``inputBufferAdcTime`` is carried over. Backends
+    that leave the ADC time at zero fall back to "the block just finished".
+    """
+    now = time.monotonic()
+    try:
+        input_latency = float(time_info.currentTime) - float(time_info.inputBufferAdcTime)
+        if float(time_info.inputBufferAdcTime) > 0 and 0.0 <= input_latency < 1.0:
+            return now - input_latency
+    except Exception:
+        pass
+    return now - frames / sample_rate
 
 
 class SoundDeviceAudioSource(AudioSource):
@@ -62,41 +151,374 @@ class SoundDeviceAudioSource(AudioSource):
 
 
 class SilencePolicy(SilencePolicyInterface):
-    def __init__(self, ring_buffer: AudioRingBuffer, smoother: VADSmoother, jitter: SilenceJitter):
+    """Turns smoothed VAD probabilities into silence events.
+
+    Trigger audio spans the current utterance: from the first smoothed speech
+    onset since the last trigger minus ``pre_pad_ms`` to the last speech block
+    plus ``post_pad_ms``, keeping at most the newest ``max_capture_sec``. The
+    pre pad also covers the smoother's onset lag. Without a tracked onset, or
+    when the ring no longer holds the span, the newest ``fallback_frames`` go.
+    The raw probabilities of the blocks covering that audio travel with it as
+    a VAD track (see ``contracts.VAD_TRACK_FIELDS``), so the worker knows where
+    the speech is without running a VAD of its own.
+
+    With ``provisional_ms`` set, silence that reaches it first emits a
+    SILENCE_PROVISIONAL so the worker can transcribe during the endpointing
+    wait. The real trigger then goes out as a SILENCE_COMMIT for that
+    provisional, or speech resuming first emits a SILENCE_ABORT for it.
+    """
+
+    def __init__(
+        self,
+        ring_buffer: AudioRingBuffer,
+        smoother: VADSmoother,
+        jitter: SilenceJitter,
+        transport: SharedAudioRing | None = None,
+        provisional_ms: float | None = None,
+        pre_pad_ms: float = PRE_SPEECH_PAD_MS,
+        post_pad_ms: float = POST_SPEECH_PAD_MS,
+        max_capture_sec: float = MAX_CAPTURE_SEC,
+        fallback_frames: int = BUFFER_FRAMES,
+    ):
         self.ring_buffer = ring_buffer
         self.smoother = smoother
         self.jitter = jitter
+        self.transport = transport
+        self.provisional_ms = provisional_ms
+        self.pre_pad_ms = pre_pad_ms
+        self.post_pad_ms = post_pad_ms
+        self.max_capture_sec = max_capture_sec
+        self.fallback_frames = fallback_frames
+        self.provisional_id: str | None = None
+        self.utterance_start_ts: float | None = None
+        self.last_speech_ts: float | None = None
+        self.block_sec: float | None = None
+        self._probs: Deque[Tuple[float, float]] = deque()
+
+    def _capture(self, window=None):
+        """The trigger audio and the capture-time window ``(start, end)`` it actually covers."""
+        head = self.ring_buffer.latest_capture_time
+        if window is None and self.utterance_start_ts is not None and self.last_speech_ts is not None:
+            end = self.last_speech_ts + self.post_pad_ms / 1000
+            window = (max(self.utterance_start_ts - self.pre_pad_ms / 1000, end - self.max_capture_sec), end)
+        audio = self.ring_buffer.read_range(*window) if window is not None else None
+        end = min(window[1], head) if audio is not None else head
+        if audio is None:
+            audio = self.ring_buffer.read_latest(self.fallback_frames)
+        if audio is None or end is None:
+            return audio, None
+        return audio, (end - len(audio) / self.ring_buffer.sample_rate, end)
+
+    def _vad_track(self, audio_start: float, audio_end: float) -> Dict | None:
+        covering = [(end_ts, prob) for end_ts, prob in self._probs if audio_start < end_ts and end_ts - self.block_sec < audio_end]
+        if not covering:
+            return None
+        probs = [prob for _, prob in covering]
+        offset_sec = covering[0][0] - self.block_sec - audio_start
+        return {
+            "vad_probs": encode_vad_probs(probs),
+            "vad_block_ms": self.block_sec * 1000,
+            "vad_offset_ms": offset_sec * 1000,
+            "speech_segments": speech_segments(probs, self.block_sec, offset_sec, audio_end - audio_start),
+        }
+
+    def _audio_payload(self, window=None):
+        full_audio, window = self._capture(window)
+        if full_audio is None:
+            return None, None
+        payload = {"audio": full_audio}
+        if self.transport is not None:
+            payload = {"audio": None, "audio_ref": self.transport.write(full_audio)}
+        if window is not None:
+            payload["vad_track"] = self._vad_track(*window)
+        return payload, window
+
+    def widen(self, trigger: Dict, start: float) -> Dict:
+        """Rebuild a trigger, keeping its id, so its audio reaches back to capture time ``start``."""
+        event = trigger["event"]
+        payload, window = self._audio_payload((start, trigger["window"][1]))
+        if payload is None:
+            return trigger
+        common = {
+            "event_id": event["id"],
+            "timestamp": event["timestamp"],
+            "speech_end_ts": event.get("speech_end_timestamp"),
+            **payload,
+        }
+        if event["type"] == SILENCE_COMMIT:
+            widened = create_silence_commit(provisional_id=event["provisional_id"], **common)
+        else:
+            widened = create_silence_trigger(event_type=event["type"], **common)
+        return {**trigger, "event": widened, "window": window}
+
+    def _record_prob(self, prob: float, timestamp: float) -> None:
+        self._probs.append((timestamp, float(prob)))
+        horizon = timestamp - self.max_capture_sec - (self.pre_pad_ms + self.post_pad_ms) / 1000 - 2.0
+        while self._probs[0][0] < horizon:
+            self._probs.popleft()
 
     def handle_prob(self, prob: float, timestamp: float, frames: int, sample_rate: int):
+        """``timestamp`` is the capture time just past the block that produced ``prob``."""
         speaking = self.smoother.update(prob, timestamp)
+        delta_ms = (frames / sample_rate) * 1000
+        self.block_sec = frames / sample_rate
+        self._record_prob(prob, timestamp)
         if speaking:
-            self.jitter.reset_on_speech()
-            return None
+            self.jitter.update_speech(delta_ms)
+            if self.utterance_start_ts is None:
+                self.utterance_start_ts = timestamp - delta_ms / 1000
+            self.last_speech_ts = timestamp
+            if self.provisional_id is None:
+                return None
+            event_id = str(uuid.uuid4())
+            event = create_silence_abort(event_id, self.provisional_id, timestamp)
+            self.provisional_id = None
+            return {"event": event, "event_id": event_id, "silence_ms": 0.0}
 
-        delta_ms = (frames / sample_rate) * 1000
         self.jitter.update_silence(delta_ms)
         if self.jitter.is_trigger_ready():
-            full_audio = self.ring_buffer.read_latest()
-            if full_audio is None:
+            payload, window = self._audio_payload()
+            if payload is None:
+                return None
+            event_id = str(uuid.uuid4())
+            if self.provisional_id is not None:
+                event = create_silence_commit(
+                    event_id=event_id,
+                    provisional_id=self.provisional_id,
+                    timestamp=timestamp,
+                    speech_end_ts=self.last_speech_ts,
+                    **payload,
+                )
+                self.provisional_id = None
+            else:
+                event = create_silence_trigger(
+                    event_id=event_id,
+                    timestamp=timestamp,
+                    speech_end_ts=self.last_speech_ts,
+                    **payload,
+                )
+            silence_ms = self.jitter.silence_ms
+            self.jitter.reset_on_trigger()
+            self.utterance_start_ts = None
+            return {"event": event, "event_id": event_id, "silence_ms": silence_ms, "window": window}
+
+        if (
+            self.provisional_ms is not None
+            and self.provisional_id is None
+            and self.jitter.silence_ms >= self.provisional_ms
+        ):
+            payload, window = self._audio_payload()
+            if payload is None:
                 return None
             event_id = str(uuid.uuid4())
             event = create_silence_trigger(
                 event_id=event_id,
-                audio=full_audio,
                 timestamp=timestamp,
+                speech_end_ts=self.last_speech_ts,
+                event_type=SILENCE_PROVISIONAL,
+                **payload,
             )
-            ensure_schema_keys(event, SILENCE_TRIGGER_FIELDS, "SILENCE_TRIGGER")
-            self.jitter.reset_on_speech()
-            return {"event": event, "event_id": event_id, "silence_ms": self.jitter.silence_ms}
+            self.provisional_id = event_id
+            return {"event": event, "event_id": event_id, "silence_ms": self.jitter.silence_ms, "window": window}
         return None
 
 
+class TriggerCoalescer:
+    """Debounces silence events between the ``SilencePolicy`` and ``queue_sw``.
+
+    The endpointer re-arms after every trigger, so a long silence fires again
+    on audio the previous trigger already carried, and a short false onset can
+    end the same turn twice a few hundred ms apart. Each costs a Whisper run.
+
+    An event with no speech since the last trigger sent, or whose audio window
+    is at least ``min_overlap`` covered by it, is dropped, as are aborts of
+    dropped provisionals. One that
+    fires within ``refractory_ms`` of it but brings new audio is widened back to
+    that trigger's start, so the worker sees the whole utterance, and names it
+    in ``supersedes``. Nothing is held back, so coalescing never delays a
+    trigger. ``merged`` counts events folded away.
+    """
+
+    def __init__(
+        self,
+        policy: SilencePolicy,
+        refractory_ms: float = REFRACTORY_MS,
+        min_overlap: float = MIN_TRIGGER_OVERLAP,
+        max_tracked: int = 8,
+    ):
+        self.policy = policy
+        self.refractory_ms = refractory_ms
+        self.min_overlap = min_overlap
+        self.max_tracked = max_tracked
+        self.merged = 0
+        self._last: Dict | None = None
+        self._dropped: Deque[str] = deque(maxlen=max_tracked)
+
+    @staticmethod
+    def _overlap(window, previous) -> float:
+        shared = min(window[1], previous[1]) - max(window[0], previous[0])
+        return max(shared, 0.0) / max(window[1] - window[0], 1e-9)
+
+    def offer(self, trigger: Dict) -> Tuple[Dict | None, str | None]:
+        """Returns the trigger to send (or None) and ``"dropped"``/``"widened"`` when it was coalesced."""
+        event = trigger["event"]
+        if event["type"] == SILENCE_ABORT:
+            if event["provisional_id"] in self._dropped:
+                self.merged += 1
+                return None, "dropped"
+            return trigger, None
+        last, window = self._last, trigger.get("window")
+        if last is None or window is None:
+            return self._sent(trigger), None
+        no_new_speech = event.get("speech_end_timestamp") == last["speech_end"]
+        if no_new_speech or self._overlap(window, last["window"]) >= self.min_overlap:
+            self.merged += 1
+            last["merged_count"] += 1
+            if event["type"] == SILENCE_PROVISIONAL:
+                self._dropped.append(event["id"])
+            return None, "dropped"
+        if (event["timestamp"] - last["timestamp"]) * 1000 < self.refractory_ms:
+            self.merged += 1
+            trigger = self.policy.widen(trigger, last["window"][0])
+            trigger["event"]["supersedes"] = last["id"]
+            trigger["event"]["merged_count"] = last["merged_count"] + 1
+            return self._sent(trigger, trigger["event"]["merged_count"]), "widened"
+        return self._sent(trigger), None
+
+    def _sent(self, trigger: Dict, merged_count: int = 0) -> Dict:
+        event = trigger["event"]
+        if event["type"] != SILENCE_PROVISIONAL and trigger.get("window") is not None:
+            self._last = {
+                "id": event["id"],
+                "window": trigger["window"],
+                "timestamp": event["timestamp"],
+                "speech_end": event.get("speech_end_timestamp"),
+                "merged_count": merged_count,
+            }
+        return trigger
+
+
+class SilenceLoop:
+    """Body of the sentinel's silence worker, kept free of threads and devices.
+
+    Each ``step`` waits for new ring frames on ``reader``, measures their
+    ``SignalHealth``, scores them with a ``StreamingVAD`` and feeds both to the
+    replay recorder, dead-mic detector, error state and silence policy.
+    Triggers and dead-mic events go to ``queue_sw``.
+
+    When the thread falls behind, one step reads every block that arrived in
+    the meantime and passes each probability to the policy in order, stamped
+    with that block's own capture time, so silence is neither under-counted
+    nor endpointed late. Such catch-up blocks are counted in
+    ``vad_frames_skipped``; blocks evicted before they could be read are
+    reported as ring overruns instead. With a ``coalescer``, silence events
+    pass through it on their way to ``queue_sw``.
+    """
+
+    def __init__(
+        self,
+        reader,
+        vad,
+        silence_policy: SilencePolicy,
+        telemetry: "SentinelTelemetry",
+        audio_service: "AudioInputService",
+        error_state: ErrorStateManager,
+        queue_sw,
+        sample_rate: int = SAMPLE_RATE,
+        analyzer: SignalHealthAnalyzer | None = None,
+        coalescer: TriggerCoalescer | None = None,
+    ):
+        self.reader = reader
+        self.vad = vad
+        self.silence_policy = silence_policy
+        self.telemetry = telemetry
+        self.audio_service = audio_service
+        self.error_state = error_state
+        self.queue_sw = queue_sw
+        self.sample_rate = sample_rate
+        self.analyzer = analyzer or SignalHealthAnalyzer()
+        self.coalescer = coalescer
+        self.vad_frames_skipped = 0
+        self._frames_lost = 0
+        self._reported = (0, 0)
+
+    def step(self, timeout: float = 0.5) -> None:
+        if not self.reader.wait(timeout=timeout):
+            return
+        audio = self.reader.read_new()
+        if audio is None:
+            return
+        if self.reader.frames_lost != self._frames_lost:
+            self.telemetry.emit_overrun(self.reader.name, self.reader.frames_lost - self._frames_lost)
+            self._frames_lost = self.reader.frames_lost
+
+        health = self.analyzer.analyze(audio)
+        self.error_state.record_signal_health(health)
+        probs = self.vad.process(audio)
+        if not probs:
+            return
+        if len(probs) > 1:
+            self.vad_frames_skipped += len(probs) - 1
+            self.telemetry.emit_vad_catch_up(len(probs))
+        speech_prob = probs[-1]
+
+        now = time.monotonic()
+        captured_at = self.reader.last_end_time if self.reader.last_end_time is not None else now
+        if getattr(self.audio_service, "replay_recorder", None):
+            self.audio_service.replay_recorder.add(audio, probs, health, self.vad.last_raw, self.vad.last_gated)
+        dead_mic = getattr(self.audio_service, "dead_mic", None)
+        if dead_mic and dead_mic.update(audio, speech_prob, now, health):
+            dead_event = {"type": "MIC_DEAD", "timestamp": now}
+            self.queue_sw.put(dead_event)
+            log_event(dead_event)
+
+        # Samples still waiting in the VAD remainder were captured after the last scored block.
+        block_sec = self.vad.block_size / self.sample_rate
+        last_block_end = captured_at - self.vad.pending_samples / self.sample_rate
+        for idx, prob in enumerate(probs):
+            block_end = last_block_end - (len(probs) - 1 - idx) * block_sec
+            trigger = self.silence_policy.handle_prob(prob, block_end, self.vad.block_size, self.sample_rate)
+            if trigger and self.coalescer is not None:
+                event_id = trigger["event_id"]
+                trigger, action = self.coalescer.offer(trigger)
+                if action is not None:
+                    self.telemetry.emit_coalesced(event_id, action, self.coalescer.merged)
+            if trigger:
+                event = trigger["event"]
+                ensure_schema_keys(event, SILENCE_EVENT_FIELDS[event["type"]], event["type"])
+                self.queue_sw.put(event)
+                if event["type"] in (SILENCE_PROVISIONAL, SILENCE_ABORT):
+                    self.telemetry.emit_speculation(event, trigger["silence_ms"])
+                else:
+                    self.telemetry.emit_trigger(trigger["event_id"], block_end, trigger["silence_ms"])
+
+        self._report(health)
+        self.error_state.record_vad_inactivity()
+
+    def _report(self, health: SignalHealth) -> None:
+        scored, gated = self.vad.blocks_scored, self.vad.blocks_gated
+        last_scored, last_gated = self._reported
+        if scored - last_scored < REPORT_BLOCKS:
+            return
+        self.telemetry.emit_signal_health(health)
+        if self.vad.gate is not None:
+            self.telemetry.emit_vad_gate(scored - last_scored, gated - last_gated)
+        self._reported = (scored, gated)
+
+    def run(self, stop_event: threading.Event) -> None:
+        try:
+            while not stop_event.is_set():
+                self.step()
+        finally:
+            self.reader.close()
+
+
 class ReplayRecorder(ReplayStore):
     def __init__(self, sample_rate: int = SAMPLE_RATE, duration_sec: float = 20):
         self.buffer = ReplayBuffer(sample_rate=sample_rate, duration_sec=duration_sec)
 
-    def add(self, audio_chunk, vad_prob: float) -> None:
-        self.buffer.add(audio_chunk, vad_prob)
+    def add(self, audio_chunk, vad_prob, health: SignalHealth | None = None, raw_probs=None, gated=None) -> None:
+        self.buffer.add(audio_chunk, vad_prob, health, raw_probs, gated)
 
     def dump_to_disk(self, path: str, event_id: str) -> None:
         self.buffer.dump_to_disk(path, event_id)
@@ -114,9 +536,41 @@ class SentinelTelemetry:
         )
         write_event({"type": "SENTINEL_DETECT", "event_id": event_id, "latency_ms": silence_ms})
 
+    def emit_speculation(self, event: Dict, silence_ms: float) -> None:
+        write_event(
+            {
+                "type": event["type"],
+                "event_id": event["event_id"],
+                "provisional_id": event.get("provisional_id", event["event_id"]),
+                "silence_ms": silence_ms,
+            }
+        )
+
+    def emit_coalesced(self, event_id: str, action: str, merged_total: int) -> None:
+        write_event({"type": "TRIGGER_COALESCED", "event_id": event_id, "action": action, "merged_total": merged_total})
+
     def emit_start(self, sample_rate: int) -> None:
         write_event({"type": "SENTINEL_START", "sample_rate": sample_rate})
 
+    def emit_overrun(self, reader: str, frames_lost: int) -> None:
+        write_event({"type": "RING_OVERRUN", "reader": reader, "frames_lost": frames_lost})
+
+    def emit_vad_catch_up(self, blocks: int) -> None:
+        write_event({"type": "VAD_CATCH_UP", "blocks": blocks})
+
+    def emit_signal_health(self, health: SignalHealth) -> None:
+        write_event({"type": "SIGNAL_HEALTH", **health.as_dict()})
+
+    def emit_vad_gate(self, blocks: int, skipped: int) -> None:
+        write_event(
+            {
+                "type": "VAD_GATE",
+                "blocks": blocks,
+                "skipped": skipped,
+                "skip_fraction": skipped / blocks if blocks else 0.0,
+            }
+        )
+
     def emit_stop(self) -> None:
         log_event({"type": "SENTINEL_STOP"})
 
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import math
+from dataclasses import asdict, dataclass
+from typing import Dict, Optional
+
+try:
+    import numpy as np
+except Exception:  # pragma: no cover - fallback for environments without numpy
+    from src.mocks import mock_numpy as np
+
+CLIP_LEVEL = 0.99
+
+
+@dataclass(frozen=True)
+class SignalHealth:
+    """Per-block microphone diagnostics; ``ac_rms`` is the RMS with the DC offset removed."""
+
+    rms: float
+    ac_rms: float
+    mean_abs: float
+    peak: float
+    clipping_ratio: float
+    dc_offset: float
+    noise_floor: float
+
+    def as_dict(self) -> Dict[str, float]:
+        return asdict(self)
+
+
+def _block_stats(block, clip_level: float):
+    block = np.asarray(block, dtype=np.float32)
+    count = len(block)
+    if not count:
+        return 0.0, 0.0, 0.0, 0.0, 0.0
+    peak_hi, peak_lo = float(block.max()), float(block.min())
+    clipped = np.count_nonzero(block >= clip_level) + np.count_nonzero(block <= -clip_level)
+    return (
+        float(np.dot(block, block)) / count,
+        float(np.abs(block).sum()) / count,
+        max(peak_hi, -peak_lo),
+        clipped / count,
+        float(block.sum()) / count,
+    )
+
+
+class SignalHealthAnalyzer:
+    """Computes ``SignalHealth`` for each block with a handful of vectorized reductions.
+
+    The noise floor follows the quietest recent blocks: it drops immediately to a
+    lower RMS and creeps up by ``floor_rise`` per block otherwise, so speech
+    bursts barely move it while a change of room or gain settles within seconds.
+    """
+
+    def __init__(self, clip_level: float = CLIP_LEVEL, floor_rise: float = 0.002):
+        self.clip_level = clip_level
+        self.floor_rise = floor_rise
+        self.noise_floor: Optional[float] = None
+        self.last: Optional[SignalHealth] = None
+
+    def analyze(self, block) -> SignalHealth:
+        mean_square, mean_abs, peak, clipping_ratio, dc_offset = _block_stats(block, self.clip_level)
+        rms = math.sqrt(mean_square)
+        ac_rms = math.sqrt(max(mean_square - dc_offset * dc_offset, 0.0))
+        if self.noise_floor is None or ac_rms < self.noise_floor:
+            self.noise_floor = ac_rms
+        else:
+            self.noise_floor += (ac_rms - self.noise_floor) * self.floor_rise
+        self.last = SignalHealth(
+            rms=rms,
+            ac_rms=ac_rms,
+            mean_abs=mean_abs,
+            peak=peak,
+            clipping_ratio=clipping_ratio,
+            dc_offset=dc_offset,
+            noise_floor=self.noise_floor,
+        )
+        return self.last
@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import os
+from typing import List, Optional
+
+from src.interfaces import VADEngine
+
+try:
+    import numpy as np
+except Exception:  # pragma: no cover - fallback for environments without numpy
+    from src.mocks import mock_numpy as np
+
+VAD_BLOCK_SIZE = 512
+VAD_SAMPLE_RATE = 16000
+DEFAULT_ONNX_MODEL_PATH = os.path.join("models", "silero_vad.onnx")
+VAD_BACKENDS = ("onnx", "torch")
+# Every Nth gated block is still scored by the model so replay dumps carry
+# ungated labels for calibrating the gate.
+GATE_AUDIT_EVERY = 16
+
+
+class TorchSileroEngine(VADEngine):
+    """Silero VAD through ``torch.hub``; heavy to import and fetches the model on first use."""
+
+    def __init__(self, sample_rate: int = VAD_SAMPLE_RATE):
+        import torch
+
+        model, _utils = torch.hub.load(
+            repo_or_dir="snakers4/silero-vad",
+            model="silero_vad",
+            force_reload=False,
+            onnx=False,
+        )
+        self._torch = torch
+        self.model = model
+        self.sample_rate = sample_rate
+
+    def score(self, block) -> float:
+        return float(self.model(self._torch.from_numpy(block), self.sample_rate).item())
+
+    def reset(self) -> None:
+        self.model.reset_states()
+
+
+class OnnxSileroEngine(VADEngine):
+    """Silero VAD v5 on ONNX Runtime from a local model file, with no torch and no network.
+
+    The session is pinned to one thread with spinning disabled: a 512-sample
+    block is far too small to gain from intra-op parallelism, and idle spin
+    threads would burn laptop CPU between blocks. The model input (the last
+    ``context`` samples of the previous block followed by the new block) and the
+    recurrent state are preallocated, so a call copies one block and runs.
+    """
+
+    def __init__(
+        self,
+        model_path: str = DEFAULT_ONNX_MODEL_PATH,
+        block_size: int = VAD_BLOCK_SIZE,
+        sample_rate: int = VAD_SAMPLE_RATE,
+    ):
+        if not os.path.exists(model_path):
+            raise FileNotFoundError(
+                f"Silero VAD ONNX model not found at '{model_path}'; download silero_vad.onnx there or use the torch backend"
+            )
+        import onnxruntime as ort
+
+        options = ort.SessionOptions()
+        options.intra_op_num_threads = 1
+        options.inter_op_num_threads = 1
+        options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        options.add_session_config_entry("session.intra_op.allow_spinning", "0")
+        self.session = ort.InferenceSession(model_path, sess_options=options, providers=["CPUExecutionProvider"])
+        self.block_size = block_size
+        self.sample_rate = sample_rate
+        self.context = 64 if sample_rate == 16000 else 32
+        self._input = np.zeros((1, self.context + block_size), dtype=np.float32)
+        self._state = np.zeros((2, 1, 128), dtype=np.float32)
+        self._sr = np.array(sample_rate, dtype=np.int64)
+
+    def score(self, block) -> float:
+        self._input[0, self.context :] = block
+        prob, self._state = self.session.run(None, {"input": self._input, "state": self._state, "sr": self._sr})
+        self._input[0, : self.context] = self._input[0, -self.context :]
+        return float(prob[0, 0])
+
+    def reset(self) -> None:
+        self._input.fill(0.0)
+        self._state.fill(0.0)
+
+
+def load_vad_engine(backend: Optional[str] = None, model_path: str = DEFAULT_ONNX_MODEL_PATH) -> VADEngine:
+    """Build a VAD engine; without ``backend``, prefer ONNX when the local model file exists."""
+    if backend is None:
+        backend = "onnx" if os.path.exists(model_path) else "torch"
+    if backend == "onnx":
+        return OnnxSileroEngine(model_path)
+    if backend == "torch":
+        return TorchSileroEngine()
+    raise ValueError(f"Unknown VAD backend '{backend}'. Expected one of {VAD_BACKENDS}")
+
+
+class StreamingVAD:
+    """Scores audio one fixed-size block at a time, keeping the model's state between calls.
+
+    ``process`` takes only the samples that arrived since the last call and
+    returns one speech probability per completed block, in order. Samples that
+    do not fill a block yet are kept in a small remainder buffer rather than
+    re-concatenated with history, so each call costs the same per block no
+    matter how much audio the ring holds. Silero's recurrent state lives inside
+    the engine and is carried forward because every block is scored exactly
+    once and in order; ``reset`` clears it together with the remainder.
+
+    With a ``gate`` (see ``energy_gate.EnergyGate``), blocks the gate is sure
+    are not speech get probability 0.0 without a model call. The engine state
+    is reset when scoring resumes, since the skipped audio never reached it.
+    Every ``audit_every``-th gated block is scored anyway, with the gate's
+    answer still returned. ``last_raw`` and ``last_gated`` hold, per block of
+    the last ``process`` call, the model's own probability (NaN when it was
+    not run) and whether the gate fired.
+    """
+
+    def __init__(
+        self,
+        engine: VADEngine,
+        block_size: int = VAD_BLOCK_SIZE,
+        sample_rate: int = VAD_SAMPLE_RATE,
+        gate=None,
+        audit_every: int = GATE_AUDIT_EVERY,
+    ):
+        self.engine = engine
+        self.gate = gate
+        self.audit_every = audit_every
+        self.block_size = block_size
+        self.sample_rate = sample_rate
+        self.blocks_scored = 0
+        self.blocks_gated = 0
+        self.blocks_audited = 0
+        self.last_raw: List[float] = []
+        self.last_gated: List[bool] = []
+        self._engine_stale = False
+        self._remainder = np.zeros(block_size, dtype=np.float32)
+        self._filled = 0
+
+    @property
+    def pending_samples(self) -> int:
+        return self._filled
+
+    def process(self, audio) -> List[float]:
+        probs: List[float] = []
+        self.last_raw, self.last_gated = [], []
+        total = len(audio)
+        offset = 0
+        if self._filled:
+            take = min(self.block_size - self._filled, total)
+            self._remainder[self._filled : self._filled + take] = audio[:take]
+            self._filled += take
+            offset = take
+            if self._filled < self.block_size:
+                return probs
+            probs.append(self._score(self._remainder))
+            self._filled = 0
+        while total - offset >= self.block_size:
+            probs.append(self._score(audio[offset : offset + self.block_size]))
+            offset += self.block_size
+        if offset < total:
+            tail = total - offset
+            self._remainder[:tail] = audio[offset:]
+            self._filled = tail
+        return probs
+
+    def _score(self, block) -> float:
+        self.blocks_scored += 1
+        if self.gate is not None:
+            prob = self.gate.classify(block)
+            if prob is not None:
+                self.blocks_gated += 1
+                raw = float("nan")
+                if self.audit_every and self.blocks_gated % self.audit_every == 0:
+                    self.blocks_audited += 1
+                    raw = self._model_score(block)
+                else:
+                    self._engine_stale = True
+                self.last_raw.append(raw)
+                self.last_gated.append(True)
+                return prob
+        prob = self._model_score(block)
+        self.last_raw.append(prob)
+        self.last_gated.append(False)
+        return prob
+
+    def _model_score(self, block) -> float:
+        if self._engine_stale:
+            self.engine.reset()
+            self._engine_stale = False
+        try:
+            return self.engine.score(block)
+        except Exception:
+            return 0.0
+
+    def reset(self) -> None:
+        self._filled = 0
+        self._engine_stale = False
+        self.engine.reset()
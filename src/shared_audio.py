@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from multiprocessing import shared_memory
+from typing import Dict, Optional
+
+try:
+    import numpy as np
+except Exception:  # pragma: no cover - fallback for environments without numpy
+    from src.mocks import mock_numpy as np
+
+
+_GENERATION_BYTES = 8
+_SAMPLE_BYTES = 4
+_WRITING = -1
+
+
+def _float_view(buf, offset: int, length: int):
+    return np.frombuffer(buf, dtype=np.float32, count=length, offset=offset)
+
+
+class SharedAudioRing:
+    """Sentinel-side slot ring in ``multiprocessing.shared_memory`` for trigger audio.
+
+    ``write`` copies one trigger window into the next slot and returns a small
+    descriptor (segment name, byte offset, length, generation) that is cheap to
+    pickle through ``queue_sw``. Each slot is prefixed by its generation so a
+    reader can tell when the slot was reused after the descriptor was issued.
+    """
+
+    def __init__(self, slot_samples: int, slots: int = 8, name: Optional[str] = None):
+        self.slot_samples = slot_samples
+        self.slots = slots
+        self._slot_bytes = _GENERATION_BYTES + slot_samples * _SAMPLE_BYTES
+        self._shm = shared_memory.SharedMemory(name=name, create=True, size=self._slot_bytes * slots)
+        self._generation = 0
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    def write(self, audio) -> Dict:
+        length = min(len(audio), self.slot_samples)
+        samples = audio[len(audio) - length :]
+        self._generation += 1
+        slot = (self._generation - 1) % self.slots
+        header = slot * self._slot_bytes
+        offset = header + _GENERATION_BYTES
+        generations = self._shm.buf[header:offset].cast("q")
+        generations[0] = _WRITING
+        _float_view(self._shm.buf, offset, length)[:] = samples
+        generations[0] = self._generation
+        generations.release()
+        return {"shm_name": self.name, "offset": offset, "length": length, "generation": self._generation}
+
+    def close(self) -> None:
+        try:
+            self._shm.close()
+        except BufferError:
+            pass
+        try:
+            self._shm.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class SharedAudioReader:
+    """Worker-side mapper for ``SharedAudioRing`` descriptors.
+
+    Segments are attached lazily by name and cached. ``read`` returns a view into
+    shared memory without copying, or ``None`` when the slot no longer holds the
+    generation the descriptor refers to.
+    """
+
+    def __init__(self):
+        self._segments: Dict[str, shared_memory.SharedMemory] = {}
+
+    def _segment(self, name: str) -> shared_memory.SharedMemory:
+        segment = self._segments.get(name)
+        if segment is None:
+            segment = shared_memory.SharedMemory(name=name)
+            self._segments[name] = segment
+        return segment
+
+    def is_current(self, ref: Dict) -> bool:
+        segment = self._segment(ref["shm_name"])
+        header = ref["offset"] - _GENERATION_BYTES
+        generations = segment.buf[header : ref["offset"]].cast("q")
+        current = generations[0] == ref["generation"]
+        generations.release()
+        return current
+
+    def read(self, ref: Dict):
+        try:
+            if not self.is_current(ref):
+                return None
+        except FileNotFoundError:
+            return None
+        segment = self._segment(ref["shm_name"])
+        return _float_view(segment.buf, ref["offset"], ref["length"])
+
+    def resolve(self, event: Dict):
+        """Return trigger audio whether it travelled inline or by shared-memory reference."""
+        ref = event.get("audio_ref")
+        if ref is None:
+            return event["audio"]
+        return self.read(ref)
+
+    def close(self) -> None:
+        for segment in self._segments.values():
+            try:
+                segment.close()
+            except BufferError:
+                # A caller still holds a view; the mapping goes away with the process.
+                pass
+        self._segments.clear()
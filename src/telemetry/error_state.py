@@ -1,18 +1,29 @@
 import time
 from collections import deque
-from typing import Deque
+from typing import Deque, Dict, Set
 
 from src.telemetry.telemetry_writer import write_event
 
 
 class ErrorStateManager:
-    STATES = {"SILENT_FAIL", "RETRY", "RECOVERED", "SUPPRESSED", "FATAL"}
+    STATES = {"SILENT_FAIL", "RETRY", "RECOVERED", "SUPPRESSED", "FATAL", "SIGNAL_DEGRADED"}
 
-    def __init__(self, window_sec: float = 10.0) -> None:
+    def __init__(
+        self,
+        window_sec: float = 10.0,
+        clipping_limit: float = 0.01,
+        dc_offset_limit: float = 0.05,
+        signal_persist_blocks: int = 16,
+    ) -> None:
         self.window_sec = window_sec
         self.whisper_failures: Deque[float] = deque()
         self.vad_inactive_since: float | None = None
         self.safe_mode = False
+        self.clipping_limit = clipping_limit
+        self.dc_offset_limit = dc_offset_limit
+        self.signal_persist_blocks = signal_persist_blocks
+        self.signal_issues: Set[str] = set()
+        self._issue_streaks: Dict[str, int] = {"clipping": 0, "dc_offset": 0}
 
     def record_whisper_failure(self) -> None:
         now = time.monotonic()
@@ -35,6 +46,26 @@ class ErrorStateManager:
             self.safe_mode = True
             write_event({"type": "ERROR", "state": "SILENT_FAIL", "message": "VAD inactive"})
 
+    def record_signal_health(self, health) -> None:
+        """Raise or clear mic issues from a ``SignalHealth`` once they persist for ``signal_persist_blocks``."""
+        observed = {
+            "clipping": health.clipping_ratio > self.clipping_limit,
+            "dc_offset": abs(health.dc_offset) > self.dc_offset_limit,
+        }
+        for issue, present in observed.items():
+            active = issue in self.signal_issues
+            streak = self._issue_streaks[issue] + 1 if present != active else 0
+            self._issue_streaks[issue] = streak
+            if streak < self.signal_persist_blocks:
+                continue
+            self._issue_streaks[issue] = 0
+            if present:
+                self.signal_issues.add(issue)
+                write_event({"type": "ERROR", "state": "SIGNAL_DEGRADED", "issue": issue, **health.as_dict()})
+            else:
+                self.signal_issues.discard(issue)
+                write_event({"type": "ERROR", "state": "RECOVERED", "issue": issue})
+
     def clear_vad_inactivity(self) -> None:
         self.vad_inactive_since = None
 
@@ -1,5 +1,9 @@
+import math
+import queue
 import time
-from typing import Dict, Tuple
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 
 try:
     import numpy as np
@@ -9,17 +13,148 @@ except Exception:  # pragma: no cover
 from src.cache.anti_repeat import AntiRepeatCache
 from src.cache.latency_history import LatencyHistory
 from src.cache.warm_start import warm_start_whisper
+from src.contracts import SILENCE_ABORT, SILENCE_COMMIT, SILENCE_EVENT_FIELDS, SILENCE_PROVISIONAL
 from src.interfaces import Governor, IntentClassifier, LatencyTracker, RepeatFilter, STTEngine
 from src.telemetry.drift_detector import DriftDetector
 from src.telemetry.error_state import ErrorStateManager
+from src.telemetry.histogram import LatencyHistogram
 from src.telemetry.prompt_quality import PromptQualityMonitor
 from src.telemetry.telemetry_aggregator import TelemetryAggregator
+from src.telemetry.telemetry_writer import write_event
+
+
+# Triggers whose VAD track is mostly non-speech are false triggers; transcribing them
+# only produces hallucinations such as "Thank you."
+MIN_SPEECH_RATIO = 0.1
+WHISPER_SAMPLE_RATE = 16000
+# Whisper pads every input to a 30 s mel window. Short-form mode instead pads to the
+# smallest of these lengths that fits the clip, so the encoder only runs over the
+# clip. Checked against the padded path with tools/verify_short_form_whisper.py.
+SHORT_FORM_BUCKETS_S = (2, 4, 8, 16, 30)
+WHISPER_BUCKETS_MS = (25.0, 50.0, 100.0, 150.0, 200.0, 300.0, 500.0, 750.0, 1000.0, 1500.0, 2000.0)
+# End-to-end budget from the trigger's capture time to a usable result.
+LATENCY_BUDGET_SEC = 1.5
+WHISPER_MODEL = "tiny.en"
+# A segment ending this close to the end of the audio is the last one.
+SEGMENT_END_SLACK_SEC = 0.2
+
+
+@dataclass(frozen=True)
+class DecodingTier:
+    """Whisper settings used while at least ``min_remaining_ms`` of the event's budget is left.
+
+    ``max_tokens_per_sec`` caps ``max_new_tokens`` by clip duration (None for
+    no cap); ``temperatures`` with more than one value allow faster-whisper's
+    temperature fallback, which re-decodes the clip.
+    """
+
+    name: str
+    min_remaining_ms: float
+    model: str = WHISPER_MODEL
+    beam_size: int = 1
+    max_tokens_per_sec: Optional[float] = None
+    temperatures: Tuple[float, ...] = (0.0,)
+    without_timestamps: bool = False
+
+
+# Ordered from most to least expensive. Conversational speech runs at about 3 words
+# (4 tokens) per second, so the caps leave slack for fast talkers while stopping a
+# hallucination loop early. Below the last tier the result would arrive too late to use.
+# Every tier keeps WHISPER_MODEL: tiny.en is already the smallest English checkpoint,
+# so the tiers only trade beam size, temperature fallback and token caps. With a larger
+# WHISPER_MODEL, give the lower tiers model="tiny.en" and it is loaded at start-up.
+DECODING_TIERS = (
+    DecodingTier("full", min_remaining_ms=900.0),
+    DecodingTier("fast", min_remaining_ms=450.0, max_tokens_per_sec=8.0, without_timestamps=True),
+    DecodingTier("minimal", min_remaining_ms=150.0, max_tokens_per_sec=5.0, without_timestamps=True),
+)
+
+
+def select_tier(remaining_ms: Optional[float], tiers: Sequence[DecodingTier] = DECODING_TIERS) -> Optional[DecodingTier]:
+    """First tier the remaining budget allows; the top tier without a deadline, None when too late."""
+    if remaining_ms is None:
+        return tiers[0]
+    for tier in tiers:
+        if remaining_ms >= tier.min_remaining_ms:
+            return tier
+    return None
+
+
+def short_form_bucket(num_samples: int, buckets=SHORT_FORM_BUCKETS_S, sample_rate: int = WHISPER_SAMPLE_RATE) -> int:
+    """Smallest bucket (seconds) that holds ``num_samples``; the largest one for longer clips."""
+    duration = num_samples / sample_rate
+    for bucket in buckets:
+        if duration <= bucket:
+            return bucket
+    return buckets[-1]
+
+
+def is_short_form_rejection(exc: Exception) -> bool:
+    """True when faster-whisper or CTranslate2 refuses a mel window shorter than 30 s.
+
+    Older faster-whisper has no ``chunk_length`` argument (TypeError); models
+    exported for a fixed 3000-frame input reject shorter features (ValueError
+    naming the input shape).
+    """
+    message = str(exc)
+    if isinstance(exc, TypeError):
+        return "chunk_length" in message
+    return isinstance(exc, ValueError) and "shape" in message
+
+
+def event_audio_sec(event: Dict, sample_rate: int = WHISPER_SAMPLE_RATE) -> float:
+    """Clip length of a silence event, from its shared-memory reference or inline audio."""
+    ref = event.get("audio_ref")
+    if ref is not None:
+        return ref["length"] / sample_rate
+    audio = event.get("audio")
+    return len(audio) / sample_rate if audio is not None else 0.0
 
 
 class InferenceService(STTEngine):
-    def __init__(self, use_mock: bool, error_state: ErrorStateManager):
+    """Whisper transcription that trusts the sentinel's VAD track when the event carries one.
+
+    With a ``vad_track`` (see ``contracts.read_vad_track``) audio below
+    ``MIN_SPEECH_RATIO`` is not transcribed at all, and otherwise only the
+    speech segments are decoded through faster-whisper's ``clip_timestamps``.
+
+    With ``short_form`` the mel window is bounded to the clip's bucket through
+    faster-whisper's ``chunk_length``. If the installed faster-whisper or
+    CTranslate2 rejects a short window (``is_short_form_rejection``),
+    short-form is switched off for good and the clip is rerun on the padded
+    path. Any other error goes through the usual retry and whisper-failure
+    accounting. Latency is kept per bucket in ``bucket_latency``.
+
+    Given a ``deadline`` (monotonic seconds), the decoding tier follows from
+    the time left (see ``DECODING_TIERS``); with too little left the clip is
+    skipped, as its result would be suppressed as late anyway. The tier used
+    is reported in the result. Models named by the tiers are loaded up front.
+
+    faster-whisper decodes lazily, one segment per ``next``. Between segments
+    the service stops pulling once the deadline passes or ``should_cancel``
+    returns True, closes the generator and returns what it has, with
+    ``truncated`` and ``cancel_reason`` set. A segment that reaches the end of
+    the audio finishes the transcript without a check. A segment already being decoded
+    runs to completion; CTranslate2 cannot be interrupted mid-call.
+    """
+
+    def __init__(
+        self,
+        use_mock: bool,
+        error_state: ErrorStateManager,
+        min_speech_ratio: float = MIN_SPEECH_RATIO,
+        short_form: bool = True,
+        buckets=SHORT_FORM_BUCKETS_S,
+        tiers: Sequence[DecodingTier] = DECODING_TIERS,
+    ):
         self.use_mock = use_mock
         self.error_state = error_state
+        self.min_speech_ratio = min_speech_ratio
+        self.short_form = short_form
+        self.buckets = tuple(buckets)
+        self.bucket_latency: Dict[int, LatencyHistogram] = {}
+        self.tiers = tuple(tiers)
+        self._models: Dict[str, object] = {}
         if use_mock:
             from src.mocks.mock_whisper import transcribe_mock
 
@@ -28,39 +163,120 @@ class InferenceService(STTEngine):
         else:
             from faster_whisper import WhisperModel
 
-            self._stt = WhisperModel("tiny.en", device="cpu", compute_type="int8")
+            self._stt = WhisperModel(WHISPER_MODEL, device="cpu", compute_type="int8")
             warm_start_whisper(self._stt)
+            for model in {tier.model for tier in self.tiers} - {WHISPER_MODEL}:
+                self._models[model] = WhisperModel(model, device="cpu", compute_type="int8")
+                warm_start_whisper(self._models[model])
             self._mock = None
 
-    def transcribe(self, audio) -> Dict[str, float | str]:
+    @staticmethod
+    def _collect(segments, stop: Callable[[], Optional[str]], audio_end: float) -> Tuple[str, Optional[str]]:
+        texts = []
+        reason = None
+        for segment in segments:
+            texts.append(segment.text)
+            if getattr(segment, "end", 0.0) >= audio_end - SEGMENT_END_SLACK_SEC:
+                break
+            reason = stop()
+            if reason is not None:
+                if hasattr(segments, "close"):
+                    segments.close()
+                break
+        return " ".join(texts).strip(), reason
+
+    def _run(self, audio, clip_timestamps, bucket: int, tier: DecodingTier, stop: Callable[[], Optional[str]]):
+        stt = self._models.get(tier.model, self._stt)
+        options = {
+            "beam_size": tier.beam_size,
+            "language": "en",
+            "temperature": tier.temperatures[0] if len(tier.temperatures) == 1 else list(tier.temperatures),
+        }
+        if tier.max_tokens_per_sec is not None:
+            options["max_new_tokens"] = math.ceil(len(audio) / WHISPER_SAMPLE_RATE * tier.max_tokens_per_sec) + 4
+        if tier.without_timestamps:
+            options["without_timestamps"] = True
+        if clip_timestamps:
+            options["clip_timestamps"] = clip_timestamps
+        audio_end = clip_timestamps[-1] if clip_timestamps else len(audio) / WHISPER_SAMPLE_RATE
+        if bucket < 30:
+            try:
+                segments, info = stt.transcribe(audio, chunk_length=bucket, **options)
+                return self._collect(segments, stop, audio_end)
+            except (TypeError, ValueError) as exc:
+                if not is_short_form_rejection(exc):
+                    raise
+                self.short_form = False
+                write_event({"type": "WHISPER_SHORT_FORM_DISABLED", "bucket_s": bucket, "error": repr(exc)})
+        segments, info = stt.transcribe(audio, **options)
+        return self._collect(segments, stop, audio_end)
+
+    def _record_bucket(self, bucket: int, latency: float) -> None:
+        histogram = self.bucket_latency.get(bucket)
+        if histogram is None:
+            histogram = self.bucket_latency[bucket] = LatencyHistogram(WHISPER_BUCKETS_MS)
+        histogram.record(latency * 1000)
+
+    def transcribe(
+        self,
+        audio,
+        vad_track: Optional[Dict] = None,
+        deadline: Optional[float] = None,
+        should_cancel: Optional[Callable[[], bool]] = None,
+    ) -> Dict[str, float | str]:
+        clip_timestamps = None
+        if vad_track is not None:
+            if vad_track["speech_ratio"] < self.min_speech_ratio:
+                return {"text": "", "latency": 0.0, "skipped": "no_speech", "speech_ratio": vad_track["speech_ratio"]}
+            clip_timestamps = [bound for segment in vad_track["speech_segments"] for bound in segment]
+        remaining_ms = (deadline - time.monotonic()) * 1000 if deadline is not None else None
+        tier = select_tier(remaining_ms, self.tiers)
+        if tier is None:
+            return {"text": "", "latency": 0.0, "skipped": "deadline", "remaining_ms": remaining_ms}
+
         if self.use_mock:
             text, latency = self._mock(audio)
-            return {"text": text, "latency": latency}
+            return {"text": text, "latency": latency, "tier": tier.name}
 
+        def stop() -> Optional[str]:
+            if deadline is not None and time.monotonic() >= deadline:
+                return "deadline"
+            if should_cancel is not None and should_cancel():
+                return "superseded"
+            return None
+
+        bucket = short_form_bucket(len(audio), self.buckets) if self.short_form else 30
         text = ""
         latency = 0.0
+        reason = None
         try:
             if self.error_state.should_use_safe_mode():
                 text = "[safe-mode-transcript]"
                 latency = 0.0
             else:
                 start = time.monotonic()
-                segments, info = self._stt.transcribe(audio, beam_size=1, language="en", temperature=0.0)
-                text = " ".join([segment.text for segment in segments]).strip() or "[no-transcript]"
+                text, reason = self._run(audio, clip_timestamps, bucket, tier, stop)
+                text = text or "[no-transcript]"
                 latency = time.monotonic() - start
                 self.error_state.clear_vad_inactivity()
         except Exception:
             self.error_state.record_whisper_failure()
             time.sleep(0.32)
             try:
-                segments, info = self._stt.transcribe(audio, beam_size=1, language="en", temperature=0.0)
-                text = " ".join([segment.text for segment in segments]).strip() or "[retry-no-transcript]"
+                text, reason = self._run(audio, clip_timestamps, bucket, tier, stop)
+                text = text or "[retry-no-transcript]"
                 latency = time.monotonic() - start  # type: ignore[name-defined]
             except Exception:
                 self.error_state.record_whisper_failure()
                 text = "[whisper-failed]"
                 latency = 0.0
-        return {"text": text, "latency": latency}
+        if latency:
+            bucket = bucket if self.short_form else 30
+            self._record_bucket(bucket, latency)
+        result = {"text": text, "latency": latency, "bucket_s": bucket, "tier": tier.name}
+        if reason is not None:
+            result.update({"truncated": True, "cancel_reason": reason})
+        return result
 
 
 class IntentService(IntentClassifier):
@@ -104,7 +320,7 @@ class GovernorService(Governor):
 
     def decide(self, event, transport_delay: float, whisper_latency: float, intent_latency: float) -> Dict[str, str]:
         event_age = time.monotonic() - event["timestamp"]
-        decision = "SUCCESS" if event_age <= 1.5 else "SUPPRESSED_LATE"
+        decision = "SUCCESS" if event_age <= LATENCY_BUDGET_SEC else "SUPPRESSED_LATE"
         score_diff = abs(event.get("score", 0.0) - event.get("previous_score", 0.0)) if "score" in event else 0.0
         prompt_id = str(event.get("prompt_id", ""))
         if decision == "SUCCESS" and self.repeat_filter.should_suppress(prompt_id, score_diff):
@@ -127,12 +343,15 @@ class LatencyMonitor(LatencyTracker):
         self.telemetry = TelemetryAggregator()
         self.drift_detector = DriftDetector()
 
-    def record(self, whisper_latency: float, intent_latency: float, total_age: float, decision: str):
+    def record(
+        self, whisper_latency: float, intent_latency: float, total_age: float, decision: str, audio_sec: Optional[float] = None
+    ):
         record = {
             "whisper_latency": whisper_latency,
             "intent_latency": intent_latency,
             "event_age": total_age,
             "decision": decision,
+            "audio_sec": audio_sec,
         }
         self.history.add(record)
         metrics = self.history.log_warnings()
@@ -141,6 +360,67 @@ class LatencyMonitor(LatencyTracker):
         return metrics
 
 
+class AdmissionController:
+    """Skips events predicted to miss the latency budget before any inference runs.
+
+    Predicted age at completion is the event's current age, plus Whisper time
+    from a line fitted to clip length over recent ``LatencyHistory`` records
+    (with the fit's p90 residual as margin), plus the ``TelemetryAggregator``
+    p95 intent time. Until ``min_records`` results exist every event is
+    admitted. ``predict`` returns None in that case.
+
+    The fit only learns from admitted events, so a slow stretch could lock
+    admission out for good. Records older than ``max_sample_age_sec`` are left
+    out of the fit, and once nothing has been admitted for ``probe_after_sec``
+    the next event is admitted anyway as a probe (counted in ``probes``), so
+    fresh samples keep arriving.
+    """
+
+    def __init__(
+        self,
+        latency_monitor: "LatencyMonitor",
+        budget_sec: float = LATENCY_BUDGET_SEC,
+        min_records: int = 8,
+        max_sample_age_sec: float = 60.0,
+        probe_after_sec: float = 5.0,
+    ):
+        self.latency_monitor = latency_monitor
+        self.budget_sec = budget_sec
+        self.min_records = min_records
+        self.max_sample_age_sec = max_sample_age_sec
+        self.probe_after_sec = probe_after_sec
+        self.probes = 0
+        self._last_admitted: Optional[float] = None
+
+    def predict(self, event_age: float, audio_sec: float, now: Optional[float] = None) -> Optional[float]:
+        fit = self.latency_monitor.history.fit_whisper_latency(self.min_records, self.max_sample_age_sec, now)
+        if fit is None:
+            return None
+        intercept, slope, margin = fit
+        intent_sec = self.latency_monitor.telemetry.summary()["intent_p95"]
+        return event_age + intercept + slope * audio_sec + margin + intent_sec
+
+    def service_time(self, audio_sec: float) -> float:
+        """Predicted Whisper plus intent time for a clip; 0.0 until the fit exists."""
+        predicted = self.predict(0.0, audio_sec)
+        return predicted if predicted is not None else 0.0
+
+    def admit(self, event: Dict, audio_sec: float, now: Optional[float] = None) -> Tuple[bool, Optional[float]]:
+        """Whether to run ``event`` and the predicted age (seconds) at completion."""
+        now = time.monotonic() if now is None else now
+        predicted = self.predict(now - event["timestamp"], audio_sec, now)
+        admitted = predicted is None or predicted <= self.budget_sec
+        if not admitted:
+            if self._last_admitted is None:
+                self._last_admitted = now
+            elif now - self._last_admitted >= self.probe_after_sec:
+                self.probes += 1
+                admitted = True
+        if admitted:
+            self._last_admitted = now
+        return admitted, predicted
+
+
 class RepeatFilterAdapter(RepeatFilter):
     def __init__(self):
         self.cache = AntiRepeatCache()
@@ -152,17 +432,173 @@ class RepeatFilterAdapter(RepeatFilter):
         self.cache.record(prompt_id)
 
 
-class BackpressureController:
-    def __init__(self, threshold: int = 3):
-        self.threshold = threshold
+SCHEDULING_POLICIES = ("newest_first", "edf")
 
-    def drop_oldest(self, queue_sw):
-        dropped_ids = []
-        try:
-            while queue_sw.qsize() > self.threshold:
-                dropped = queue_sw.get_nowait()
-                if dropped:
-                    dropped_ids.append(dropped.get("id"))
-        except NotImplementedError:
-            pass
-        return dropped_ids
+
+class TriggerScheduler:
+    """Picks the worker's next silence event from everything pending, instead of FIFO.
+
+    Each ``next_event`` drains all events waiting in ``queue_sw`` into a local
+    pending list. The worker is the queue's only reader, so no ``qsize`` check
+    can race. It then drops events that can no longer be useful:
+
+    - a provisional whose abort is pending ("aborted"); the abort itself still
+      goes out, so each gap is counted once;
+    - a provisional whose commit is pending, since the commit carries its own
+      audio ("committed");
+    - a trigger a pending widened trigger ``supersedes`` ("superseded");
+    - anything past ``timestamp + budget_sec`` ("expired");
+    - beyond ``max_pending``, the lowest-priority triggers ("overflow").
+
+    The rest are ordered newest-first or earliest-deadline-first and the best
+    is returned; the others stay pending and are re-ranked on the next call.
+    The EDF deadline is the latest start that still meets the budget,
+    ``timestamp + budget_sec - service_time(audio_sec)``, so a long clip that
+    arrived later can go ahead of a short one that arrived earlier. Without
+    ``service_time`` (e.g. ``AdmissionController.service_time``) it reduces to
+    oldest-first.
+    Aborts and MIC_DEAD notices go out ahead of triggers. ``dropped`` counts drops by reason.
+
+    ``has_newer_trigger`` lets an in-flight decode check, without blocking,
+    whether a newer trigger or commit has arrived that would make it moot;
+    ``has_abort_for`` does the same for a provisional whose abort has arrived.
+    """
+
+    def __init__(
+        self,
+        policy: str = "newest_first",
+        budget_sec: float = LATENCY_BUDGET_SEC,
+        max_pending: int = 3,
+        service_time: Optional[Callable[[float], float]] = None,
+    ):
+        if policy not in SCHEDULING_POLICIES:
+            raise ValueError(f"Unknown scheduling policy '{policy}'. Expected one of {SCHEDULING_POLICIES}")
+        self.policy = policy
+        self.budget_sec = budget_sec
+        self.max_pending = max_pending
+        self.service_time = service_time
+        self.dropped: Dict[str, int] = {}
+        self._pending: List[Dict] = []
+
+    def _drain(self, queue_sw, timeout: Optional[float]) -> None:
+        if not self._pending:
+            try:
+                self._pending.append(queue_sw.get(timeout=timeout))
+            except queue.Empty:
+                return
+        self._drain_nowait(queue_sw)
+
+    def _drain_nowait(self, queue_sw) -> None:
+        while True:
+            try:
+                self._pending.append(queue_sw.get_nowait())
+            except queue.Empty:
+                return
+
+    def _drop_reason(self, event: Dict, event_type: str, pending: List[Dict], now: float) -> Optional[str]:
+        if event_type == SILENCE_PROVISIONAL:
+            for other in pending:
+                if other.get("provisional_id") == event["id"]:
+                    return "aborted" if other.get("type") == SILENCE_ABORT else "committed"
+        if any(other.get("supersedes") == event["id"] for other in pending):
+            return "superseded"
+        if event["timestamp"] + self.budget_sec <= now:
+            return "expired"
+        return None
+
+    def _latest_start(self, event: Dict) -> float:
+        service_sec = self.service_time(event_audio_sec(event)) if self.service_time is not None else 0.0
+        return event["timestamp"] + self.budget_sec - service_sec
+
+    def has_newer_trigger(self, queue_sw, event: Dict) -> bool:
+        """True if a SILENCE_TRIGGER or SILENCE_COMMIT newer than ``event`` is pending.
+
+        MIC_DEAD notices, aborts and provisionals do not count: serving them
+        does not replace the transcript of ``event``.
+        """
+        self._drain_nowait(queue_sw)
+        return any(
+            other
+            and other.get("type", "SILENCE_TRIGGER") in ("SILENCE_TRIGGER", SILENCE_COMMIT)
+            and other["timestamp"] > event["timestamp"]
+            for other in self._pending
+        )
+
+    def has_abort_for(self, queue_sw, provisional_id: str) -> bool:
+        """True if a SILENCE_ABORT for ``provisional_id`` is pending; its commit does not count."""
+        self._drain_nowait(queue_sw)
+        return any(
+            other and other.get("type") == SILENCE_ABORT and other.get("provisional_id") == provisional_id
+            for other in self._pending
+        )
+
+    def next_event(self, queue_sw, timeout: Optional[float] = None, now: Optional[float] = None):
+        """Returns ``(event or None, [(event_id, reason), ...] dropped by this call)``."""
+        self._drain(queue_sw, timeout)
+        now = time.monotonic() if now is None else now
+        pending = [event for event in self._pending if event]
+        control: List[Dict] = []
+        triggers: List[Dict] = []
+        drops: List[Tuple[str, str]] = []
+        for event in pending:
+            event_type = event.get("type", "SILENCE_TRIGGER")
+            if event_type == SILENCE_ABORT:
+                # Its provisional, if still pending, is the one dropped; the abort itself
+                # goes out so the worker's ProvisionalCache learns of it.
+                control.append(event)
+                continue
+            if event_type not in SILENCE_EVENT_FIELDS:
+                control.append(event)
+                continue
+            reason = self._drop_reason(event, event_type, pending, now)
+            if reason is not None:
+                drops.append((event["id"], reason))
+            else:
+                triggers.append(event)
+
+        if self.policy == "newest_first":
+            triggers.sort(key=lambda event: event["timestamp"], reverse=True)
+        else:
+            triggers.sort(key=self._latest_start)
+        drops.extend((event["id"], "overflow") for event in triggers[self.max_pending :])
+        ordered = control + triggers[: self.max_pending]
+        for _event_id, reason in drops:
+            self.dropped[reason] = self.dropped.get(reason, 0) + 1
+        self._pending = ordered[1:]
+        return (ordered[0] if ordered else None), drops
+
+
+class ProvisionalCache:
+    """Inference results of SILENCE_PROVISIONAL events waiting for their commit or abort.
+
+    Both maps are bounded, so results whose commit or abort was dropped by
+    the scheduler age out instead of accumulating.
+    """
+
+    def __init__(self, max_entries: int = 8):
+        self.max_entries = max_entries
+        self._results: "OrderedDict[str, Dict]" = OrderedDict()
+        self._aborted: "OrderedDict[str, None]" = OrderedDict()
+
+    def _bounded_put(self, target: OrderedDict, key: str, value) -> None:
+        target[key] = value
+        while len(target) > self.max_entries:
+            target.popitem(last=False)
+
+    def store(self, provisional_id: str, inference_result: Dict) -> None:
+        self._bounded_put(self._results, provisional_id, inference_result)
+
+    def take(self, provisional_id: Optional[str]) -> Optional[Dict]:
+        if provisional_id is None:
+            return None
+        return self._results.pop(provisional_id, None)
+
+    def abort(self, provisional_id: str) -> bool:
+        """Discard the cached result; if none exists yet, remember the abort. True if work was discarded."""
+        if self._results.pop(provisional_id, None) is not None:
+            return True
+        self._bounded_put(self._aborted, provisional_id, None)
+        return False
+
+    def is_aborted(self, provisional_id: str) -> bool:
+        return self._aborted.pop(provisional_id, "missing") is None
@@ -37,26 +37,29 @@ class WhisperWorker(threading.Thread):
         self.vad_model = vad_model
         self.silence_policy = silence_policy
         self._stop_event = threading.Event()
-        self._last_sequence = ring_buffer.sequence
+        self._reader = ring_buffer.register_reader("whisper", from_oldest=True)
 
     def stop(self) -> None:
         self._stop_event.set()
+        self._reader.close()
 
     def run(self) -> None:  # pragma: no cover - threading
         while not self._stop_event.is_set():
-            try:
-                self._last_sequence = self.ring_buffer.wait_for_new_data(
-                    last_sequence=self._last_sequence, timeout=0.5
-                )
-            except Exception:
+            if not self._reader.wait(timeout=0.5):
                 continue
 
             if self._stop_event.is_set():
                 break
 
+            # The cursor only tracks wakeups and lag; Whisper always gets the full newest window,
+            # so a burst still collapses to one decode.
+            if self._reader.advance() == 0:
+                continue
             audio = self.ring_buffer.read_latest(max_frames=self.frames_per_window)
             if audio is None or len(audio) == 0:
                 continue
+            # read_latest may hand back a view into the ring; inference outlives it.
+            audio = audio.copy()
 
             speech_prob = None
             if self.vad_model:
@@ -2,37 +2,37 @@ import sys
 import time
 from typing import Tuple, Optional
 
-try:
-    import numpy as np
-except Exception:  # pragma: no cover - fallback for environments without numpy
-    from src.mocks import mock_numpy as np
-
 from src.contracts import (
-    SILENCE_TRIGGER_FIELDS,
+    SILENCE_ABORT,
+    SILENCE_EVENT_FIELDS,
+    SILENCE_PROVISIONAL,
     WORKER_RESULT_FIELDS,
     create_worker_result,
     ensure_schema_keys,
+    read_vad_track,
 )
 from src.debug.debug_pipeline import log_latency
 from src.logging.structured_logger import log_event
+from src.shared_audio import SharedAudioReader
 from src.telemetry.error_state import ErrorStateManager
 from src.telemetry.event_inspector import inspect_event
 from src.telemetry.prompt_quality import PromptQualityMonitor
 from src.telemetry.telemetry_writer import write_event
 from src.telemetry.watchdog import PipelineWatchdog
 from src.worker.services import (
-    BackpressureController,
+    LATENCY_BUDGET_SEC,
+    WHISPER_SAMPLE_RATE,
+    AdmissionController,
     GovernorService,
     InferenceService,
     IntentService,
     LatencyMonitor,
+    ProvisionalCache,
     RepeatFilterAdapter,
+    TriggerScheduler,
 )
 
 
-BACKPRESSURE_THRESHOLD = 3
-
-
 def worker_process(queue_sw, queue_wp, use_mock: bool = False, mock_event_limit: int | None = None, services: Optional[dict] = None):
     sys.stdout.reconfigure(encoding="utf-8")
 
@@ -46,30 +46,99 @@ def worker_process(queue_sw, queue_wp, use_mock: bool = False, mock_event_limit:
         RepeatFilterAdapter(), inference_service.error_state, svc.get("prompt_quality") if svc else PromptQualityMonitor()
     )
     latency_monitor: LatencyMonitor = svc.get("latency_monitor") or LatencyMonitor()
-    backpressure: BackpressureController = svc.get("backpressure") or BackpressureController(BACKPRESSURE_THRESHOLD)
+    admission: AdmissionController = svc.get("admission") or AdmissionController(latency_monitor)
+    scheduler: TriggerScheduler = svc.get("scheduler") or TriggerScheduler(service_time=admission.service_time)
     error_state = getattr(inference_service, "error_state", None)
+    audio_reader: SharedAudioReader = svc.get("audio_reader") or SharedAudioReader()
+    provisional: ProvisionalCache = svc.get("provisional_cache") or ProvisionalCache()
     watchdog = PipelineWatchdog()
 
     processed = 0
 
     while True:
-        dropped_ids = backpressure.drop_oldest(queue_sw)
-        for dropped_id in dropped_ids:
-            log_event({"type": "SUPPRESSED_BACKPRESSURE", "event_id": dropped_id})
-            write_event({"type": "SUPPRESSED_BACKPRESSURE", "event_id": dropped_id})
-
-        event = queue_sw.get()
+        event, drops = scheduler.next_event(queue_sw)
+        for dropped_id, reason in drops:
+            dropped = {"type": "SUPPRESSED_SCHEDULER", "event_id": dropped_id, "reason": reason}
+            log_event(dropped)
+            write_event(dropped)
         if not event or event.get("type") == "MIC_DEAD":
             continue
-        ensure_schema_keys(event, SILENCE_TRIGGER_FIELDS, "SILENCE_TRIGGER")
-        if not inspect_event(event, SILENCE_TRIGGER_FIELDS, "SILENCE_TRIGGER"):
+        event_type = event.get("type", "SILENCE_TRIGGER")
+        fields = SILENCE_EVENT_FIELDS.get(event_type, SILENCE_EVENT_FIELDS["SILENCE_TRIGGER"])
+        ensure_schema_keys(event, fields, event_type)
+        if not inspect_event(event, fields, event_type):
             continue
 
-        worker_start_ts = time.monotonic()
-        watchdog.start(event["id"])
-        audio = event["audio"].astype(np.float32)
+        if event_type == SILENCE_ABORT:
+            discarded = provisional.abort(event["provisional_id"])
+            write_event({"type": "PROVISIONAL_ABORTED", "event_id": event["provisional_id"], "discarded": discarded})
+            continue
+        if event_type == SILENCE_PROVISIONAL and provisional.is_aborted(event["id"]):
+            continue
 
-        inference_result = inference_service.transcribe(audio)
+        worker_start_ts = time.monotonic()
+        predicted_age = None
+        inference_result = provisional.take(event.get("provisional_id"))
+        if inference_result is not None:
+            write_event(
+                {
+                    "type": "PROVISIONAL_COMMITTED",
+                    "event_id": event["id"],
+                    "provisional_id": event["provisional_id"],
+                    "whisper_ms": float(inference_result["latency"]) * 1000,
+                }
+            )
+        else:
+            audio = audio_reader.resolve(event)
+            if audio is None:
+                log_event({"type": "SUPPRESSED_STALE_AUDIO", "event_id": event["id"]})
+                write_event({"type": "SUPPRESSED_STALE_AUDIO", "event_id": event["id"]})
+                continue
+            audio_sec = len(audio) / WHISPER_SAMPLE_RATE
+            if event_type != SILENCE_PROVISIONAL:
+                # A provisional is judged by its commit, which carries a later timestamp.
+                admitted, predicted_age = admission.admit(event, audio_sec)
+                if not admitted:
+                    rejected = {"type": "SUPPRESSED_PREDICTED_LATE", "event_id": event["id"], "predicted_ms": predicted_age * 1000}
+                    log_event(rejected)
+                    write_event(rejected)
+                    continue
+            watchdog.start(event["id"])
+
+            # Decoding stops early once the event is past its budget, once a newer trigger or
+            # commit is queued, or, for a provisional (whose commit is expected next), once its
+            # abort is queued.
+            deadline = event["timestamp"] + LATENCY_BUDGET_SEC
+            should_cancel = (
+                (lambda: scheduler.has_abort_for(queue_sw, event["id"]))
+                if event_type == SILENCE_PROVISIONAL
+                else (lambda: scheduler.has_newer_trigger(queue_sw, event))
+            )
+            inference_result = inference_service.transcribe(
+                audio, read_vad_track(event), deadline=deadline, should_cancel=should_cancel
+            )
+            inference_result["audio_sec"] = audio_sec
+            if "audio_ref" in event and not audio_reader.is_current(event["audio_ref"]):
+                # The slot was reused mid-decode, so the transcript may mix two clips.
+                log_event({"type": "AUDIO_OVERWRITTEN", "event_id": event["id"]})
+                write_event({"type": "AUDIO_OVERWRITTEN", "event_id": event["id"]})
+                watchdog.clear(event["id"])
+                continue
+            if event_type == SILENCE_PROVISIONAL:
+                # Held until the sentinel commits or aborts this gap.
+                provisional.store(event["id"], inference_result)
+                watchdog.clear(event["id"])
+                continue
+        if inference_result.get("skipped"):
+            # No speech in the sentinel's VAD track, or too little budget left for any decoding tier.
+            if inference_result["skipped"] == "deadline":
+                skipped = {"type": "SUPPRESSED_LATE", "event_id": event["id"], "remaining_ms": inference_result.get("remaining_ms")}
+            else:
+                skipped = {"type": "SUPPRESSED_NO_SPEECH", "event_id": event["id"], "speech_ratio": inference_result.get("speech_ratio")}
+            log_event(skipped)
+            write_event(skipped)
+            watchdog.clear(event["id"])
+            continue
         text = inference_result["text"]
         whisper_latency = float(inference_result["latency"])
 
@@ -84,10 +153,24 @@ def worker_process(queue_sw, queue_wp, use_mock: bool = False, mock_event_limit:
         whisper_ms = whisper_latency * 1000
         intent_ms = intent_latency * 1000
         total_ms = event_age * 1000
+        speech_end_ts = event.get("speech_end_timestamp")
+        glass_ms = (time.monotonic() - speech_end_ts) * 1000 if speech_end_ts is not None else None
 
         decision_info = governor.decide({"timestamp": event["timestamp"], "prompt_id": best_idx, "score": best_score}, transport_latency, whisper_latency, intent_latency)
         decision = decision_info["decision"]
-        metrics = latency_monitor.record(whisper_latency, intent_latency, event_age, decision)
+        metrics = latency_monitor.record(
+            whisper_latency, intent_latency, event_age, decision, audio_sec=inference_result.get("audio_sec")
+        )
+        if predicted_age is not None:
+            write_event(
+                {
+                    "type": "ADMISSION_PREDICTION",
+                    "event_id": event["id"],
+                    "predicted_ms": predicted_age * 1000,
+                    "actual_ms": event_age * 1000,
+                    "error_ms": (event_age - predicted_age) * 1000,
+                }
+            )
 
         result = create_worker_result(
             event_id=event["id"],
@@ -116,6 +199,7 @@ def worker_process(queue_sw, queue_wp, use_mock: bool = False, mock_event_limit:
                 "whisper_ms": whisper_ms,
                 "intent_ms": intent_ms,
                 "total_ms": total_ms,
+                "glass_to_result_ms": glass_ms,
                 "latency_metrics": metrics,
             }
         )
@@ -128,6 +212,10 @@ def worker_process(queue_sw, queue_wp, use_mock: bool = False, mock_event_limit:
                 "whisper_ms": whisper_ms,
                 "intent_ms": intent_ms,
                 "total_ms": total_ms,
+                "glass_to_result_ms": glass_ms,
+                "whisper_bucket_s": inference_result.get("bucket_s"),
+                "whisper_tier": inference_result.get("tier"),
+                "whisper_cancel_reason": inference_result.get("cancel_reason"),
             }
         )
         log_latency(event["id"], transport_ms, whisper_ms, intent_ms, total_ms)
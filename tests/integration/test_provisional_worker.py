@@ -0,0 +1,155 @@
+import queue
+import time
+
+from src.app.composition import build_worker_dependencies
+from src.contracts import create_silence_abort, create_silence_commit, create_silence_trigger
+from src.worker.services import TriggerScheduler
+from src.worker.worker import worker_process
+
+try:
+    import numpy as np
+except Exception:  # pragma: no cover
+    from src.mocks import mock_numpy as np
+
+
+class _CountingInference:
+    """Queues ``arrivals`` while the first clip is being transcribed, as the sentinel would."""
+
+    def __init__(self, error_state, queue_sw, arrivals):
+        self.error_state = error_state
+        self.queue_sw = queue_sw
+        self.arrivals = arrivals
+        self.calls = 0
+
+    def transcribe(self, audio, vad_track=None, deadline=None, should_cancel=None):
+        self.calls += 1
+        for event in self.arrivals if self.calls == 1 else ():
+            self.queue_sw.put(event)
+        return {"text": f"transcript {self.calls}", "latency": 0.01}
+
+
+def test_worker_commits_cached_provisional_and_drops_aborted_work(monkeypatch):
+    import src.worker.worker as worker
+
+    written = []
+    monkeypatch.setattr(worker, "write_event", written.append)
+    monkeypatch.setattr(worker, "log_event", lambda event: None)
+    audio = np.zeros(4, dtype=np.float32)
+    now = time.monotonic()
+    queue_sw = queue.Queue()
+    queue_sw.put(create_silence_trigger("p1", audio, now, event_type="SILENCE_PROVISIONAL"))
+    arrivals = [
+        create_silence_commit("c1", "p1", audio, now + 0.01),
+        create_silence_abort("a0", "p0", now + 0.02),
+        create_silence_trigger("p0", audio, now + 0.02, event_type="SILENCE_PROVISIONAL"),
+        create_silence_trigger("p2", audio, now + 0.03, event_type="SILENCE_PROVISIONAL"),
+        create_silence_abort("a2", "p2", now + 0.04),
+        create_silence_trigger("t3", audio, now + 0.05),
+    ]
+    services = build_worker_dependencies(use_mock=True)
+    inference = _CountingInference(services["error_state"], queue_sw, arrivals)
+    scheduler = TriggerScheduler(policy="edf")
+    services.update({"inference_service": inference, "scheduler": scheduler})
+    queue_wp = queue.Queue()
+
+    worker_process(queue_sw, queue_wp, use_mock=True, mock_event_limit=2, services=services)
+
+    results = [queue_wp.get_nowait() for _ in range(queue_wp.qsize())]
+    assert [result["event_id"] for result in results] == ["c1", "t3"]
+    assert results[0]["text"] == "transcript 1"
+    assert inference.calls == 2
+    assert scheduler.dropped == {"aborted": 2}
+    aborted = [event["event_id"] for event in written if event["type"] == "PROVISIONAL_ABORTED"]
+    assert sorted(aborted) == ["p0", "p2"]
+
+
+class _OverwritingReader:
+    def resolve(self, event):
+        return np.zeros(4, dtype=np.float32)
+
+    def is_current(self, ref):
+        return ref["generation"] != 0
+
+
+def test_worker_suppresses_transcript_of_overwritten_audio(monkeypatch):
+    import src.worker.worker as worker
+
+    written = []
+    monkeypatch.setattr(worker, "write_event", written.append)
+    monkeypatch.setattr(worker, "log_event", lambda event: None)
+    now = time.monotonic()
+    queue_sw = queue.Queue()
+    for event_id, generation in (("t1", 0), ("t2", 1)):
+        queue_sw.put(create_silence_trigger(event_id, None, now, audio_ref={"generation": generation}))
+    services = build_worker_dependencies(use_mock=True)
+    services.update({"audio_reader": _OverwritingReader(), "scheduler": TriggerScheduler(policy="edf")})
+    queue_wp = queue.Queue()
+
+    worker_process(queue_sw, queue_wp, use_mock=True, mock_event_limit=1, services=services)
+
+    assert [queue_wp.get_nowait()["event_id"] for _ in range(queue_wp.qsize())] == ["t2"]
+    assert {"type": "AUDIO_OVERWRITTEN", "event_id": "t1"} in written
+
+
+class _CancelProbingInference:
+    """Asks ``should_cancel`` after each arrival, as the decoder does between segments."""
+
+    def __init__(self, error_state, queue_sw, arrivals):
+        self.error_state = error_state
+        self.queue_sw = queue_sw
+        self.arrivals = arrivals
+        self.cancel_checks = []
+
+    def transcribe(self, audio, vad_track=None, deadline=None, should_cancel=None):
+        for event in self.arrivals:
+            self.queue_sw.put(event)
+            self.cancel_checks.append(should_cancel())
+        self.arrivals = []
+        return {"text": "transcript", "latency": 0.01}
+
+
+def test_worker_decode_is_cancelled_by_newer_triggers_only(monkeypatch):
+    import src.worker.worker as worker
+
+    monkeypatch.setattr(worker, "write_event", lambda event: None)
+    monkeypatch.setattr(worker, "log_event", lambda event: None)
+    audio = np.zeros(4, dtype=np.float32)
+    now = time.monotonic()
+    queue_sw = queue.Queue()
+    queue_sw.put(create_silence_trigger("t1", audio, now))
+    arrivals = [
+        {"type": "MIC_DEAD", "timestamp": now + 0.01},
+        create_silence_abort("a0", "p0", now + 0.02),
+        create_silence_trigger("p3", audio, now + 0.03, event_type="SILENCE_PROVISIONAL"),
+        create_silence_trigger("t4", audio, now + 0.04),
+    ]
+    services = build_worker_dependencies(use_mock=True)
+    inference = _CancelProbingInference(services["error_state"], queue_sw, arrivals)
+    services.update({"inference_service": inference})
+
+    worker_process(queue_sw, queue.Queue(), use_mock=True, mock_event_limit=1, services=services)
+
+    assert inference.cancel_checks == [False, False, False, True]
+
+
+def test_worker_provisional_decode_is_cancelled_by_its_abort_only(monkeypatch):
+    import src.worker.worker as worker
+
+    monkeypatch.setattr(worker, "write_event", lambda event: None)
+    monkeypatch.setattr(worker, "log_event", lambda event: None)
+    audio = np.zeros(4, dtype=np.float32)
+    now = time.monotonic()
+    queue_sw = queue.Queue()
+    queue_sw.put(create_silence_trigger("p1", audio, now, event_type="SILENCE_PROVISIONAL"))
+    arrivals = [
+        create_silence_commit("c1", "p1", audio, now + 0.01),
+        create_silence_abort("a0", "p0", now + 0.02),
+        create_silence_abort("a1", "p1", now + 0.03),
+    ]
+    services = build_worker_dependencies(use_mock=True)
+    inference = _CancelProbingInference(services["error_state"], queue_sw, arrivals)
+    services.update({"inference_service": inference})
+
+    worker_process(queue_sw, queue.Queue(), use_mock=True, mock_event_limit=1, services=services)
+
+    assert inference.cancel_checks == [False, False, True]
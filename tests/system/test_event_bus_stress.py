@@ -34,8 +34,9 @@ def test_event_bus_ordering_and_latency():
 
     avg_latency = statistics.mean(latencies_ms)
     p99_latency = sorted(latencies_ms)[int(0.99 * len(latencies_ms))]
-    assert avg_latency < 2.0, f"Average latency too high: {avg_latency}ms"
-    assert p99_latency < 5.0, f"p99 latency too high: {p99_latency}ms"
+    stats = bus.stats()["seq"]
+    assert avg_latency < 2.0, f"Average latency too high: {avg_latency}ms; bus stats: {stats}"
+    assert p99_latency < 5.0, f"p99 latency too high: {p99_latency}ms; bus stats: {stats}"
 
     bus._executor.submit = original_submit  # type: ignore
     bus.shutdown()
@@ -52,3 +53,34 @@ def test_event_bus_bounded_queue_drops_oldest():
     assert len(snapshot) == 200, "Queue exceeded bound or not filled as expected"
     assert [item["id"] for item in snapshot] == list(range(total - 200, total)), "Oldest events were not dropped"
     bus.shutdown()
+
+
+def test_event_bus_lanes_keep_per_subscriber_order_and_batch():
+    bus = EventBus(max_queue_size=1_000, max_workers=4)
+    total = 500
+    ordered: List[int] = []
+    batches: List[List[int]] = []
+    done_ordered = threading.Event()
+    done_batched = threading.Event()
+
+    def slow_handler(payload):
+        time.sleep(0.0001)
+        ordered.append(payload["id"])
+        if len(ordered) == total:
+            done_ordered.set()
+
+    def batch_handler(payloads):
+        batches.append([payload["id"] for payload in payloads])
+        if sum(len(batch) for batch in batches) == total:
+            done_batched.set()
+
+    bus.subscribe("seq", slow_handler)
+    bus.subscribe("seq", batch_handler, batch_size=32)
+    for idx in range(total):
+        bus.publish("seq", {"id": idx})
+
+    assert done_ordered.wait(timeout=2) and done_batched.wait(timeout=2)
+    assert ordered == list(range(total))
+    assert [idx for batch in batches for idx in batch] == list(range(total))
+    assert all(len(batch) <= 32 for batch in batches)
+    bus.shutdown()
@@ -133,8 +133,10 @@ def test_pipeline_ordering_latency_and_determinism():
     latencies = [o["pipeline_latency"] for o in outputs_first]
     avg_latency = sum(latencies) / len(latencies)
     p99_latency = sorted(latencies)[int(0.99 * len(latencies))]
-    assert avg_latency < 200, f"Average latency too high: {avg_latency}ms"
-    assert p99_latency < 300, f"p99 latency too high: {p99_latency}ms"
+    # Per-topic dispatch lag and handler time point at the slow stage on failure.
+    stats = runner.bus.stats()
+    assert avg_latency < 200, f"Average latency too high: {avg_latency}ms; bus stats: {stats}"
+    assert p99_latency < 300, f"p99 latency too high: {p99_latency}ms; bus stats: {stats}"
 
     assert len(outputs_first) == 200
     assert runner._hud_render_count == 200
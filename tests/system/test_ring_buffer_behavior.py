@@ -57,3 +57,90 @@ def test_ring_buffer_read_performance():
     durations.sort()
     p99 = durations[int(0.99 * len(durations))]
     assert p99 < 3.0, f"Ring buffer read too slow: p99={p99}ms"
+
+
+def test_ring_buffer_read_samples_across_wrap():
+    buffer = AudioRingBuffer(max_frames=3, frame_size=4)
+    for idx in range(5):
+        buffer.push([float(idx * 4 + offset) for offset in range(4)])
+
+    assert list(buffer.read_samples(6)) == [14.0, 15.0, 16.0, 17.0, 18.0, 19.0]
+    assert list(buffer.read_latest(max_frames=2)) == [float(x) for x in range(12, 20)]
+    assert len(buffer.read_samples(100)) == 12
+    assert buffer.write_position == 20
+
+
+def test_ring_buffer_grows_for_oversized_frames():
+    buffer = AudioRingBuffer(max_frames=2, frame_size=2)
+    buffer.push([1.0, 2.0])
+    buffer.push([3.0, 4.0, 5.0])
+    buffer.push([6.0, 7.0, 8.0])
+
+    assert list(buffer.read_latest()) == [3.0, 4.0, 5.0, 6.0, 7.0, 8.0]
+
+
+def test_ring_reader_sees_every_frame_once_and_counts_overruns():
+    buffer = AudioRingBuffer(max_frames=4, frame_size=2)
+    fast = buffer.register_reader("fast")
+    slow = buffer.register_reader("slow")
+
+    seen = []
+    for idx in range(10):
+        buffer.push([float(idx), float(idx)])
+        assert fast.wait(timeout=0)
+        seen.extend(fast.read_new())
+    assert seen == [float(idx) for idx in range(10) for _ in range(2)]
+    assert fast.read_new() is None
+    assert fast.frames_lost == 0
+
+    assert list(slow.read_new()) == [6.0, 6.0, 7.0, 7.0, 8.0, 8.0, 9.0, 9.0]
+    assert slow.frames_lost == 6
+    assert slow.position == buffer.write_position
+    assert buffer.reader_stats()["slow"]["frames_lost"] == 6
+
+
+def test_ring_reader_max_frames_skips_older_unread():
+    buffer = AudioRingBuffer(max_frames=8, frame_size=1)
+    reader = buffer.register_reader("whisper")
+    for idx in range(5):
+        buffer.push([float(idx)])
+    assert list(reader.read_new(max_frames=2)) == [3.0, 4.0]
+    assert reader.frames_skipped == 3
+    assert reader.pending == 0
+    assert reader.wait(timeout=0) is False
+
+
+def test_ring_buffer_view_survives_a_push_before_the_copy():
+    buffer = AudioRingBuffer(max_frames=2, frame_size=2)
+    buffer.push([0.0, 0.0])
+    buffer.push([1.0, 1.0])
+    view = buffer.read_latest()
+    # A capture callback can land between a reader releasing the lock and copying.
+    buffer.push([2.0, 2.0])
+    assert list(view.copy()) == [0.0, 0.0, 1.0, 1.0]
+
+
+def test_ring_reader_advance_moves_cursor_without_reading():
+    buffer = AudioRingBuffer(max_frames=2, frame_size=1)
+    reader = buffer.register_reader("whisper")
+    for idx in range(3):
+        buffer.push([float(idx)])
+    assert reader.advance() == 2
+    assert reader.frames_lost == 1
+    assert reader.advance() == 0
+    assert reader.wait(timeout=0) is False
+
+
+def test_ring_buffer_capture_times_and_read_range():
+    buffer = AudioRingBuffer(max_frames=4, frame_size=4, sample_rate=4)
+    reader = buffer.register_reader("vad")
+    for idx in range(4):
+        buffer.push([float(idx * 4 + offset) for offset in range(4)], capture_time=10.0 + idx)
+
+    assert list(buffer.read_range(11.5, 13.0)) == [6.0, 7.0, 8.0, 9.0, 10.0, 11.0]
+    assert buffer.capture_time_of(5) == 11.25
+    assert buffer.latest_capture_time == 14.0
+    assert buffer.read_range(20.0, 21.0) is None
+
+    reader.read_new()
+    assert (reader.last_start_time, reader.last_end_time) == (10.0, 14.0)
@@ -16,11 +16,13 @@ from src.worker.whisper_worker import WhisperWorker
 class MockInferenceService:
     def __init__(self, delays=None):
         self.calls = []
+        self.windows = []
         self.delays = delays or [0.05, 0.1, 0.15]
 
     def transcribe(self, audio):
         delay = self.delays[min(len(self.calls), len(self.delays) - 1)]
         time.sleep(delay)
+        self.windows.append(list(audio))
         self.calls.append(delay)
         return {"text": f"mock-{len(self.calls)}", "tokens": [1, 2, 3]}
 
@@ -107,3 +109,30 @@ def test_whisper_worker_latency_under_budget():
     bus.shutdown()
 
     assert durations and durations[0] < 200, "Whisper worker latency exceeded budget"
+
+
+def test_whisper_worker_decodes_full_window_not_only_new_frames():
+    ring = AudioRingBuffer(max_frames=4, frame_size=2)
+    bus = EventBus(max_queue_size=8, max_workers=2)
+    inference = MockInferenceService(delays=[0.0])
+    seen = threading.Semaphore(0)
+    bus.subscribe("transcription_event", lambda event: seen.release())
+
+    for idx in range(3):
+        ring.push([float(idx)] * 2)
+    worker = WhisperWorker(
+        ring_buffer=ring,
+        inference_service=inference,
+        event_bus=bus,
+        sample_rate=16000,
+        frames_per_window=3,
+    )
+    worker.start()
+    assert seen.acquire(timeout=1.0)
+    ring.push([3.0, 3.0])
+    assert seen.acquire(timeout=1.0)
+    worker.stop()
+    worker.join(timeout=1.0)
+    bus.shutdown()
+
+    assert inference.windows[-1] == [1.0, 1.0, 2.0, 2.0, 3.0, 3.0]
@@ -0,0 +1,136 @@
+import asyncio
+import threading
+
+from src.async_event_bus import AsyncEventBus
+from src.event_bus import BLOCK, REJECT
+
+
+def test_async_bus_delivers_in_order_to_sync_and_async_handlers():
+    async def scenario():
+        bus = AsyncEventBus(max_queue_size=8)
+        sync_seen, async_seen = [], []
+        done = asyncio.Event()
+
+        async def async_handler(event):
+            await asyncio.sleep(0)
+            async_seen.append(event["id"])
+            if len(async_seen) == 20:
+                done.set()
+
+        bus.subscribe("topic", sync_seen.append)
+        bus.subscribe("topic", async_handler)
+        for idx in range(20):
+            assert await bus.publish_async("topic", {"id": idx})
+        await asyncio.wait_for(done.wait(), timeout=1)
+        bus.shutdown()
+        return [event["id"] for event in sync_seen], async_seen, bus.get_queue_snapshot("topic"), bus.read_since("topic", 15)
+
+    sync_seen, async_seen, snapshot, (entries, missed) = asyncio.run(scenario())
+    assert sync_seen == list(range(20))
+    assert async_seen == list(range(20))
+    assert [event["id"] for event in snapshot] == list(range(12, 20))
+    assert [seq for seq, _ in entries] == [16, 17, 18, 19, 20] and not missed
+
+
+def test_async_bus_publish_applies_backpressure():
+    async def scenario():
+        bus = AsyncEventBus(max_queue_size=1)
+        release = asyncio.Event()
+
+        async def slow_handler(_event):
+            await release.wait()
+
+        bus.subscribe("topic", slow_handler)
+        await bus.publish_async("topic", {"id": 0})
+        await asyncio.sleep(0)
+        await bus.publish_async("topic", {"id": 1})
+        blocked = asyncio.ensure_future(bus.publish_async("topic", {"id": 2}))
+        await asyncio.sleep(0.01)
+        was_blocked = not blocked.done()
+        release.set()
+        accepted = await asyncio.wait_for(blocked, timeout=1)
+        bus.shutdown()
+        return was_blocked, accepted
+
+    assert asyncio.run(scenario()) == (True, True)
+
+
+def test_async_bus_sync_publish_applies_topic_policy_instead_of_waiting():
+    async def scenario():
+        bus = AsyncEventBus(max_queue_size=4)
+        release = asyncio.Event()
+        seen = []
+
+        async def slow_handler(event):
+            await release.wait()
+            seen.append(event["id"])
+
+        bus.subscribe("dropping", slow_handler)
+        bus.subscribe("rejecting", slow_handler)
+        bus.set_topic_policy("rejecting", BLOCK)
+        await asyncio.sleep(0)
+        results = {"dropping": [], "rejecting": []}
+        for idx in range(1000):
+            for topic in results:
+                results[topic].append(bus.publish(topic, {"id": idx}))
+        waiters = [len(lane.waiters) for lanes in bus._subscribers.values() for lane in lanes]
+        release.set()
+        for _ in range(20):
+            await asyncio.sleep(0)
+        counters = bus.get_topic_counters("dropping"), bus.get_topic_counters("rejecting")
+        bus.shutdown()
+        return results, waiters, counters, seen
+
+    results, waiters, (dropping, rejecting), seen = asyncio.run(scenario())
+    assert waiters == [0, 0]
+    assert all(results["dropping"]) and dropping["dropped"] == 996
+    assert results["rejecting"] == [True] * 4 + [False] * 996 and rejecting["rejected"] == 996
+    assert sorted(seen) == [0, 1, 2, 3, 996, 997, 998, 999]
+
+
+def test_async_bus_caps_waiting_publishers_and_releases_them_on_shutdown(caplog):
+    async def scenario():
+        bus = AsyncEventBus(max_queue_size=2)
+        bus.set_topic_policy("topic", REJECT)
+        never = asyncio.Event()
+
+        async def stuck_handler(_event):
+            await never.wait()
+
+        bus.subscribe("topic", stuck_handler)
+        await asyncio.sleep(0)
+        publishers = [asyncio.ensure_future(bus.publish_async("topic", {"id": idx})) for idx in range(8)]
+        await asyncio.sleep(0.01)
+        waiting = len(bus._subscribers["topic"][0].waiters)
+        bus.shutdown()
+        results = await asyncio.gather(*publishers)
+        return waiting, results, bus.get_topic_counters("topic")
+
+    waiting, results, counters = asyncio.run(scenario())
+    # Two queued and two waiting; the handler taking the first admits one waiter,
+    # the other is released with False at shutdown and the rest are rejected.
+    assert waiting == 1
+    assert results == [True, True, True, False, False, False, False, False]
+    assert counters["rejected"] == 4
+    assert "never retrieved" not in caplog.text
+
+
+def test_async_bus_publish_threadsafe_from_foreign_thread():
+    async def scenario():
+        bus = AsyncEventBus()
+        received = asyncio.Event()
+        seen = []
+
+        def handler(event):
+            seen.append(event["id"])
+            received.set()
+
+        bus.subscribe("audio_frame", handler)
+        thread = threading.Thread(target=bus.publish_threadsafe, args=("audio_frame", {"id": "cb"}))
+        thread.start()
+        await asyncio.wait_for(received.wait(), timeout=1)
+        thread.join()
+        bus.shutdown()
+        return seen
+
+    assert asyncio.run(scenario()) == ["cb"]
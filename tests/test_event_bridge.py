@@ -0,0 +1,135 @@
+import multiprocessing as mp
+import threading
+import time
+
+import pytest
+
+from src import event_bridge
+from src.event_bridge import EventBridgeReceiver, EventBridgeSender, connect_unix, encode_frames, listen_unix
+from src.event_bus import EventBus
+
+
+@pytest.fixture(autouse=True)
+def gap_events(monkeypatch):
+    events = []
+    monkeypatch.setattr(event_bridge, "write_event", events.append)
+    return events
+
+
+class _GatedConnection:
+    """Holds the first send until released so the sender's lane backs up."""
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.release = threading.Event()
+
+    def send_bytes(self, buffer):
+        self.release.wait(timeout=2)
+        self.conn.send_bytes(buffer)
+
+    def close(self):
+        self.conn.close()
+
+
+def test_bridge_forwards_selected_topics_in_order():
+    local_bus = EventBus(max_queue_size=256, max_workers=2)
+    remote_bus = EventBus(max_queue_size=256, max_workers=2)
+    parent_conn, child_conn = mp.Pipe()
+    sender = EventBridgeSender(local_bus, parent_conn, ["transcription_event"])
+    receiver = EventBridgeReceiver(remote_bus, child_conn)
+    receiver.start()
+
+    seen = []
+    done = threading.Event()
+
+    def handler(event):
+        seen.append(event["id"])
+        if len(seen) == 100:
+            done.set()
+
+    remote_bus.subscribe("transcription_event", handler)
+    remote_bus.subscribe("local_only", lambda _event: seen.append("leak"))
+    for idx in range(100):
+        local_bus.publish("transcription_event", {"id": idx, "text": "hello"})
+        local_bus.publish("local_only", {"id": idx})
+
+    assert done.wait(timeout=2)
+    assert seen == list(range(100))
+    assert sender.sent == 100 and sender.batches <= 100
+    assert receiver.gaps == {}
+
+    sender.close()
+    receiver.join(timeout=1)
+    local_bus.shutdown()
+    remote_bus.shutdown()
+
+
+def test_bridge_reports_events_dropped_by_the_sender_lane_as_gaps(gap_events):
+    local_bus = EventBus(max_queue_size=4, max_workers=1)
+    remote_bus = EventBus(max_queue_size=64, max_workers=1)
+    parent_conn, child_conn = mp.Pipe()
+    gated = _GatedConnection(parent_conn)
+    EventBridgeSender(local_bus, gated, ["topic"], batch_size=1)
+    receiver = EventBridgeReceiver(remote_bus, child_conn)
+    receiver.start()
+
+    local_bus.publish("topic", {"id": 1})
+    while local_bus.stats()["topic"]["queue_depth"]:
+        time.sleep(0.001)
+    # The lane holds four events while the first send is stuck; ids 2..6 overflow it.
+    for idx in range(2, 11):
+        local_bus.publish("topic", {"id": idx})
+    gated.release.set()
+    deadline = time.monotonic() + 2
+    while receiver.received < 5 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert [event["id"] for event in remote_bus.get_queue_snapshot("topic")] == [1, 7, 8, 9, 10]
+    assert receiver.gaps == {"topic": 5}
+    assert gap_events == [{"type": "BRIDGE_GAP", "topic": "topic", "missed": 5, "seq": 7}]
+    gated.close()
+    receiver.join(timeout=1)
+    local_bus.shutdown()
+    remote_bus.shutdown()
+
+
+def test_bridge_unix_socket_requires_the_authkey(tmp_path):
+    path = str(tmp_path / "bridge.sock")
+    listener = listen_unix(path, authkey=b"secret")
+    accepted, refused = [], []
+
+    def accept():
+        try:
+            accepted.append(listener.accept())
+        except mp.AuthenticationError as exc:
+            refused.append(exc)
+
+    server = threading.Thread(target=accept, daemon=True)
+    server.start()
+    with pytest.raises(mp.AuthenticationError):
+        connect_unix(path, authkey=b"wrong")
+    server.join(timeout=1)
+    assert not accepted and refused
+
+    server = threading.Thread(target=accept, daemon=True)
+    server.start()
+    client = connect_unix(path, authkey=b"secret")
+    server.join(timeout=1)
+    client.send_bytes(encode_frames([("topic", 1, {"id": 1})]))
+    assert accepted and accepted[0].recv_bytes() == encode_frames([("topic", 1, {"id": 1})])
+    client.close()
+    accepted[0].close()
+    listener.close()
+
+
+def test_bridge_receiver_counts_sequence_gaps():
+    bus = EventBus(max_queue_size=8, max_workers=1)
+    receiver = EventBridgeReceiver(bus, conn=None)
+    receiver.handle_buffer(encode_frames([("topic", 1, {"id": 1}), ("topic", 4, {"id": 4})]))
+    receiver.handle_buffer(encode_frames([("topic", 5, {"id": 5}), ("other", 2, {"id": 2})]))
+
+    # "other" first shows up at seq 2; what flowed before the receiver started is not a gap.
+    assert receiver.gaps == {"topic": 2}
+    assert receiver.received == 4
+    assert [event["id"] for event in bus.get_queue_snapshot("topic")] == [1, 4, 5]
+    bus.shutdown()
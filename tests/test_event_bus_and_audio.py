@@ -1,9 +1,11 @@
 import threading
+import time
 
 import pytest
 
 from src.audio_ring_buffer import AudioRingBuffer
-from src.event_bus import EventBus
+from src.event_bus import EventBus, _TopicState
+from src.telemetry.histogram import LatencyHistogram
 
 
 def test_audio_ring_buffer_drops_oldest_and_tracks_sequence():
@@ -36,3 +38,166 @@ def test_event_bus_bounded_queue_drops_oldest():
     snapshot = bus.get_queue_snapshot("test_event")
     assert [item["id"] for item in snapshot] == [2, 3]
     assert 3 in seen
+
+
+def _blocked_bus(policy, timeout=None):
+    bus = EventBus(max_queue_size=2, max_workers=1)
+    bus.set_topic_policy("topic", policy, timeout=timeout)
+    release = threading.Event()
+    started = threading.Event()
+    seen = []
+
+    def handler(event):
+        started.set()
+        release.wait(timeout=1)
+        seen.append(event["id"])
+
+    bus.subscribe("topic", handler)
+    bus.publish("topic", {"id": 0})
+    assert started.wait(timeout=1)
+    return bus, release, seen
+
+
+def test_event_bus_keep_latest_coalesces_pending_events():
+    from src.event_bus import KEEP_LATEST
+
+    bus, release, seen = _blocked_bus(KEEP_LATEST)
+    for idx in range(1, 6):
+        assert bus.publish("topic", {"id": idx}) is True
+    release.set()
+    bus.shutdown()
+    bus._executor.shutdown(wait=True)
+    assert seen == [0, 5]
+    assert bus.get_topic_counters("topic")["coalesced"] == 4
+
+
+@pytest.mark.parametrize("policy_name", ["REJECT", "BLOCK"])
+def test_event_bus_reject_and_block_timeout_refuse_when_full(policy_name):
+    import src.event_bus as event_bus
+
+    bus, release, seen = _blocked_bus(getattr(event_bus, policy_name), timeout=0.01)
+    assert bus.publish("topic", {"id": 1}) is True
+    assert bus.publish("topic", {"id": 2}) is True
+    assert bus.publish("topic", {"id": 3}) is False
+    release.set()
+    bus.shutdown()
+    bus._executor.shutdown(wait=True)
+    assert seen == [0, 1, 2]
+    counters = bus.get_topic_counters("topic")
+    assert counters["rejected" if policy_name == "REJECT" else "dropped"] == 1
+
+
+def test_event_bus_shutdown_wakes_publisher_blocked_without_timeout():
+    from src.event_bus import BLOCK
+
+    bus, release, seen = _blocked_bus(BLOCK)
+    assert bus.publish("topic", {"id": 1}) is True
+    assert bus.publish("topic", {"id": 2}) is True
+    results = []
+    publisher = threading.Thread(target=lambda: results.append(bus.publish("topic", {"id": 3})))
+    publisher.start()
+    time.sleep(0.05)
+    assert results == []
+
+    bus.shutdown()
+    publisher.join(timeout=1)
+    assert results == [False]
+    release.set()
+    bus._executor.shutdown(wait=True)
+    assert seen == [0, 1, 2]
+
+
+def test_event_bus_stats_track_publishes_lag_and_handler_errors():
+    bus = EventBus(max_queue_size=16, max_workers=2)
+    handled = threading.Event()
+    calls = []
+
+    def handler(payload):
+        calls.append(payload["id"])
+        if payload["id"] == 1:
+            raise ValueError("boom")
+        if len(calls) == 3:
+            handled.set()
+
+    bus.subscribe("topic", handler)
+    for idx in range(3):
+        bus.publish("topic", {"id": idx})
+    assert handled.wait(timeout=1)
+    bus.shutdown()
+    bus._executor.shutdown(wait=True)
+
+    stats = bus.stats()["topic"]
+    assert stats["published"] == 3
+    assert stats["subscribers"] == 1
+    assert stats["queue_depth"] == 0
+    assert stats["handler_exceptions"] == 1
+    assert stats["dispatch_lag_ms"]["count"] == 3
+    assert stats["handler_ms"]["count"] == 3
+    assert stats["dropped"] == 0
+
+
+def test_topic_publish_rate_reflects_bursts_and_decays_when_idle():
+    topic = _TopicState(history_size=16)
+    start = time.monotonic()
+    for idx in range(10_000):
+        topic.record_publish({"id": idx}, start + idx * 1e-6)
+
+    burst_rate = topic.snapshot(now=start + 0.01)["publish_rate"]
+    assert 9_000 < burst_rate <= 10_000
+    assert topic.snapshot(now=start + 1.0)["publish_rate"] < burst_rate / 2
+    assert topic.snapshot(now=start + 30.0)["publish_rate"] < 0.01
+
+    steady = _TopicState(history_size=16)
+    for idx in range(200):
+        steady.record_publish({"id": idx}, start + idx * 0.1)
+    assert steady.snapshot(now=start + 19.9)["publish_rate"] == pytest.approx(10.0, rel=0.06)
+
+
+def test_latency_histogram_percentile_never_exceeds_max():
+    histogram = LatencyHistogram()
+    for value in (1.5, 6.0, 7.99):
+        histogram.record(value)
+
+    assert histogram.percentile(30) == 2.0
+    assert histogram.percentile(50) == 7.99
+    assert histogram.summary()["p99_ms"] == histogram.summary()["max_ms"] == 7.99
+
+
+def test_event_bus_stats_reporter_writes_telemetry(monkeypatch):
+    import src.event_bus as event_bus
+
+    written = []
+    reported = threading.Event()
+
+    def fake_write_event(event):
+        written.append(event)
+        reported.set()
+
+    monkeypatch.setattr(event_bus, "write_event", fake_write_event)
+    bus = EventBus()
+    bus.publish("topic", {"id": 1})
+    bus.start_stats_reporter(interval_sec=0.01)
+    assert reported.wait(timeout=1)
+    bus.shutdown()
+    assert written[0]["type"] == "EVENT_BUS_STATS"
+    assert written[0]["topics"]["topic"]["published"] == 1
+
+
+def test_event_bus_read_since_follows_topic_and_flags_missed_entries():
+    bus = EventBus(max_queue_size=3)
+    assert bus.read_since("topic", 0) == ([], False)
+    for idx in range(2):
+        bus.publish("topic", {"id": idx})
+
+    entries, missed = bus.read_since("topic", 0)
+    assert [seq for seq, _ in entries] == [1, 2] and not missed
+    cursor = entries[-1][0]
+    assert bus.read_since("topic", cursor) == ([], False)
+
+    for idx in range(2, 6):
+        bus.publish("topic", {"id": idx})
+    entries, missed = bus.read_since("topic", cursor)
+    assert missed
+    assert [(seq, payload["id"]) for seq, payload in entries] == [(4, 3), (5, 4), (6, 5)]
+    assert bus.latest_seq("topic") == 6
+    bus.shutdown()
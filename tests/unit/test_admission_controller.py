@@ -0,0 +1,54 @@
+from src.worker.services import AdmissionController, LatencyMonitor
+
+
+def _monitor(whisper_per_audio_sec: float = 0.2) -> LatencyMonitor:
+    monitor = LatencyMonitor()
+    for audio_sec in (1.0, 2.0, 3.0, 4.0) * 2:
+        monitor.history.add({"whisper_latency": 0.1 + whisper_per_audio_sec * audio_sec, "audio_sec": audio_sec})
+    monitor.telemetry.intent_latencies.append(0.05)
+    return monitor
+
+
+def test_admits_everything_until_latency_is_known():
+    admission = AdmissionController(LatencyMonitor())
+    assert admission.admit({"timestamp": 0.0}, audio_sec=10.0, now=5.0) == (True, None)
+
+
+def test_rejects_events_predicted_to_miss_the_budget():
+    admission = AdmissionController(_monitor(), budget_sec=1.5)
+
+    admitted, predicted = admission.admit({"timestamp": 10.0}, audio_sec=2.0, now=10.3)
+    assert admitted and abs(predicted - 0.85) < 1e-9
+
+    admitted, predicted = admission.admit({"timestamp": 10.0}, audio_sec=6.0, now=10.3)
+    assert not admitted and abs(predicted - 1.65) < 1e-9
+
+
+def test_admission_recovers_after_a_slow_stretch():
+    monitor = LatencyMonitor()
+    for _ in range(8):
+        monitor.record(1.5, 0.05, 1.6, "SUCCESS", audio_sec=1.0)
+    start = monitor.history.records[-1]["recorded_at"]
+    admission = AdmissionController(monitor, budget_sec=1.5, max_sample_age_sec=60.0, probe_after_sec=5.0)
+
+    admitted, predicted = admission.admit({"timestamp": start}, 1.0, now=start)
+    assert not admitted and abs(predicted - 1.55) < 1e-9
+    assert not admission.admit({"timestamp": start + 4.0}, 1.0, now=start + 4.0)[0]
+
+    # Five seconds without an admission: the next event runs as a probe.
+    assert admission.admit({"timestamp": start + 5.0}, 1.0, now=start + 5.0)[0]
+    assert admission.probes == 1
+    assert not admission.admit({"timestamp": start + 6.0}, 1.0, now=start + 6.0)[0]
+
+    # Probes and other admitted work are fast now; once the slow samples age out,
+    # the fit reflects only them.
+    for idx in range(8):
+        monitor.history.add({"whisper_latency": 0.2, "audio_sec": 1.0, "recorded_at": start + 20.0 + idx})
+    now = start + 61.0
+    admitted, predicted = admission.admit({"timestamp": now}, 1.0, now=now)
+    assert admitted and abs(predicted - 0.25) < 1e-9
+
+
+def test_service_time_predicts_decode_and_intent_time_for_scheduling():
+    assert AdmissionController(LatencyMonitor()).service_time(4.0) == 0.0
+    assert abs(AdmissionController(_monitor()).service_time(2.0) - 0.55) < 1e-9
@@ -0,0 +1,83 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.sentinel.energy_gate import EnergyGate, block_features, calibrate  # noqa: E402
+from src.sentinel.vad import StreamingVAD  # noqa: E402
+
+BLOCK = 512
+SAMPLE_RATE = 16000
+
+
+def _voiced(amplitude=0.1, f0=180.0, offset=0):
+    t = (np.arange(BLOCK) + offset) / SAMPLE_RATE
+    return sum(amplitude / k * np.sin(2 * np.pi * f0 * k * t) for k in range(1, 6)).astype(np.float32)
+
+
+def _noise(amplitude=0.05, seed=0):
+    return (np.random.default_rng(seed).standard_normal(BLOCK) * amplitude).astype(np.float32)
+
+
+def test_gate_skips_silence_and_broadband_noise_but_not_voiced_audio():
+    gate = EnergyGate()
+    assert gate.classify(np.zeros(BLOCK, dtype=np.float32)) == 0.0
+    assert gate.classify(_noise()) == 0.0
+    assert gate.classify(_voiced()) is None
+    assert gate.skip_fraction == pytest.approx(2 / 3)
+
+
+def test_calibrate_keeps_speech_skips_within_budget():
+    blocks = np.stack([_noise(0.0005, seed) for seed in range(40)] + [_voiced(0.05, offset=i * BLOCK) for i in range(40)])
+    speech = [False] * 40 + [True] * 40
+    result = calibrate(block_features(blocks), speech, max_speech_skip=0.01)
+    assert result["speech_skip_fraction"] <= 0.01
+    assert result["skip_fraction"] >= 0.45
+
+
+class _CountingEngine:
+    def __init__(self):
+        self.calls = 0
+        self.resets = 0
+
+    def score(self, block):
+        self.calls += 1
+        return 0.9
+
+    def reset(self):
+        self.resets += 1
+
+
+def test_streaming_vad_bypasses_model_for_gated_blocks_and_resets_on_resume():
+    engine = _CountingEngine()
+    vad = StreamingVAD(engine, block_size=BLOCK, sample_rate=SAMPLE_RATE, gate=EnergyGate())
+    audio = np.concatenate([np.zeros(BLOCK * 3, dtype=np.float32), _voiced(), _voiced(offset=BLOCK)])
+
+    assert vad.process(audio) == [0.0, 0.0, 0.0, 0.9, 0.9]
+    assert engine.calls == 2
+    assert engine.resets == 1
+    assert vad.blocks_gated == 3
+
+
+def test_streaming_vad_audits_gated_blocks_for_ungated_labels():
+    engine = _CountingEngine()
+    vad = StreamingVAD(engine, block_size=BLOCK, sample_rate=SAMPLE_RATE, gate=EnergyGate(), audit_every=2)
+    audio = np.concatenate([np.zeros(BLOCK * 3, dtype=np.float32), _voiced()])
+
+    assert vad.process(audio) == [0.0, 0.0, 0.0, 0.9]
+    assert vad.last_gated == [True, True, True, False]
+    assert np.isnan(vad.last_raw[0]) and np.isnan(vad.last_raw[2])
+    assert vad.last_raw[1::2] == [0.9, 0.9]
+    assert vad.blocks_audited == 1 and engine.calls == 2
+
+
+def test_calibrate_weights_audited_gated_blocks():
+    blocks = np.stack([_noise(0.0005, seed) for seed in range(40)] + [_voiced(0.05, offset=i * BLOCK) for i in range(40)])
+    # A quiet speech block gated at runtime and audited once stands for ten gated blocks.
+    blocks[0] = _voiced(0.0004)
+    speech = [True] + [False] * 39 + [True] * 40
+    unweighted = calibrate(block_features(blocks), speech, max_speech_skip=0.05)
+    weighted = calibrate(block_features(blocks), speech, max_speech_skip=0.05, weights=[10.0] + [1.0] * 79)
+
+    assert unweighted["silence_rms"] > float(block_features(blocks[:1])["rms"][0])
+    assert weighted["silence_rms"] <= float(block_features(blocks[:1])["rms"][0])
+    assert weighted["speech_skip_fraction"] <= 0.05
@@ -0,0 +1,150 @@
+import time
+from types import SimpleNamespace
+
+from src.telemetry.error_state import ErrorStateManager
+from src.worker.services import InferenceService
+
+
+class _RecordingWhisper:
+    def __init__(self):
+        self.calls = []
+
+    def transcribe(self, audio, **options):
+        self.calls.append(options)
+        return [SimpleNamespace(text=" hello")], None
+
+
+def _service():
+    service = InferenceService(use_mock=True, error_state=ErrorStateManager())
+    service.use_mock = False
+    service._stt = _RecordingWhisper()
+    return service
+
+
+def test_negligible_speech_skips_whisper():
+    service = _service()
+    result = service.transcribe([0.0] * 16, {"speech_ratio": 0.05, "speech_segments": []})
+
+    assert result["skipped"] == "no_speech" and result["text"] == ""
+    assert service._stt.calls == []
+
+
+def test_speech_segments_become_clip_timestamps():
+    service = _service()
+    result = service.transcribe([0.0] * 16, {"speech_ratio": 0.6, "speech_segments": [(0.1, 0.9), (1.2, 1.8)]})
+
+    assert result["text"] == "hello"
+    assert service._stt.calls[0]["clip_timestamps"] == [0.1, 0.9, 1.2, 1.8]
+    service.transcribe([0.0] * 16)
+    assert "clip_timestamps" not in service._stt.calls[1]
+
+
+def test_short_clips_use_a_bounded_mel_window():
+    service = _service()
+    result = service.transcribe([0.0] * 19200)
+
+    assert result["bucket_s"] == 2
+    assert service._stt.calls[0]["chunk_length"] == 2
+    assert service.bucket_latency[2].count == 1
+
+
+def test_short_form_falls_back_to_padded_window(monkeypatch):
+    import src.worker.services as services
+
+    monkeypatch.setattr(services, "write_event", lambda event: None)
+    service = _service()
+    whisper = service._stt
+
+    def reject_short(audio, **options):
+        if "chunk_length" in options:
+            raise ValueError(
+                "Invalid input features shape: expected an input with shape (1, 80, 3000), "
+                "but got an input with shape (1, 80, 200) instead"
+            )
+        return whisper.transcribe(audio, **options)
+
+    service._stt = SimpleNamespace(transcribe=reject_short)
+    result = service.transcribe([0.0] * 19200)
+
+    assert result["text"] == "hello" and result["bucket_s"] == 30
+    assert not service.short_form
+    assert "chunk_length" not in whisper.calls[0]
+
+
+def test_transient_whisper_error_keeps_short_form_and_counts_a_failure(monkeypatch):
+    import src.worker.services as services
+
+    events = []
+    monkeypatch.setattr(services, "write_event", events.append)
+    monkeypatch.setattr(services.time, "sleep", lambda seconds: None)
+    service = _service()
+    whisper = service._stt
+    failures = []
+    service.error_state.record_whisper_failure = lambda: failures.append(1)
+
+    def fail_once(audio, **options):
+        if not whisper.calls:
+            whisper.calls.append(options)
+            raise RuntimeError("decoder busy")
+        return whisper.transcribe(audio, **options)
+
+    service._stt = SimpleNamespace(transcribe=fail_once)
+    result = service.transcribe([0.0] * 19200)
+
+    assert result["text"] == "hello" and result["bucket_s"] == 2
+    assert service.short_form and failures == [1] and events == []
+    assert [call.get("chunk_length") for call in whisper.calls] == [2, 2]
+
+
+def test_tier_naming_another_model_decodes_with_that_model():
+    from src.worker.services import DecodingTier
+
+    service = _service()
+    small = _RecordingWhisper()
+    service._models["tiny.en"] = small
+    service.tiers = (DecodingTier("full", 900.0, model="base.en"), DecodingTier("minimal", 150.0, model="tiny.en"))
+    now = time.monotonic()
+
+    assert service.transcribe([0.0] * 16000, deadline=now + 0.3)["tier"] == "minimal"
+    assert len(small.calls) == 1 and service._stt.calls == []
+
+
+def test_decoding_tier_follows_remaining_budget():
+    service = _service()
+    now = time.monotonic()
+
+    assert service.transcribe([0.0] * 16000, deadline=now + 5.0)["tier"] == "full"
+    assert "max_new_tokens" not in service._stt.calls[0]
+    assert service.transcribe([0.0] * 16000, deadline=now + 0.6)["tier"] == "fast"
+    assert service._stt.calls[1]["max_new_tokens"] == 12
+    assert service._stt.calls[1]["temperature"] == 0.0
+    assert service.transcribe([0.0] * 16000, deadline=now + 0.3)["tier"] == "minimal"
+
+    late = service.transcribe([0.0] * 16000, deadline=now - 0.1)
+    assert late["skipped"] == "deadline"
+    assert len(service._stt.calls) == 3
+
+
+def test_decoding_stops_between_segments_when_cancelled():
+    service = _service()
+    pulled = []
+
+    def segments():
+        for idx in range(5):
+            pulled.append(idx)
+            yield SimpleNamespace(text=f"part{idx}", end=(idx + 1) * 0.5)
+
+    service._stt = SimpleNamespace(transcribe=lambda audio, **options: (segments(), None))
+    result = service.transcribe([0.0] * 48000, should_cancel=lambda: len(pulled) >= 2)
+
+    assert result["text"] == "part0 part1"
+    assert result["truncated"] and result["cancel_reason"] == "superseded"
+    assert pulled == [0, 1]
+
+
+def test_segment_reaching_end_of_audio_is_not_truncated():
+    service = _service()
+    service._stt = SimpleNamespace(transcribe=lambda audio, **options: ([SimpleNamespace(text=" done", end=1.0)], None))
+    result = service.transcribe([0.0] * 16000, should_cancel=lambda: True)
+
+    assert result["text"] == "done" and "truncated" not in result
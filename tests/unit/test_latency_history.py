@@ -8,3 +8,15 @@ def test_latency_history_metrics_and_warning(monkeypatch):
     metrics = lh.log_warnings()
     assert metrics["p95"]["whisper_ms"] >= 1400
     assert metrics["suppression_rate"] == 0.0
+
+
+def test_whisper_latency_fit_tracks_clip_length():
+    lh = LatencyHistory(max_events=20)
+    assert lh.fit_whisper_latency() is None
+    for audio_sec in (1.0, 2.0, 3.0, 4.0) * 2:
+        lh.add({"whisper_latency": 0.1 + 0.05 * audio_sec, "audio_sec": audio_sec, "decision": "SUCCESS"})
+    lh.add({"whisper_latency": 0.0, "audio_sec": 9.0, "decision": "SUCCESS"})
+
+    intercept, slope, margin = lh.fit_whisper_latency()
+    assert abs(intercept - 0.1) < 1e-9 and abs(slope - 0.05) < 1e-9
+    assert margin < 1e-9
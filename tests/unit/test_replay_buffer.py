@@ -14,3 +14,16 @@ def test_replay_buffer_dump(tmp_path):
     assert "audio" in data and "vad" in data
     assert data["event_id"] == "evt1"
     assert len(data["audio"]) == len(data["vad"]) == 4
+
+
+def test_replay_buffer_keeps_raw_vad_and_gate_flags_per_block(tmp_path):
+    buf = ReplayBuffer(sample_rate=4, duration_sec=2)
+    buf.add([0.1, 0.1, 0.2, 0.2], [0.0, 0.8], raw_probs=[float("nan"), 0.8], gated=[True, False])
+    buf.add([0.3, 0.3], 0.6)
+
+    assert list(buf.vad) == [0.0, 0.0, 0.8, 0.8, 0.6, 0.6]
+    assert list(buf.vad_raw)[2:] == [0.8, 0.8, 0.6, 0.6]
+    assert all(value != value for value in list(buf.vad_raw)[:2])
+    assert list(buf.gated) == [True, True, False, False, False, False]
+    data = np.load(buf.dump_to_disk(tmp_path / "replay.npz", "evt1"))
+    assert len(data["vad_raw"]) == len(data["gated"]) == 6
@@ -0,0 +1,138 @@
+import time
+from types import SimpleNamespace
+
+from src.audio_ring_buffer import AudioRingBuffer
+from src.cache.silence_jitter import SilenceJitter
+from src.cache.vad_smoother import VADSmoother
+from src.contracts import create_silence_trigger, read_vad_track
+from src.sentinel.services import SilencePolicy, TriggerCoalescer, capture_time_from, speech_segments
+
+
+def test_capture_time_maps_adc_time_to_monotonic():
+    info = SimpleNamespace(inputBufferAdcTime=99.95, currentTime=100.0)
+    before = time.monotonic()
+    captured = capture_time_from(info, 512, 16000)
+    assert before - 0.06 < captured < time.monotonic() - 0.04
+
+    missing = SimpleNamespace(inputBufferAdcTime=0.0, currentTime=0.0)
+    assert capture_time_from(missing, 1600, 16000) < time.monotonic() - 0.09
+
+
+def test_trigger_carries_capture_time_of_last_speech():
+    buffer = AudioRingBuffer(max_frames=4, frame_size=2)
+    buffer.push([0.1, 0.1], capture_time=0.0)
+    policy = SilencePolicy(buffer, VADSmoother(window_ms=100), SilenceJitter(min_continuous_ms=64, window_ms=64))
+
+    assert policy.handle_prob(0.9, 1.0, 512, 16000) is None
+    assert policy.handle_prob(0.0, 1.2, 512, 16000) is None
+    trigger = policy.handle_prob(0.0, 1.3, 512, 16000)
+
+    assert trigger["event"]["timestamp"] == 1.3
+    assert trigger["event"]["speech_end_timestamp"] == 1.0
+
+
+def _provisional_policy():
+    buffer = AudioRingBuffer(max_frames=4, frame_size=2)
+    buffer.push([0.1, 0.1], capture_time=0.0)
+    jitter = SilenceJitter(min_continuous_ms=96, window_ms=96)
+    return SilencePolicy(buffer, VADSmoother(window_ms=10), jitter, provisional_ms=32)
+
+
+def test_provisional_trigger_is_committed_when_silence_holds():
+    policy = _provisional_policy()
+    assert policy.handle_prob(0.9, 1.0, 512, 16000) is None
+    provisional = policy.handle_prob(0.0, 1.1, 512, 16000)["event"]
+    assert provisional["type"] == "SILENCE_PROVISIONAL"
+    assert policy.handle_prob(0.0, 1.2, 512, 16000) is None
+    commit = policy.handle_prob(0.0, 1.3, 512, 16000)["event"]
+
+    assert commit["type"] == "SILENCE_COMMIT"
+    assert commit["provisional_id"] == provisional["id"]
+    assert commit["audio"] is not None
+    assert policy.provisional_id is None
+
+
+def test_provisional_trigger_is_aborted_when_speech_resumes():
+    policy = _provisional_policy()
+    policy.handle_prob(0.9, 1.0, 512, 16000)
+    provisional = policy.handle_prob(0.0, 1.1, 512, 16000)["event"]
+    abort = policy.handle_prob(0.9, 1.2, 512, 16000)["event"]
+
+    assert abort["type"] == "SILENCE_ABORT"
+    assert abort["provisional_id"] == provisional["id"]
+    assert policy.handle_prob(0.9, 1.3, 512, 16000) is None
+
+
+def _utterance_policy(frames=30, **kwargs):
+    buffer = AudioRingBuffer(max_frames=40, frame_size=10, sample_rate=100)
+    for idx in range(frames):
+        buffer.push([float(idx)] * 10, capture_time=idx / 10)
+    jitter = SilenceJitter(min_continuous_ms=300, window_ms=300)
+    return SilencePolicy(buffer, VADSmoother(window_ms=10), jitter, pre_pad_ms=200, post_pad_ms=100, **kwargs)
+
+
+def _utterance_trigger(**kwargs):
+    policy = _utterance_policy(**kwargs)
+    for step in range(1, 30):
+        trigger = policy.handle_prob(0.9 if 10 < step <= 20 else 0.0, step / 10, 10, 100)
+        if trigger and step > 20:
+            return trigger["event"]
+
+
+def test_trigger_audio_spans_utterance_with_padding():
+    audio = _utterance_trigger()["audio"]
+    assert len(audio) == 130
+    assert audio[0] == 8.0 and audio[-1] == 20.0
+
+
+def test_trigger_audio_is_capped_to_newest_samples():
+    audio = _utterance_trigger(max_capture_sec=0.5)["audio"]
+    assert len(audio) == 50
+    assert audio[0] == 16.0 and audio[-1] == 20.0
+
+
+def test_speech_segments_pad_merge_and_clamp():
+    probs = [0.9, 0.0, 0.8, 0.0, 0.0, 0.0, 0.0, 0.0, 0.7, 0.1]
+    assert speech_segments(probs, 0.1, 0.0, 1.0, pad_ms=50, merge_ms=150) == [(0.0, 0.35), (0.75, 0.95)]
+
+
+def test_trigger_carries_vad_track_of_its_audio():
+    event = _utterance_trigger()
+    track = read_vad_track(event)
+
+    assert len(event["vad_probs"]) == 13
+    assert event["vad_offset_ms"] == 0.0
+    assert event["speech_segments"] == [(0.1, 1.3)]
+    assert abs(track["speech_ratio"] - 10 / 13) < 1e-9
+
+
+def test_coalescer_drops_retriggers_without_new_speech():
+    policy = _utterance_policy(frames=0)
+    coalescer = TriggerCoalescer(policy)
+    sent = []
+    for step in range(1, 30):
+        policy.ring_buffer.push([float(step)] * 10, capture_time=(step - 1) / 10)
+        trigger = policy.handle_prob(0.9 if 10 < step <= 20 else 0.0, step / 10, 10, 100)
+        if trigger:
+            trigger, _action = coalescer.offer(trigger)
+        if trigger:
+            sent.append(trigger["event"])
+
+    assert [event.get("speech_end_timestamp") for event in sent] == [None, 2.0]
+    assert coalescer.merged == 4
+
+
+def test_coalescer_widens_trigger_inside_refractory_period():
+    policy = _utterance_policy()
+    coalescer = TriggerCoalescer(policy, refractory_ms=300)
+    first = create_silence_trigger("t1", None, 1.5, speech_end_ts=1.3)
+    second = create_silence_trigger("t2", None, 1.7, speech_end_ts=1.6)
+
+    assert coalescer.offer({"event": first, "window": (0.8, 1.5)}) == ({"event": first, "window": (0.8, 1.5)}, None)
+    widened, action = coalescer.offer({"event": second, "window": (1.4, 1.8)})
+
+    assert action == "widened"
+    assert widened["window"] == (0.8, 1.8)
+    assert len(widened["event"]["audio"]) == 100
+    assert widened["event"]["id"] == "t2"
+    assert widened["event"]["supersedes"] == "t1" and widened["event"]["merged_count"] == 1
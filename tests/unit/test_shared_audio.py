@@ -0,0 +1,47 @@
+import pytest
+
+pytest.importorskip("numpy")
+
+from src.audio_ring_buffer import AudioRingBuffer
+from src.cache.silence_jitter import SilenceJitter
+from src.cache.vad_smoother import VADSmoother
+from src.sentinel.services import SilencePolicy
+from src.shared_audio import SharedAudioReader, SharedAudioRing
+
+
+def test_shared_audio_roundtrip_and_stale_slots():
+    ring = SharedAudioRing(slot_samples=4, slots=2)
+    reader = SharedAudioReader()
+    try:
+        first = ring.write([1.0, 2.0, 3.0])
+        assert list(reader.read(first)) == [1.0, 2.0, 3.0]
+        assert set(first) == {"shm_name", "offset", "length", "generation"}
+
+        second = ring.write([5.0, 6.0, 7.0, 8.0, 9.0])
+        assert second["length"] == 4
+        assert list(reader.read(second)) == [6.0, 7.0, 8.0, 9.0]
+
+        ring.write([0.5])
+        assert reader.is_current(first) is False
+        assert reader.read(first) is None
+        assert reader.is_current(second) is True
+    finally:
+        reader.close()
+        ring.close()
+
+
+def test_silence_policy_sends_descriptor_instead_of_audio():
+    buffer = AudioRingBuffer(max_frames=4, frame_size=2)
+    for idx in range(4):
+        buffer.push([float(idx), float(idx)])
+    transport = SharedAudioRing(slot_samples=8, slots=2)
+    reader = SharedAudioReader()
+    policy = SilencePolicy(buffer, VADSmoother(), SilenceJitter(min_continuous_ms=0, window_ms=0), transport)
+    try:
+        trigger = policy.handle_prob(0.0, 0.0, 512, 16000)
+        event = trigger["event"]
+        assert event["audio"] is None
+        assert list(reader.resolve(event)) == [0.0, 0.0, 1.0, 1.0, 2.0, 2.0, 3.0, 3.0]
+    finally:
+        reader.close()
+        transport.close()
@@ -0,0 +1,65 @@
+import pytest
+
+from src.cache.replay_buffer import ReplayBuffer
+from src.sentinel.dead_mic import DeadMicDetector
+from src.sentinel.signal_health import SignalHealthAnalyzer
+from src.telemetry.error_state import ErrorStateManager
+
+try:
+    import numpy as np
+except Exception:  # pragma: no cover
+    from src.mocks import mock_numpy as np
+
+
+def test_analyzer_reports_rms_peak_clipping_dc_and_noise_floor():
+    analyzer = SignalHealthAnalyzer(floor_rise=0.5)
+    health = analyzer.analyze([1.0, -1.0, 0.5, 0.5])
+    assert health.peak == 1.0
+    assert health.clipping_ratio == 0.5
+    assert health.dc_offset == pytest.approx(0.25)
+    assert health.rms == pytest.approx((2.5 / 4) ** 0.5)
+    assert health.ac_rms == pytest.approx((2.5 / 4 - 0.0625) ** 0.5)
+    assert health.noise_floor == health.ac_rms
+
+    quiet = analyzer.analyze([0.01, -0.01, 0.01, -0.01])
+    assert quiet.noise_floor == pytest.approx(0.01)
+    loud = analyzer.analyze([0.51, -0.49, 0.51, -0.49])
+    assert quiet.noise_floor < loud.noise_floor < loud.ac_rms
+
+
+def test_dead_mic_judges_mean_amplitude_from_health():
+    detector = DeadMicDetector(max_silence_sec=0.1, rms_floor=1e-3)
+    offset = SignalHealthAnalyzer().analyze([0.2, 0.2, 0.2, 0.2])
+    assert offset.mean_abs == pytest.approx(0.2)
+    silent = SignalHealthAnalyzer().analyze([0.0, 0.0, 0.0, 0.0])
+    assert detector.update(None, 0.0, 0.0, silent) is False
+    assert detector.update(None, 0.0, 0.2, offset) is False
+    assert detector.update(None, 0.0, 0.4, silent) is True
+    assert detector.update([0.0, 0.0, 0.0, 0.0], 0.0, 0.6) is True
+
+
+def test_error_state_flags_persistent_clipping_once_and_recovers(monkeypatch):
+    import src.telemetry.error_state as error_state
+
+    events = []
+    monkeypatch.setattr(error_state, "write_event", events.append)
+    analyzer = SignalHealthAnalyzer()
+    mgr = ErrorStateManager(signal_persist_blocks=3)
+    for _ in range(5):
+        mgr.record_signal_health(analyzer.analyze([1.0, -1.0, 0.1, -0.1]))
+    assert mgr.signal_issues == {"clipping"}
+    for _ in range(3):
+        mgr.record_signal_health(analyzer.analyze([0.1, -0.1, 0.1, -0.1]))
+    assert mgr.signal_issues == set()
+    assert [(e["state"], e["issue"]) for e in events] == [("SIGNAL_DEGRADED", "clipping"), ("RECOVERED", "clipping")]
+
+
+def test_replay_dump_includes_block_health(tmp_path):
+    buf = ReplayBuffer(sample_rate=1024, duration_sec=1)
+    analyzer = SignalHealthAnalyzer()
+    block = [0.1, -0.1, 0.2, -0.2]
+    buf.add(block, 0.5, analyzer.analyze(block))
+    buf.add(block, 0.5, analyzer.analyze(block))
+    data = np.load(buf.dump_to_disk(tmp_path / "replay.npz", "evt1"))
+    assert str(data["health_fields"]).split(",")[0] == "sample"
+    assert [row[0] for row in data["health"]] == [0, 4]
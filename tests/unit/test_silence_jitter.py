@@ -11,3 +11,120 @@ def test_silence_jitter_triggers_after_window():
     assert jitter.is_trigger_ready() is True
     jitter.reset_on_speech()
     assert jitter.is_trigger_ready() is False
+
+
+def _speak_then_pause(endpointer, speech_ms, pause_ms):
+    endpointer.update_speech(speech_ms)
+    endpointer.update_silence(pause_ms)
+
+
+def test_adaptive_endpointer_learns_pauses_within_floor_and_ceiling(monkeypatch):
+    import src.cache.silence_jitter as silence_jitter
+
+    events = []
+    monkeypatch.setattr(silence_jitter, "write_event", events.append)
+    endpointer = silence_jitter.AdaptiveEndpointer(floor_ms=250, ceiling_ms=800, initial_ms=600, min_pauses=4, margin_ms=50)
+    assert endpointer.threshold_ms() == 600
+
+    for pause_ms in (100, 120, 150, 200, 180, 160, 140, 130):
+        _speak_then_pause(endpointer, 500, pause_ms)
+    endpointer.update_speech(500)
+    assert endpointer.threshold_ms() == 250
+
+    for pause_ms in (900, 1000, 1100, 1200, 1300, 1400, 1500, 1600):
+        _speak_then_pause(endpointer, 500, pause_ms)
+    endpointer.update_speech(500)
+    assert endpointer.threshold_ms() == 800
+
+
+def test_adaptive_endpointer_is_quicker_once_turn_runs_typical_length(monkeypatch):
+    import src.cache.silence_jitter as silence_jitter
+
+    events = []
+    monkeypatch.setattr(silence_jitter, "write_event", events.append)
+    endpointer = silence_jitter.AdaptiveEndpointer(floor_ms=100, ceiling_ms=800, min_pauses=4, margin_ms=0)
+    for pause_ms in (200, 250, 300, 350, 400, 450, 500, 550):
+        _speak_then_pause(endpointer, 100, pause_ms)
+    for _ in range(3):
+        endpointer.update_speech(1000)
+        endpointer.reset_on_trigger()
+
+    endpointer.update_speech(200)
+    mid_turn = endpointer.threshold_ms()
+    endpointer.update_speech(1000)
+    turn_end = endpointer.threshold_ms()
+    assert turn_end < mid_turn
+
+    endpointer.update_silence(turn_end)
+    assert endpointer.is_trigger_ready()
+    endpointer.reset_on_trigger()
+    assert events[-1]["type"] == "ENDPOINT_THRESHOLD"
+    assert events[-1]["mode"] == "turn_end"
+    assert events[-1]["threshold_ms"] == turn_end
+
+
+def _pause_through_trigger(endpointer, speech_ms, pause_ms, step_ms=10):
+    """Speak, then stay silent for ``pause_ms``; the first time the endpointer fires, trigger once."""
+    endpointer.update_speech(speech_ms)
+    triggered = False
+    for _ in range(int(pause_ms // step_ms)):
+        endpointer.update_silence(step_ms)
+        if not triggered and endpointer.is_trigger_ready():
+            endpointer.reset_on_trigger()
+            triggered = True
+
+
+def test_adaptive_endpointer_long_pauses_cut_by_trigger_do_not_lower_threshold(monkeypatch):
+    import src.cache.silence_jitter as silence_jitter
+
+    monkeypatch.setattr(silence_jitter, "write_event", lambda event: None)
+    endpointer = silence_jitter.AdaptiveEndpointer(floor_ms=250, ceiling_ms=1200, initial_ms=600, min_pauses=8)
+    # One within-turn pause in five runs past the threshold before the speaker resumes.
+    for idx in range(100):
+        pause_ms = 900 if idx % 5 == 4 else 150 + 20 * (idx % 5)
+        _pause_through_trigger(endpointer, 500, pause_ms)
+    endpointer.update_speech(500)
+
+    assert endpointer.threshold_ms() >= 900
+    assert list(endpointer.turns_ms) == []
+
+
+def test_adaptive_endpointer_ignores_speech_long_after_a_trigger(monkeypatch):
+    import src.cache.silence_jitter as silence_jitter
+
+    monkeypatch.setattr(silence_jitter, "write_event", lambda event: None)
+    endpointer = silence_jitter.AdaptiveEndpointer(resume_window_ms=1000)
+    _pause_through_trigger(endpointer, 500, 600 + 1500)
+    endpointer.update_speech(500)
+    _pause_through_trigger(endpointer, 500, 600 + 300)
+    endpointer.update_speech(500)
+
+    assert list(endpointer.pauses_ms) == [900]
+
+
+def test_adaptive_endpointer_keeps_first_trigger_when_rearmed_in_one_pause(monkeypatch):
+    import src.cache.silence_jitter as silence_jitter
+
+    monkeypatch.setattr(silence_jitter, "write_event", lambda event: None)
+    endpointer = silence_jitter.AdaptiveEndpointer(initial_ms=600, resume_window_ms=1000)
+    endpointer.update_speech(500)
+    endpointer.update_silence(600)
+    endpointer.reset_on_trigger()
+    endpointer.update_silence(600)
+    endpointer.reset_on_trigger()
+    endpointer.update_silence(200)
+    endpointer.update_speech(500)
+
+    assert list(endpointer.pauses_ms) == [1400]
+    assert list(endpointer.turns_ms) == []
+    assert endpointer.turn_speech_ms == 1000
+
+    endpointer.update_silence(600)
+    endpointer.reset_on_trigger()
+    endpointer.update_silence(600)
+    endpointer.reset_on_trigger()
+    endpointer.update_silence(600)
+    endpointer.update_speech(500)
+
+    assert list(endpointer.pauses_ms) == [1400]
+    assert list(endpointer.turns_ms) == [1000]
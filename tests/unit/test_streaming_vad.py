@@ -0,0 +1,132 @@
+from types import SimpleNamespace
+
+import pytest
+
+from src.audio_ring_buffer import AudioRingBuffer
+from src.cache.silence_jitter import SilenceJitter
+from src.cache.vad_smoother import VADSmoother
+from src.interfaces import VADEngine
+from src.sentinel.services import SilenceLoop, SilencePolicy
+from src.sentinel.vad import StreamingVAD, load_vad_engine
+
+
+class _RecordingEngine:
+    """Returns the first sample of each block and counts resets like a stateful engine."""
+
+    def __init__(self):
+        self.blocks = []
+        self.resets = 0
+
+    def score(self, block):
+        self.blocks.append(list(block))
+        return float(block[0])
+
+    def reset(self):
+        self.resets += 1
+
+
+def test_streaming_vad_scores_each_block_once_and_carries_remainder():
+    engine = _RecordingEngine()
+    vad = StreamingVAD(engine, block_size=4, sample_rate=16000)
+
+    assert vad.process([0.1, 0.1, 0.1, 0.1, 0.2, 0.2]) == [0.1]
+    assert vad.pending_samples == 2
+    probs = vad.process([0.2, 0.2, 0.3, 0.3, 0.3, 0.3])
+    assert [round(p, 3) for p in probs] == [0.2, 0.3]
+    assert vad.pending_samples == 0
+    assert [len(block) for block in engine.blocks] == [4, 4, 4]
+    assert vad.blocks_scored == 3
+
+    vad.process([0.5])
+    vad.reset()
+    assert vad.pending_samples == 0
+    assert engine.resets == 1
+
+
+def test_silence_loop_feeds_new_block_probability_to_policy():
+    ring = AudioRingBuffer(max_frames=8, frame_size=4)
+    reader = ring.register_reader("vad")
+    queue = []
+    overruns = []
+    loop = SilenceLoop(
+        reader,
+        StreamingVAD(_RecordingEngine(), block_size=4, sample_rate=16000),
+        SilencePolicy(ring, VADSmoother(window_ms=1), SilenceJitter(min_continuous_ms=0.25, window_ms=0.25)),
+        SimpleNamespace(emit_overrun=lambda *args: overruns.append(args), emit_trigger=lambda *args: None),
+        SimpleNamespace(replay_recorder=None, dead_mic=None),
+        SimpleNamespace(record_vad_inactivity=lambda: None, record_signal_health=lambda health: None),
+        SimpleNamespace(put=queue.append),
+        sample_rate=16000,
+    )
+
+    ring.push([0.9, 0.9, 0.9, 0.9], capture_time=1.0)
+    loop.step(timeout=0)
+    assert queue == []
+    ring.push([0.0, 0.0, 0.0, 0.0], capture_time=1.1)
+    loop.step(timeout=0)
+
+    assert [event["type"] for event in queue] == ["SILENCE_TRIGGER"]
+    assert overruns == []
+
+
+def test_silence_loop_catches_up_on_every_skipped_block_in_order():
+    ring = AudioRingBuffer(max_frames=8, frame_size=4, sample_rate=16000)
+    reader = ring.register_reader("vad")
+    seen = []
+    catch_ups = []
+    policy = SimpleNamespace(handle_prob=lambda prob, ts, frames, sr: seen.append((round(prob, 3), ts, frames)))
+    loop = SilenceLoop(
+        reader,
+        StreamingVAD(_RecordingEngine(), block_size=4, sample_rate=16000),
+        policy,
+        SimpleNamespace(emit_overrun=lambda *args: None, emit_vad_catch_up=catch_ups.append),
+        SimpleNamespace(replay_recorder=None, dead_mic=None),
+        SimpleNamespace(record_vad_inactivity=lambda: None, record_signal_health=lambda health: None),
+        SimpleNamespace(put=lambda event: None),
+        sample_rate=16000,
+    )
+
+    for idx, prob in enumerate([0.9, 0.2, 0.1]):
+        ring.push([prob] * 4, capture_time=1.0 + idx * 4 / 16000)
+    loop.step(timeout=0)
+
+    block_sec = 4 / 16000
+    assert [(prob, frames) for prob, _, frames in seen] == [(0.9, 4), (0.2, 4), (0.1, 4)]
+    for idx, (_, ts, _) in enumerate(seen):
+        assert abs(ts - (1.0 + (idx + 1) * block_sec)) < 1e-9
+    assert loop.vad_frames_skipped == 2
+    assert catch_ups == [3]
+
+
+def test_vad_engine_protocol_and_backend_selection(tmp_path):
+    assert isinstance(_RecordingEngine(), VADEngine)
+    with pytest.raises(ValueError):
+        load_vad_engine("tflite")
+    with pytest.raises(FileNotFoundError):
+        load_vad_engine("onnx", model_path=str(tmp_path / "missing.onnx"))
+
+
+def test_silence_loop_records_every_block_probability_for_replay():
+    ring = AudioRingBuffer(max_frames=8, frame_size=4, sample_rate=16000)
+    reader = ring.register_reader("vad")
+    recorded = []
+    loop = SilenceLoop(
+        reader,
+        StreamingVAD(_RecordingEngine(), block_size=4, sample_rate=16000),
+        SimpleNamespace(handle_prob=lambda *args: None),
+        SimpleNamespace(emit_overrun=lambda *args: None, emit_vad_catch_up=lambda count: None),
+        SimpleNamespace(
+            replay_recorder=SimpleNamespace(add=lambda *args: recorded.append(args)), dead_mic=None
+        ),
+        SimpleNamespace(record_vad_inactivity=lambda: None, record_signal_health=lambda health: None),
+        SimpleNamespace(put=lambda event: None),
+        sample_rate=16000,
+    )
+
+    for idx, prob in enumerate([0.9, 0.2]):
+        ring.push([prob] * 4, capture_time=1.0 + idx * 4 / 16000)
+    loop.step(timeout=0)
+
+    _audio, probs, _health, raw_probs, gated = recorded[0]
+    assert [round(p, 3) for p in probs] == [round(p, 3) for p in raw_probs] == [0.9, 0.2]
+    assert gated == [False, False]
@@ -0,0 +1,109 @@
+import queue
+
+import pytest
+
+from src.contracts import create_silence_abort, create_silence_commit, create_silence_trigger
+from src.worker.services import TriggerScheduler
+
+
+def _queue(*events):
+    pending = queue.Queue()
+    for event in events:
+        pending.put(event)
+    return pending
+
+
+def _drain(scheduler, pending, now):
+    order = []
+    while True:
+        event, _drops = scheduler.next_event(pending, timeout=0.01, now=now)
+        if event is None:
+            return order
+        order.append(event["id"])
+
+
+def test_newest_first_serves_latest_trigger_and_drops_expired():
+    scheduler = TriggerScheduler(policy="newest_first", budget_sec=1.5)
+    pending = _queue(*(create_silence_trigger(f"t{idx}", None, 10.0 + idx * 0.5) for idx in range(4)))
+
+    event, drops = scheduler.next_event(pending, now=11.8)
+    assert event["id"] == "t3"
+    assert drops == [("t0", "expired")]
+    assert _drain(scheduler, pending, now=11.8) == ["t2", "t1"]
+
+
+def test_edf_serves_earliest_deadline_and_caps_pending():
+    scheduler = TriggerScheduler(policy="edf", budget_sec=1.5, max_pending=2)
+    pending = _queue(*(create_silence_trigger(f"t{idx}", None, 10.0 + idx * 0.1) for idx in (2, 0, 1)))
+
+    event, drops = scheduler.next_event(pending, now=10.5)
+    assert event["id"] == "t0"
+    assert drops == [("t2", "overflow")]
+    assert scheduler.dropped == {"overflow": 1}
+
+
+def test_commit_abort_and_supersede_resolve_pending_work():
+    widened = create_silence_trigger("t2", None, 10.3)
+    widened["supersedes"] = "t1"
+    pending = _queue(
+        create_silence_trigger("p1", None, 10.0, event_type="SILENCE_PROVISIONAL"),
+        create_silence_commit("c1", "p1", None, 10.1),
+        create_silence_trigger("t1", None, 10.2),
+        widened,
+        create_silence_abort("a9", "p9", 10.4),
+    )
+    scheduler = TriggerScheduler(policy="edf")
+
+    event, drops = scheduler.next_event(pending, now=10.5)
+    assert event["id"] == "a9"
+    assert sorted(drops) == [("p1", "committed"), ("t1", "superseded")]
+    assert _drain(scheduler, pending, now=10.5) == ["c1", "t2"]
+
+
+def test_aborted_provisional_is_dropped_once_and_its_abort_still_goes_out():
+    pending = _queue(
+        create_silence_trigger("p1", None, 10.0, event_type="SILENCE_PROVISIONAL"),
+        create_silence_abort("a1", "p1", 10.1),
+    )
+    scheduler = TriggerScheduler(policy="edf")
+
+    event, drops = scheduler.next_event(pending, now=10.2)
+    assert event["id"] == "a1"
+    assert drops == [("p1", "aborted")]
+    assert scheduler.dropped == {"aborted": 1}
+
+
+def test_unknown_policy_is_rejected():
+    with pytest.raises(ValueError):
+        TriggerScheduler(policy="fifo")
+
+
+def test_has_newer_trigger_ignores_control_events_and_keeps_them_pending():
+    scheduler = TriggerScheduler(policy="newest_first", budget_sec=1.5)
+    current = create_silence_trigger("t1", None, 10.0)
+    pending = _queue({"type": "MIC_DEAD", "id": "dead", "timestamp": 10.2}, create_silence_trigger("t0", None, 9.9))
+
+    assert not scheduler.has_newer_trigger(pending, current)
+    pending.put(create_silence_commit("c2", "p2", None, 10.3))
+    assert scheduler.has_newer_trigger(pending, current)
+    assert _drain(scheduler, pending, now=10.4) == ["dead", "c2", "t0"]
+
+
+def test_has_abort_for_matches_only_an_abort_of_that_provisional():
+    scheduler = TriggerScheduler(policy="newest_first", budget_sec=1.5)
+    pending = _queue(create_silence_commit("c1", "p1", None, 10.1), create_silence_abort("a0", "p0", 10.2))
+
+    assert not scheduler.has_abort_for(pending, "p1")
+    pending.put(create_silence_abort("a1", "p1", 10.3))
+    assert scheduler.has_abort_for(pending, "p1")
+
+
+def test_edf_runs_a_later_long_clip_before_an_earlier_short_one():
+    short = create_silence_trigger("short", None, 10.0, audio_ref={"length": 16000})
+    long = create_silence_trigger("long", None, 10.2, audio_ref={"length": 8 * 16000})
+
+    no_fit = TriggerScheduler(policy="edf", budget_sec=1.5)
+    assert _drain(no_fit, _queue(short, long), now=10.3) == ["short", "long"]
+
+    edf = TriggerScheduler(policy="edf", budget_sec=1.5, service_time=lambda audio_sec: 0.1 + 0.1 * audio_sec)
+    assert _drain(edf, _queue(short, long), now=10.3) == ["long", "short"]
@@ -0,0 +1,103 @@
+"""Compare Silero VAD backends: load time, per-block latency and process RSS.
+
+Each backend runs in its own child process so import cost and resident memory
+are measured in isolation:
+
+    python tools/benchmark_vad.py --backends onnx torch --blocks 2000
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+
+def _rss_mb() -> float:
+    try:
+        import psutil
+
+        return psutil.Process().memory_info().rss / (1024 * 1024)
+    except ImportError:
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux reports KiB, macOS bytes; this fallback is peak rather than current RSS.
+        return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_backend(backend: str, blocks: int, model_path: str) -> dict:
+    import numpy as np
+
+    from src.sentinel.vad import VAD_BLOCK_SIZE, load_vad_engine
+
+    rss_before = _rss_mb()
+    started = time.perf_counter()
+    engine = load_vad_engine(backend, model_path=model_path)
+    load_ms = (time.perf_counter() - started) * 1000
+
+    rng = np.random.default_rng(0)
+    audio = (rng.standard_normal(VAD_BLOCK_SIZE * blocks) * 0.05).astype(np.float32)
+    for idx in range(20):
+        engine.score(audio[idx * VAD_BLOCK_SIZE : (idx + 1) * VAD_BLOCK_SIZE])
+    engine.reset()
+
+    timings = []
+    for idx in range(blocks):
+        block = audio[idx * VAD_BLOCK_SIZE : (idx + 1) * VAD_BLOCK_SIZE]
+        start = time.perf_counter()
+        engine.score(block)
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    return {
+        "backend": backend,
+        "blocks": blocks,
+        "load_ms": round(load_ms, 1),
+        "block_ms_p50": round(timings[len(timings) // 2], 3),
+        "block_ms_p95": round(timings[int(0.95 * len(timings))], 3),
+        "block_ms_p99": round(timings[int(0.99 * len(timings))], 3),
+        "block_ms_max": round(timings[-1], 3),
+        "rss_before_mb": round(rss_before, 1),
+        "rss_after_mb": round(_rss_mb(), 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--backends", nargs="+", default=["onnx", "torch"])
+    parser.add_argument("--blocks", type=int, default=2000)
+    parser.add_argument("--model-path", default=os.path.join(ROOT, "models", "silero_vad.onnx"))
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_backend(args.child, args.blocks, args.model_path)))
+        return
+
+    for backend in args.backends:
+        proc = subprocess.run(
+            [sys.executable, __file__, "--child", backend, "--blocks", str(args.blocks), "--model-path", args.model_path],
+            capture_output=True,
+            text=True,
+        )
+        if proc.returncode != 0:
+            error = proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else f"exit code {proc.returncode}"
+            print(f"[{backend}] failed: {error}")
+            continue
+        result = json.loads(proc.stdout.strip().splitlines()[-1])
+        print(
+            f"[{backend}] load {result['load_ms']:.0f}ms | "
+            f"block p50 {result['block_ms_p50']:.3f}ms p95 {result['block_ms_p95']:.3f}ms "
+            f"p99 {result['block_ms_p99']:.3f}ms max {result['block_ms_max']:.3f}ms | "
+            f"RSS {result['rss_before_mb']:.0f}MB -> {result['rss_after_mb']:.0f}MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Tune EnergyGate thresholds against ReplayBuffer dumps (``*.npz`` with ``audio``, ``vad_raw`` and ``gated``).
+
+Labels come from the model's own score, not the gated probability the silence
+policy saw: blocks whose ungated VAD probability averages above
+``--speech-prob`` count as speech. Gated blocks are labelled only where the
+VAD audited them, and each audited block is weighted by how many gated blocks
+of its dump it stands for. The suggested thresholds gate at most
+``--max-speech-skip`` of speech blocks:
+
+    python tools/calibrate_energy_gate.py logs/replay --max-speech-skip 0.005
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from src.sentinel.energy_gate import block_features, calibrate  # noqa: E402
+from src.sentinel.vad import VAD_BLOCK_SIZE  # noqa: E402
+
+
+def load_blocks(paths, block_size: int = VAD_BLOCK_SIZE, speech_prob: float = 0.5):
+    """Labelled blocks, their speech labels and weights; dumps without ungated labels are skipped."""
+    audio_blocks, labels, weights = [], [], []
+    for path in paths:
+        dump = np.load(path)
+        if "vad_raw" not in dump:
+            print(f"Skipping {path}: recorded before ungated VAD labels", file=sys.stderr)
+            continue
+        usable = len(dump["audio"]) // block_size * block_size
+        if not usable:
+            continue
+        blocks = dump["audio"][:usable].astype(np.float32).reshape(-1, block_size)
+        raw = dump["vad_raw"][:usable].astype(np.float64).reshape(-1, block_size).mean(axis=1)
+        gated = dump["gated"][:usable].reshape(-1, block_size).any(axis=1)
+        labelled = ~np.isnan(raw)
+        audited = int((gated & labelled).sum())
+        weight = np.ones(len(raw))
+        if audited:
+            weight[gated] = gated.sum() / audited
+        audio_blocks.append(blocks[labelled])
+        labels.append(raw[labelled] > speech_prob)
+        weights.append(weight[labelled])
+    if not audio_blocks:
+        return np.zeros((0, block_size), dtype=np.float32), np.zeros(0, dtype=bool), np.zeros(0)
+    return np.concatenate(audio_blocks), np.concatenate(labels), np.concatenate(weights)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("dumps", nargs="+", help="replay .npz files or directories containing them")
+    parser.add_argument("--max-speech-skip", type=float, default=0.005)
+    parser.add_argument("--speech-prob", type=float, default=0.5)
+    args = parser.parse_args()
+
+    paths = []
+    for entry in map(Path, args.dumps):
+        paths.extend(sorted(entry.glob("*.npz")) if entry.is_dir() else [entry])
+    blocks, speech, weights = load_blocks(paths, speech_prob=args.speech_prob)
+    if not len(blocks):
+        print("No replay audio with ungated VAD labels found")
+        return
+    result = calibrate(block_features(blocks), speech, max_speech_skip=args.max_speech_skip, weights=weights)
+    result.update({"dumps": len(paths), "blocks": int(len(blocks)), "speech_blocks": int(speech.sum())})
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import asyncio
+import sys
 import threading
 import time
 from collections import deque
 
+from src.async_event_bus import AsyncEventBus
 from src.dialogue_brain.brain import DialogueBrain
 from src.event_bus import EventBus
 
@@ -61,5 +64,57 @@ def main() -> None:
     event_bus.shutdown()
 
 
+async def main_async() -> None:
+    """Same demo on AsyncEventBus: every stage is a task on one loop instead of a thread pool."""
+    event_bus = AsyncEventBus(max_queue_size=32)
+    brain = DialogueBrain(debug=True, event_bus=event_bus)  # type: ignore[arg-type]
+    completion = asyncio.Event()
+
+    async def on_silence(_payload):
+        await event_bus.publish_async(
+            "stt_result",
+            {"timestamp": time.time(), "text": MOCK_TEXT, "latency_ms": MOCK_LATENCY_MS},
+        )
+
+    async def on_stt(event):
+        print(f"[MOCK STT]   \"{event.get('text', '')}\"")
+        await event_bus.publish_async(
+            "intent_result",
+            {
+                "timestamp": time.time(),
+                "text": event.get("text", ""),
+                "intent": INTENT_LABEL,
+                "intent_ms": 10.0,
+                "latency_ms": event.get("latency_ms", 0.0),
+            },
+        )
+
+    def on_intent(event):
+        result = brain.process(text=event.get("text", ""), intent=event.get("intent", ""))
+        total_latency = event.get("latency_ms", 0.0) + event.get("intent_ms", 0.0) + result.get("latency_ms", 0.0)
+        print(f"[INTENT]     {event.get('intent', '')} (0.41)")
+        print(f"[STATE]      {result.get('state')}")
+        print(f"[SUGGEST]    \"{result.get('suggestion')}\"")
+        print(f"[LATENCY]    {total_latency:.0f}ms")
+        completion.set()
+
+    event_bus.subscribe("silence_gap", on_silence)
+    event_bus.subscribe("stt_result", on_stt)
+    event_bus.subscribe("intent_result", on_intent)
+
+    for idx in range(10):
+        completion.clear()
+        await event_bus.publish_async("silence_gap", {"buffer": b"FAKE_AUDIO", "idx": idx})
+        try:
+            await asyncio.wait_for(completion.wait(), timeout=1)
+        except asyncio.TimeoutError:
+            pass
+
+    event_bus.shutdown()
+
+
 if __name__ == "__main__":
-    main()
+    if "--async" in sys.argv[1:]:
+        asyncio.run(main_async())
+    else:
+        main()
@@ -0,0 +1,143 @@
+"""Check short-form Whisper against the padded 30 s path on ReplayBuffer dumps.
+
+Speech clips are cut from each dump with the sentinel's segment rules and
+transcribed twice, once padded to 30 s and once bounded to the clip's
+short-form bucket. Per bucket it reports word error rate against the padded
+transcript, exact matches, and encoder time for both window lengths, or
+``"unsupported"`` when the installed faster-whisper or model rejects that
+window:
+
+    python tools/verify_short_form_whisper.py logs/replay --model tiny.en
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from src.sentinel.services import speech_segments  # noqa: E402
+from src.sentinel.vad import VAD_BLOCK_SIZE  # noqa: E402
+from src.worker.services import (  # noqa: E402
+    SHORT_FORM_BUCKETS_S,
+    WHISPER_SAMPLE_RATE,
+    is_short_form_rejection,
+    short_form_bucket,
+)
+
+FRAMES_PER_SEC = 100
+
+
+def load_clips(paths, speech_prob: float = 0.5, max_sec: float = 30.0):
+    block_sec = VAD_BLOCK_SIZE / WHISPER_SAMPLE_RATE
+    for path in paths:
+        dump = np.load(path)
+        audio = dump["audio"].astype(np.float32)
+        usable = len(audio) // VAD_BLOCK_SIZE * VAD_BLOCK_SIZE
+        probs = dump["vad"][:usable].reshape(-1, VAD_BLOCK_SIZE).mean(axis=1)
+        for start, end in speech_segments(list(probs), block_sec, 0.0, usable / WHISPER_SAMPLE_RATE, threshold=speech_prob):
+            clip = audio[int(start * WHISPER_SAMPLE_RATE) : int(min(end, start + max_sec) * WHISPER_SAMPLE_RATE)]
+            if len(clip):
+                yield clip
+
+
+def transcribe(model, audio, chunk_length=None) -> str:
+    options = {"beam_size": 1, "language": "en", "temperature": 0.0}
+    if chunk_length is not None:
+        options["chunk_length"] = chunk_length
+    segments, _info = model.transcribe(audio, **options)
+    return " ".join(segment.text for segment in segments).strip()
+
+
+def encoder_ms(model, audio, bucket: int, repeats: int) -> float:
+    frames = bucket * FRAMES_PER_SEC
+    features = model.feature_extractor(audio, chunk_length=bucket)[:, :frames]
+    if features.shape[1] < frames:
+        features = np.pad(features, ((0, 0), (0, frames - features.shape[1])))
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        model.encode(features)
+        timings.append((time.perf_counter() - start) * 1000)
+    return float(np.median(timings))
+
+
+def word_errors(reference: str, hypothesis: str):
+    ref, hyp = reference.lower().split(), hypothesis.lower().split()
+    row = list(range(len(hyp) + 1))
+    for i, ref_word in enumerate(ref, 1):
+        previous, row[0] = row[0], i
+        for j, hyp_word in enumerate(hyp, 1):
+            previous, row[j] = row[j], min(row[j] + 1, row[j - 1] + 1, previous + (ref_word != hyp_word))
+    return row[-1], len(ref)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("dumps", nargs="+", help="replay .npz files or directories containing them")
+    parser.add_argument("--model", default="tiny.en")
+    parser.add_argument("--speech-prob", type=float, default=0.5)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    from faster_whisper import WhisperModel
+
+    model = WhisperModel(args.model, device="cpu", compute_type="int8")
+    paths = []
+    for entry in map(Path, args.dumps):
+        paths.extend(sorted(entry.glob("*.npz")) if entry.is_dir() else [entry])
+
+    report = {}
+    unsupported = {}
+    for clip in load_clips(paths, speech_prob=args.speech_prob):
+        bucket = short_form_bucket(len(clip), SHORT_FORM_BUCKETS_S)
+        if bucket in unsupported:
+            continue
+        stats = report.setdefault(
+            bucket, {"clips": 0, "errors": 0, "words": 0, "exact": 0, "encoder_ms": [], "padded_encoder_ms": []}
+        )
+        padded = transcribe(model, clip)
+        try:
+            short = transcribe(model, clip, chunk_length=bucket)
+            short_encoder_ms = encoder_ms(model, clip, bucket, args.repeats)
+        except (TypeError, ValueError) as exc:
+            if not is_short_form_rejection(exc):
+                raise
+            unsupported[bucket] = repr(exc)
+            report.pop(bucket)
+            continue
+        errors, words = word_errors(padded, short)
+        stats["clips"] += 1
+        stats["errors"] += errors
+        stats["words"] += words
+        stats["exact"] += int(padded.lower() == short.lower())
+        stats["encoder_ms"].append(short_encoder_ms)
+        stats["padded_encoder_ms"].append(encoder_ms(model, clip, 30, args.repeats))
+
+    if not report and not unsupported:
+        print("No speech clips found")
+        return
+    summary = {
+        f"{bucket}s": {
+            "clips": stats["clips"],
+            "wer_vs_padded": stats["errors"] / max(stats["words"], 1),
+            "exact_match": stats["exact"] / stats["clips"],
+            "encoder_ms_p50": float(np.median(stats["encoder_ms"])),
+            "padded_encoder_ms_p50": float(np.median(stats["padded_encoder_ms"])),
+        }
+        for bucket, stats in sorted(report.items())
+    }
+    summary.update({f"{bucket}s": {"status": "unsupported", "error": error} for bucket, error in unsupported.items()})
+    print(json.dumps(summary, indent=2))
+
+
+if __name__ == "__main__":
+    main()